@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""Catch 스크래퍼 오프라인 벤치마크
+
+실제 catch.co.kr 대신 로컬 HTTP 서버가 로그인 페이지, 기업 검색/상세 페이지,
+채용 공고 목록(NCS/RecruitSearch)을 흉내 내고, 그 위에서 스크래핑 함수와
+Flask 엔드포인트의 지연 시간(p50/p95)과 처리량을 동시성별로 측정한다.
+
+사용 예:
+    python3 benchmark.py --latency-ms 50 --concurrency 1,4,8 --output bench-results.json
+    python3 benchmark.py --fixtures ./recorded --compare bench-results.json
+"""
+import argparse
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 벤치마크용 합성 데이터
+COMPANIES = [
+    ('1001', '카카오', '포털·플랫폼'),
+    ('1002', '네이버', '포털·플랫폼'),
+    ('1003', '삼성전자', '전기·전자'),
+    ('1004', '넥슨코리아', '게임'),
+    ('1005', '신한은행', '은행·금융'),
+    ('1006', '카카오뱅크', '은행·금융'),
+    ('1007', '엔씨소프트', '게임'),
+    ('1008', 'LG전자', '전기·전자')
+]
+JOB_CATEGORIES = {'it': 'IT개발', 'bigdata': '빅데이터·AI'}
+JOBS_PER_PAGE = 20
+JOB_PAGES = 5
+REVIEWS_PER_PAGE = 10
+REVIEW_PAGES = 10
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{title}</title></head>
+<body>{body}</body></html>"""
+
+
+def _home_page(logged_in=False):
+    account = '<a href="/Member/Logout">로그아웃</a>' if logged_in else '<a href="/Member/Login">로그인</a>'
+    return PAGE_TEMPLATE.format(title='CATCH', body=f"""
+{account}
+<a href="/NCS/RecruitSearch">채용</a>""")
+
+
+def _login_page():
+    return PAGE_TEMPLATE.format(title='로그인', body="""
+<form method="post" action="/Member/LoginProc">
+  <input id="id_login" name="id"><input id="pw_login" name="pw" type="password">
+  <button type="submit">로그인</button>
+</form>""")
+
+
+def _search_page(keyword):
+    # 검색어가 있으면 결과를 서버에서 렌더링 (HTTP 빠른 경로와 브라우저 경로 모두 사용 가능)
+    results = ''
+    if keyword:
+        items = ''.join(
+            f'<li><p class="name"><a href="/Comp/CompSummary/{company_id}">{name}</a></p></li>'
+            for company_id, name, _ in COMPANIES
+            if keyword.replace('(주)', '').strip() in name
+        )
+        results = f'<ul class="list_corp_round">{items}</ul>'
+    return PAGE_TEMPLATE.format(title='기업 검색', body=f"""
+<form method="get" action="/Comp/CompMajor/SearchPage">
+  <input name="keyword" placeholder="궁금한 기업을 검색해 보세요." value="{keyword}">
+  <button type="submit" class="bt_sch">검색</button>
+</form>{results}""")
+
+
+def _company_page(company_id):
+    for cid, name, industry in COMPANIES:
+        if cid == company_id:
+            return PAGE_TEMPLATE.format(title=name, body=f"""
+<div class="name"><h2>{name}</h2></div>
+<div class="info"><span>{industry}</span><span>서울특별시</span></div>""")
+    return None
+
+
+def _review_page(company_id, page):
+    rows = ''
+    for index in range(REVIEWS_PER_PAGE):
+        number = REVIEW_PAGES * REVIEWS_PER_PAGE - ((page - 1) * REVIEWS_PER_PAGE + index)
+        rows += f"""<li data-review-id="{company_id}{number:05d}">
+  <span class="status">현직원</span><p class="info"><span>정규직</span><span>경력입사</span></p>
+  <span class="score">{3 + number % 3}.0</span>
+  <dl class="good"><dt>장점</dt><dd>장점 {number}</dd></dl><dl class="bad"><dt>단점</dt><dd>단점 {number}</dd></dl>
+  <span class="date">2024.{1 + number // 28 % 12:02d}.{1 + number % 28:02d}</span>
+  <button class="like"><span>{number}</span></button>
+</li>"""
+    pages = '<a class="ico next" href="?page={0}">다음</a>'.format(page + 1) if page < REVIEW_PAGES else ''
+    return PAGE_TEMPLATE.format(title='기업 리뷰', body=f"""
+<ul class="list_review">{rows}</ul>
+<p class="page3">{pages}</p>""")
+
+
+def _job_detail_page(job_id):
+    company = COMPANIES[int(job_id) % len(COMPANIES)][1]
+    return PAGE_TEMPLATE.format(title=f'공고 {job_id}', body=f"""
+<div class="recruit_view">
+  <h2 class="subj">백엔드 개발자 채용 {job_id}</h2><p class="name">{company}</p>
+  <dl><dt>고용형태</dt><dd>정규직</dd><dt>근무지역</dt><dd>서울특별시 강남구</dd>
+  <dt>경력</dt><dd>경력 {int(job_id) % 7}년 이상</dd><dt>학력</dt><dd>대학교 졸업</dd>
+  <dt>급여</dt><dd>회사 내규에 따름</dd><dt>마감일</dt><dd>D-{int(job_id) % 30}</dd></dl>
+  <a href="/NCS/Apply/{job_id}">지원하기</a>
+</div>
+<div class="recruit_detail">
+  <h3>담당업무</h3><div>Java/Spring 기반 서버 개발</div>
+  <h3>자격요건</h3><div>Java, Spring Boot 경험</div>
+  <h3>우대사항</h3><div>AWS, Kubernetes 경험</div>
+  <h3>복리후생</h3><div>4대보험, 교육비 지원</div>
+</div>""")
+
+
+def _recruit_page(category, page):
+    buttons = ''.join(
+        f'<button class="bt" onclick="location.href=\'/NCS/RecruitSearch?category={key}\'"><span>{label}</span></button>'
+        for key, label in JOB_CATEGORIES.items()
+    )
+    rows = ''
+    if category:
+        for index in range(JOBS_PER_PAGE):
+            # 일부 공고는 두 카테고리에 모두 등장 (카테고리 간 중복 제거 측정용)
+            job_number = (page - 1) * JOBS_PER_PAGE + index
+            job_id = 500000 + job_number if index % 4 == 0 else (600000 if category == 'it' else 700000) + job_number
+            company = COMPANIES[job_number % len(COMPANIES)][1]
+            rows += f"""<tr>
+  <td><p class="subj2"><a href="/NCS/RecruitInfoDetails/{job_id}">{JOB_CATEGORIES[category]} 개발자 {job_number}</a></p><p class="name2">{company}</p></td>
+  <td><span>경력 {job_number % 7}년↑</span><span>정규직</span></td>
+  <td><span>{JOB_CATEGORIES[category]}</span></td>
+  <td><span>D-{job_number % 30}</span></td>
+</tr>"""
+    pages = ''
+    if category:
+        for number in range(1, JOB_PAGES + 1):
+            selected = ' selected' if number == page else ''
+            pages += f'<a class="num{selected}" href="/NCS/RecruitSearch?category={category}&page={number}">{number}</a>'
+        if page < JOB_PAGES:
+            pages += f'<a class="ico next" href="/NCS/RecruitSearch?category={category}&page={page + 1}">다음</a>'
+    return PAGE_TEMPLATE.format(title=f'채용 {category} {page}', body=f"""
+<button class="bt">직무</button>{buttons}
+<table><tbody>{rows}</tbody></table>
+<p class="page3">{pages}</p>""")
+
+
+def make_handler(latency, fixtures_dir=None):
+    """지연 시간과 녹화된 픽스처 디렉터리를 반영하는 요청 처리기"""
+
+    class CatchStandInHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_job_detail(self, job_id):
+            """공고 상세는 ETag/Last-Modified를 붙이고 조건부 요청에 304로 응답"""
+            etag = f'"job-{job_id}"'
+            if self.headers.get('If-None-Match') == etag:
+                return self._send(304, '', {'ETag': etag})
+            return self._send(200, _job_detail_page(job_id), {'ETag': etag, 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'})
+
+        def _send(self, status, body='', headers=None):
+            data = body.encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _recorded(self, path):
+            """녹화된 픽스처가 있으면 그 HTML 반환 (경로/index.html 또는 경로.html)"""
+            if not fixtures_dir:
+                return None
+            relative = path.strip('/') or 'index'
+            for candidate in (os.path.join(fixtures_dir, relative, 'index.html'), os.path.join(fixtures_dir, f'{relative}.html')):
+                if os.path.isfile(candidate):
+                    with open(candidate, encoding='utf-8') as f:
+                        return f.read()
+            return None
+
+        def do_GET(self):
+            time.sleep(latency)
+            url = urllib.parse.urlparse(self.path)
+            query = urllib.parse.parse_qs(url.query)
+
+            recorded = self._recorded(url.path)
+            if recorded is not None:
+                return self._send(200, recorded)
+
+            if url.path == '/':
+                return self._send(200, _home_page('CATCH_SESSION=' in self.headers.get('Cookie', '')))
+            if url.path == '/Member/Login':
+                return self._send(200, _login_page())
+            if url.path == '/Comp/CompMajor/SearchPage':
+                return self._send(200, _search_page(query.get('keyword', [''])[0]))
+            if url.path.startswith('/Comp/CompSummary/'):
+                page = _company_page(url.path.rsplit('/', 1)[1])
+                return self._send(200, page) if page else self._send(404, 'not found')
+            if url.path.startswith('/NCS/RecruitInfoDetails/'):
+                return self._send_job_detail(url.path.rsplit('/', 1)[1])
+            if url.path.startswith('/Comp/CompReview/'):
+                return self._send(200, _review_page(url.path.rsplit('/', 1)[1], int(query.get('page', ['1'])[0])))
+            if url.path == '/NCS/RecruitSearch':
+                return self._send(200, _recruit_page(query.get('category', [''])[0], int(query.get('page', ['1'])[0])))
+            return self._send(404, 'not found')
+
+        def do_POST(self):
+            time.sleep(latency)
+            self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            if self.path == '/Member/LoginProc':
+                return self._send(302, '', {'Location': '/', 'Set-Cookie': 'CATCH_SESSION=bench; Path=/'})
+            return self._send(404, 'not found')
+
+    return CatchStandInHandler
+
+
+def start_server(handler, port=0):
+    """백그라운드 스레드에서 HTTP 서버 시작"""
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def percentile(values, ratio):
+    """정렬된 값 목록의 백분위수 (최근접 순위)"""
+    if not values:
+        return None
+    index = max(0, min(len(values) - 1, int(round(ratio * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+def measure(func, iterations, concurrency, prepare=None):
+    """func(i)를 주어진 동시성으로 실행해서 지연 시간 분포와 처리량 측정
+
+    prepare(i)는 호출마다 func(i) 직전에 실행하고 지연 시간에는 넣지 않음 (캐시 비우기 등)
+    """
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def run(index):
+        if prepare:
+            prepare(index)
+        started = time.perf_counter()
+        try:
+            func(index)
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+        except Exception as e:
+            with lock:
+                errors.append(str(e))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(run, range(iterations)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "iterations": iterations,
+        "errors": len(errors),
+        "error_samples": errors[:3],
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 2) if latencies else None,
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2) if latencies else None,
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else None,
+        "throughput_rps": round(len(latencies) / wall, 2) if wall else None
+    }
+
+
+def _post_json(url, payload, timeout=200):
+    request = urllib.request.Request(url, data=json.dumps(payload).encode('utf-8'), headers={'Content-Type': 'application/json'}, method='POST')
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())
+
+
+def _get(url, timeout=200):
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return response.read()
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)), text=True).strip()
+    except Exception:
+        return None
+
+
+def run_benchmarks(args):
+    """스크래핑 함수/크롤러/Flask 엔드포인트 시나리오 실행"""
+    fixture_server = start_server(make_handler(args.latency_ms / 1000, args.fixtures))
+    base_url = f"http://127.0.0.1:{fixture_server.server_address[1]}/"
+
+    # catch_scraper는 import 시점에 설정을 읽으므로 그 전에 대체 사이트와 임시 저장 경로 지정
+    work_dir = tempfile.mkdtemp(prefix='catch-bench-')
+    os.environ['CATCH_BASE_URL'] = base_url
+    os.environ['CATCH_COMPANY_INDEX_PATH'] = os.path.join(work_dir, 'company_index.json')
+    os.environ['CATCH_REVIEW_STORE_PATH'] = os.path.join(work_dir, 'reviews.sqlite3')
+    os.environ['CATCH_LOGIN_COOKIE_PATH'] = os.path.join(work_dir, 'login_cookies.json')
+    os.environ['CATCH_JOB_INDEX_PATH'] = os.path.join(work_dir, 'jobs.sqlite3')
+    os.environ.setdefault('CATCH_DRIVER_POOL_SIZE', str(max(args.concurrency)))
+    os.environ.setdefault('CATCH_NAVIGATION_STATS', '0')
+    # 대체 사이트는 요청 제한이 없으므로 속도 조절기가 측정값에 끼어들지 않게 한도를 크게
+    os.environ.setdefault('CATCH_GOVERNOR_RATE', '1000')
+    os.environ.setdefault('CATCH_GOVERNOR_MAX_RATE', '1000')
+    os.environ.setdefault('CATCH_GOVERNOR_BURST', '1000')
+    os.environ.setdefault('CATCH_GOVERNOR_MAX_CONCURRENCY', '64')
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import catch_scraper
+
+    names = [name for _, name, _ in COMPANIES]
+    scenarios = {}
+
+    def company_lookup(index):
+        result = catch_scraper._scrape_company_info(names[index % len(names)])
+        if result.get("is_sample"):
+            raise RuntimeError(result.get("message"))
+
+    def run_scenario(name, func, setup=None, prepare=None):
+        """setup()은 동시성 단계마다 한 번, prepare(i)는 측정 호출마다 (cold/full 시나리오가 매번 캐시를 놓치도록)"""
+        if args.only and name not in args.only:
+            return
+        print(f"▶ {name}")
+        scenarios[name] = []
+        for concurrency in args.concurrency:
+            if setup:
+                setup()
+            result = measure(func, args.iterations, concurrency, prepare)
+            scenarios[name].append(result)
+            print(f"   동시성 {concurrency:>3}: p50 {result['p50_ms']}ms, p95 {result['p95_ms']}ms, "
+                  f"{result['throughput_rps']} req/s, 오류 {result['errors']}")
+
+    # 기업 조회: 색인이 없는 상태(검색 페이지 + 상세 페이지)와 색인이 채워진 상태(상세 페이지만)
+    # (cold는 호출마다 그 기업만 색인에서 지워서 동시에 도는 다른 기업 조회에는 영향 없음)
+    run_scenario('search_company_info_cold', company_lookup, prepare=lambda index: catch_scraper.company_index.forget(names[index % len(names)]))
+    run_scenario('search_company_info_indexed', company_lookup, setup=lambda: [company_lookup(index) for index in range(len(names))])
+
+    # 리뷰 수집: 처음에는 전체 페이지, 이후에는 워터마크에서 바로 멈추는 증분 수집
+    def crawl_reviews(index):
+        result = catch_scraper.refresh_company_reviews(names[index % len(names)])
+        if not result["success"]:
+            raise RuntimeError(result["message"])
+
+    run_scenario('company_reviews_full', crawl_reviews, prepare=lambda index: catch_scraper.review_store.clear())
+    run_scenario('company_reviews_incremental', crawl_reviews, setup=lambda: [crawl_reviews(index) for index in range(len(names))])
+
+    # 채용 공고 크롤링 (Chrome이 필요하므로 없으면 오류로 기록)
+    def crawl_jobs(index):
+        total = 0
+        for event in catch_scraper.iter_homepage_jobs(args.crawl_pages):
+            if event["type"] == "error":
+                raise RuntimeError(event["message"])
+            total += len(event["jobs"])
+        if not total:
+            raise RuntimeError("수집된 공고가 없습니다.")
+
+    if not args.skip_browser:
+        run_scenario('crawl_homepage_jobs', crawl_jobs)
+
+    # Flask 엔드포인트 (실제 HTTP 서버로 띄워서 측정)
+    from werkzeug.serving import make_server
+    app_server = make_server('127.0.0.1', 0, catch_scraper.app, threaded=True)
+    threading.Thread(target=app_server.serve_forever, daemon=True).start()
+    app_url = f"http://127.0.0.1:{app_server.server_port}"
+
+    run_scenario('endpoint_health', lambda index: _get(f"{app_url}/health"))
+    run_scenario('endpoint_job_tips', lambda index: _post_json(f"{app_url}/api/job-tips", {"company_name": names[index % len(names)]}))
+    run_scenario(
+        'endpoint_search_company_info',
+        lambda index: _post_json(f"{app_url}/api/search-company-info", {"company_name": names[index % len(names)]}),
+        prepare=lambda index: catch_scraper.company_cache.clear()
+    )
+    # 공고 상세 일괄 조회: 호출마다 처음 보는 공고 50개를 요청해서 캐시 없이 JOB_DETAIL_BATCH_WORKERS 병렬 조회를 측정
+    job_batches = itertools.count()
+
+    def job_detail_batch(index):
+        first = 500000 + next(job_batches) * 50
+        response = _post_json(f"{app_url}/api/job-detail/batch", {"job_urls": [f"{base_url}NCS/RecruitInfoDetails/{number}" for number in range(first, first + 50)]})
+        failed = [result for result in response.get("results", []) if not result.get("success")]
+        if not response.get("success") or failed:
+            raise RuntimeError(response.get("message"))
+
+    run_scenario('endpoint_job_detail_batch_cold', job_detail_batch)
+    # 공고 검색: 목록 행 형태의 공고를 색인에 채운 뒤 검색어 + 필터 + 패싯 조회
+    def fill_job_index():
+        regions = ['서울 강남구', '경기 성남시', '부산 해운대구', '대전 유성구']
+        catch_scraper.job_index.replace([
+            {
+                "job_id": f"catch_{700000 + number}",
+                "title": f"{['백엔드', '프론트엔드', '데이터', 'AI'][number % 4]} 개발자 {number}",
+                "company": COMPANIES[number % len(COMPANIES)][1],
+                "url": f"{base_url}NCS/RecruitInfoDetails/{700000 + number}",
+                "conditions": [f"경력 {number % 7}년↑" if number % 3 else "신입", "정규직"],
+                "job_info": [regions[number % len(regions)]],
+                "registration_info": [f"D-{number % 30}"],
+                "category": "it_jobs",
+                "categories": ["it_jobs"]
+            }
+            for number in range(5000)
+        ])
+
+    searches = [
+        {"q": "백엔드", "career": "신입", "facets": "1"},
+        {"q": "데이터", "region": "서울", "sort": "recent"},
+        {"region": "경기", "limit": "200"}
+    ]
+    run_scenario(
+        'endpoint_job_search',
+        lambda index: _get(f"{app_url}/api/jobs?{urllib.parse.urlencode(searches[index % len(searches)])}"),
+        setup=fill_job_index
+    )
+    run_scenario(
+        'endpoint_search_company_info_batch',
+        lambda index: _post_json(f"{app_url}/api/search-company-info/batch", {"company_names": names}),
+        prepare=lambda index: catch_scraper.company_cache.clear()
+    )
+
+    app_server.shutdown()
+    fixture_server.shutdown()
+    catch_scraper.driver_pool.close_all()
+
+    return {
+        "commit": _git_commit(),
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "latency_ms": args.latency_ms,
+            "iterations": args.iterations,
+            "concurrency": args.concurrency,
+            "crawl_pages": args.crawl_pages,
+            "fixtures": args.fixtures,
+            "http_fast_path": catch_scraper.http_scraper.enabled,
+            "driver_pool_size": catch_scraper.driver_pool.size
+        },
+        "scenarios": scenarios
+    }
+
+
+def compare(previous, current):
+    """이전 결과 파일과 p50/p95/처리량 비교 출력"""
+    print(f"\n📊 비교: {previous.get('commit')} -> {current.get('commit')}")
+    for name, runs in current["scenarios"].items():
+        before = {run["concurrency"]: run for run in previous.get("scenarios", {}).get(name, [])}
+        for run in runs:
+            old = before.get(run["concurrency"])
+            if not old or not old["p50_ms"] or not run["p50_ms"]:
+                continue
+            print(f"   {name} (동시성 {run['concurrency']}): "
+                  f"p50 {old['p50_ms']} -> {run['p50_ms']}ms ({run['p50_ms'] / old['p50_ms']:.2f}x), "
+                  f"p95 {old['p95_ms']} -> {run['p95_ms']}ms, "
+                  f"처리량 {old['throughput_rps']} -> {run['throughput_rps']} req/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Catch 스크래퍼 오프라인 벤치마크')
+    parser.add_argument('--latency-ms', type=float, default=50, help='대체 사이트 응답마다 추가할 지연 시간(ms)')
+    parser.add_argument('--concurrency', type=lambda value: [int(v) for v in value.split(',')], default=[1, 4, 8], help='측정할 동시성 목록 (쉼표 구분)')
+    parser.add_argument('--iterations', type=int, default=32, help='시나리오/동시성마다 실행할 요청 수')
+    parser.add_argument('--crawl-pages', type=int, default=3, help='크롤링 시나리오에서 카테고리별 페이지 수')
+    parser.add_argument('--fixtures', help='녹화된 HTML 픽스처 디렉터리 (경로.html 또는 경로/index.html)')
+    parser.add_argument('--only', type=lambda value: value.split(','), help='실행할 시나리오 이름 (쉼표 구분)')
+    parser.add_argument('--skip-browser', action='store_true', help='Chrome이 필요한 시나리오 건너뛰기')
+    parser.add_argument('--output', default='bench-results.json', help='결과 JSON 파일 경로')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON 파일')
+    args = parser.parse_args()
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = json.load(f)
+
+    results = run_benchmarks(args)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장: {args.output}")
+
+    if previous:
+        compare(previous, results)
+
+
+if __name__ == '__main__':
+    main()
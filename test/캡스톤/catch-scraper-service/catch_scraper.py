@@ -1,18 +1,256 @@
+import base64
+import gzip
+import hashlib
+import ipaddress
+import json
+import os
+import queue
+import random
+import re
+import signal
+import socket
+import sqlite3
+import threading
+import time
+import urllib.request
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from contextlib import closing, contextmanager
+from urllib.parse import urlencode, urljoin, urlparse
+
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.keys import Keys
-from flask import Flask, request, jsonify
+from selenium.common.exceptions import TimeoutException
+from flask import Flask, Response, g, request, jsonify, stream_with_context
 from flask_cors import CORS
 
-BASE_URL = 'https://www.catch.co.kr/'
+# HTTP 빠른 경로용 (설치되어 있지 않으면 브라우저 경로만 사용)
+try:
+    import requests
+    from lxml import html as lxml_html
+except ImportError:
+    requests = None
+    lxml_html = None
+
+# 응답 압축용 (설치되어 있지 않으면 gzip만 사용)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 벤치마크 등에서 로컬 대체 사이트를 가리킬 수 있도록 환경 변수로 변경 가능
+BASE_URL = os.environ.get('CATCH_BASE_URL', 'https://www.catch.co.kr/')
+COMPANY_SEARCH_URL = urljoin(BASE_URL, 'Comp/CompMajor/SearchPage')
+RECRUIT_SEARCH_URL = urljoin(BASE_URL, 'NCS/RecruitSearch')
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# 드라이버 풀 설정 (동시에 띄울 Chrome 세션 수, 대여 대기 시간, 최대 대기 요청 수)
+DRIVER_POOL_SIZE = int(os.environ.get('CATCH_DRIVER_POOL_SIZE', '2'))
+DRIVER_ACQUIRE_TIMEOUT = float(os.environ.get('CATCH_DRIVER_ACQUIRE_TIMEOUT', '30'))
+DRIVER_MAX_WAITERS = int(os.environ.get('CATCH_DRIVER_MAX_WAITERS', '8'))
+
+# 드라이버 감시 설정 (점검 주기(초, 0이면 비활성화), 교체 기준 이동 횟수/메모리(MB, 0이면 미사용), 미리 로그인해 둘 예비 세션 수)
+DRIVER_WATCHDOG_INTERVAL = float(os.environ.get('CATCH_DRIVER_WATCHDOG_INTERVAL', '30'))
+DRIVER_MAX_NAVIGATIONS = int(os.environ.get('CATCH_DRIVER_MAX_NAVIGATIONS', '300'))
+DRIVER_MAX_RSS_MB = int(os.environ.get('CATCH_DRIVER_MAX_RSS_MB', '1500'))
+DRIVER_WARM_SPARES = int(os.environ.get('CATCH_DRIVER_WARM_SPARES', '1'))
+# 고아 프로세스 판별용 소유 표시 (chromedriver 환경 변수로 넘겨 Chrome까지 상속, 기본값은 배포 경로별로 다름)
+DRIVER_OWNER_ENV = 'CATCH_SCRAPER_DRIVER_OWNER'
+DRIVER_OWNER_MARKER = os.environ.get(
+    'CATCH_DRIVER_OWNER_MARKER',
+    hashlib.sha1(os.path.dirname(os.path.abspath(__file__)).encode('utf-8')).hexdigest()[:12]
+)
+
+# 로그인 계정 및 로그인 실패 후 재시도 간격(초)
+CATCH_USERNAME = os.environ.get('CATCH_USERNAME', 'test0137')
+CATCH_PASSWORD = os.environ.get('CATCH_PASSWORD', '#test0808')
+LOGIN_RETRY_INTERVAL = float(os.environ.get('CATCH_LOGIN_RETRY_INTERVAL', '60'))
+
+# 로그인 쿠키 저장 경로와 최대 보관 시간(초) - 재시작 후에도 로그인 폼 없이 쿠키로 세션 복원
+LOGIN_COOKIE_PATH = os.environ.get('CATCH_LOGIN_COOKIE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'login_cookies.json'))
+LOGIN_COOKIE_MAX_AGE = float(os.environ.get('CATCH_LOGIN_COOKIE_MAX_AGE', '43200'))
+
+# 요청 단위 총 대기 시간 예산(초)
+SCRAPE_WAIT_BUDGET = float(os.environ.get('CATCH_SCRAPE_WAIT_BUDGET', '20'))
+LOGIN_WAIT_BUDGET = float(os.environ.get('CATCH_LOGIN_WAIT_BUDGET', '25'))
+LOGIN_RESTORE_WAIT_BUDGET = float(os.environ.get('CATCH_LOGIN_RESTORE_WAIT_BUDGET', '5'))
+
+# 기업명 -> 상세 페이지 URL 로컬 색인 (저장 경로, 변경 후 파일에 모아서 저장하기까지 기다릴 시간(초))
+COMPANY_INDEX_PATH = os.environ.get('CATCH_COMPANY_INDEX_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'company_index.json'))
+COMPANY_INDEX_SAVE_DELAY = float(os.environ.get('CATCH_COMPANY_INDEX_SAVE_DELAY', '5'))
+
+# 기업 리뷰 저장소 경로, 리뷰 목록 경로({company_id}에 기업 ID 치환), 한 번의 수집에서 읽을 최대 페이지 수
+REVIEW_STORE_PATH = os.environ.get('CATCH_REVIEW_STORE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'reviews.sqlite3'))
+COMPANY_REVIEW_PATH = os.environ.get('CATCH_COMPANY_REVIEW_PATH', 'Comp/CompReview/{company_id}')
+REVIEW_CRAWL_MAX_PAGES = int(os.environ.get('CATCH_REVIEW_CRAWL_MAX_PAGES', '50'))
+# 기업 상세 정보에 넣을 최근 리뷰 수, 리뷰 조회 API의 한 페이지 최대 크기
+COMPANY_DETAIL_REVIEW_COUNT = int(os.environ.get('CATCH_COMPANY_DETAIL_REVIEW_COUNT', '5'))
+REVIEW_PAGE_MAX_LIMIT = 100
+
+# 페이지 기록 설정 ('record'이면 추출한 페이지의 최종 HTML을 압축 보관, 'off'이면 기록하지 않음)
+# 보관 경로, 세그먼트 파일 최대 크기(MB), 기록할 페이지 종류(쉼표 구분, 비우면 전체)
+PAGE_ARCHIVE_MODE = os.environ.get('CATCH_PAGE_ARCHIVE', 'off')
+PAGE_ARCHIVE_DIR = os.environ.get('CATCH_PAGE_ARCHIVE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'page_archive'))
+PAGE_ARCHIVE_SEGMENT_MB = float(os.environ.get('CATCH_PAGE_ARCHIVE_SEGMENT_MB', '64'))
+PAGE_ARCHIVE_PAGE_TYPES = [name.strip() for name in os.environ.get('CATCH_PAGE_ARCHIVE_PAGE_TYPES', '').split(',') if name.strip()]
+
+# 페이지 로드 프로필 ('lean'이면 추적/폰트/외부 CSS/미디어 요청 차단 + eager 로드, 'normal'이면 기본 동작)
+PAGE_LOAD_PROFILE = os.environ.get('CATCH_PAGE_LOAD_PROFILE', 'lean')
+NAVIGATION_STATS = os.environ.get('CATCH_NAVIGATION_STATS', '1') == '1'
+
+# lean 프로필에서 DevTools로 차단할 URL 패턴 (CATCH_LEAN_EXTRA_BLOCKED_URLS로 쉼표 구분 추가 가능)
+# 사이트 자체 CSS는 차단하지 않음: 로그인 폼/검색 결과/페이지 버튼의 visibility·clickable 대기와
+# 카테고리 메뉴 클릭이 CSS의 display/레이아웃에 의존해서, 없으면 숨은 요소가 보이는 것으로 판정되거나 클릭이 빗나감
+LEAN_BLOCKED_URL_PATTERNS = [
+    # 분석/광고 추적
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*googlesyndication.com*', '*facebook.net*', '*facebook.com/tr*',
+    '*criteo.*', '*adnxs.com*', '*hotjar.com*', '*clarity.ms*', '*wcs.naver.net*',
+    # 폰트
+    '*.woff*', '*.ttf*', '*.otf*', '*.eot*', '*fonts.googleapis.com*', '*fonts.gstatic.com*',
+    # 외부 스타일시트 (웹폰트/아이콘 폰트/채팅 위젯 CSS, 추출 대상 요소의 표시 여부와 무관)
+    '*cdn.jsdelivr.net/gh/orioncactus/pretendard*', '*cdn.jsdelivr.net/npm/pretendard*',
+    '*fonts.cdnfonts.com*', '*use.typekit.net*', '*use.fontawesome.com*', '*cdnjs.cloudflare.com/ajax/libs/font-awesome*',
+    '*cdn.channel.io*',
+    # 이미지/미디어
+    '*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.svg*', '*.ico*',
+    '*.mp4*', '*.webm*', '*.mp3*'
+] + [pattern.strip() for pattern in os.environ.get('CATCH_LEAN_EXTRA_BLOCKED_URLS', '').split(',') if pattern.strip()]
+
+# HTTP 빠른 경로 설정 (사용 여부, 연결 풀 크기, 요청 타임아웃, 검색어 쿼리 파라미터)
+HTTP_FAST_PATH = os.environ.get('CATCH_HTTP_FAST_PATH', '1') == '1'
+HTTP_POOL_SIZE = int(os.environ.get('CATCH_HTTP_POOL_SIZE', '10'))
+HTTP_TIMEOUT = float(os.environ.get('CATCH_HTTP_TIMEOUT', '10'))
+COMPANY_SEARCH_PARAM = os.environ.get('CATCH_COMPANY_SEARCH_PARAM', 'keyword')
+
+# 채용 공고 크롤링 설정 (카테고리별 최대 페이지 수)
+HOMEPAGE_JOBS_MAX_PAGES = int(os.environ.get('CATCH_HOMEPAGE_JOBS_MAX_PAGES', '5'))
+
+# 크롤링할 직무 카테고리 "SELECTORS 키:카테고리 버튼 이름:응답 키" 목록 (쉼표 구분)
+JOB_CATEGORY_SPEC = os.environ.get('CATCH_JOB_CATEGORIES', 'it_development:IT개발:it_jobs,bigdata_ai:빅데이터·AI:bigdata_ai_jobs')
+JOB_CATEGORY_LABELS = OrderedDict(
+    (entry.split(':')[0].strip(), entry.split(':')[1].strip())
+    for entry in JOB_CATEGORY_SPEC.split(',') if entry.count(':') == 2
+)
+# (SELECTORS 키, 응답 키)
+JOB_CATEGORIES = [
+    (entry.split(':')[0].strip(), entry.split(':')[2].strip())
+    for entry in JOB_CATEGORY_SPEC.split(',') if entry.count(':') == 2
+]
+# 카테고리 간 중복 공고의 대표 카테고리를 정할 때 쓰는 설정 순서
+JOB_CATEGORY_ORDER = {result_key: index for index, (_, result_key) in enumerate(JOB_CATEGORIES)}
+# 카테고리를 동시에 수집할 작업 스레드 수 (실제 동시 수집 수는 드라이버 풀 크기로도 제한)
+JOB_CRAWL_WORKERS = int(os.environ.get('CATCH_JOB_CRAWL_WORKERS', str(max(2, len(JOB_CATEGORIES) * 2))))
+
+# 공고 상세 설정 (일괄 조회 최대 URL 수, 동시 조회 수, 캐시 TTL/stale 허용 시간(초), 최대 항목 수)
+# TTL이 지난 항목은 ETag/Last-Modified 조건부 요청으로 재검증해서 바뀌지 않았으면 다시 파싱하지 않음
+JOB_DETAIL_BATCH_MAX_SIZE = int(os.environ.get('CATCH_JOB_DETAIL_BATCH_MAX_SIZE', '100'))
+JOB_DETAIL_BATCH_WORKERS = int(os.environ.get('CATCH_JOB_DETAIL_BATCH_WORKERS', '8'))
+JOB_DETAIL_CACHE_TTL = float(os.environ.get('CATCH_JOB_DETAIL_CACHE_TTL', '3600'))
+JOB_DETAIL_CACHE_STALE_TTL = float(os.environ.get('CATCH_JOB_DETAIL_CACHE_STALE_TTL', '86400'))
+JOB_DETAIL_CACHE_MAX_ENTRIES = int(os.environ.get('CATCH_JOB_DETAIL_CACHE_MAX_ENTRIES', '2000'))
+
+# 일괄 기업 조회 설정 (요청당 최대 기업 수, 동시 조회 수)
+COMPANY_BATCH_MAX_SIZE = int(os.environ.get('CATCH_COMPANY_BATCH_MAX_SIZE', '50'))
+COMPANY_BATCH_WORKERS = int(os.environ.get('CATCH_COMPANY_BATCH_WORKERS', '8'))
+
+# 비동기 스크래핑 작업 설정 (작업 스레드 수, 대기열 크기, 완료된 작업 보관 시간(초), 콜백 타임아웃)
+SCRAPE_JOB_WORKERS = int(os.environ.get('CATCH_SCRAPE_JOB_WORKERS', '2'))
+SCRAPE_JOB_QUEUE_SIZE = int(os.environ.get('CATCH_SCRAPE_JOB_QUEUE_SIZE', '100'))
+SCRAPE_JOB_RETENTION = float(os.environ.get('CATCH_SCRAPE_JOB_RETENTION', '3600'))
+SCRAPE_JOB_CALLBACK_TIMEOUT = float(os.environ.get('CATCH_SCRAPE_JOB_CALLBACK_TIMEOUT', '10'))
+# 내부망/루프백 주소여도 콜백을 허용할 호스트 (쉼표 구분, 기본은 공인 주소로만 전송)
+SCRAPE_JOB_CALLBACK_ALLOWED_HOSTS = {
+    host.strip().lower() for host in os.environ.get('CATCH_SCRAPE_JOB_CALLBACK_ALLOWED_HOSTS', '').split(',') if host.strip()
+}
+
+# 작업 우선순위 (숫자가 작을수록 먼저 처리)
+SCRAPE_JOB_PRIORITIES = {
+    'interactive': 0,
+    'batch': 1,
+    'bulk': 2
+}
+
+# 공고 스냅샷 갱신 주기(초, 0이면 비활성화), 서비스 시작 후 첫 갱신까지 대기(초), 갱신 시 카테고리별 페이지 수, 보관할 이전 버전 수
+JOB_SNAPSHOT_INTERVAL = float(os.environ.get('CATCH_JOB_SNAPSHOT_INTERVAL', '1800'))
+JOB_SNAPSHOT_INITIAL_DELAY = float(os.environ.get('CATCH_JOB_SNAPSHOT_INITIAL_DELAY', '120'))
+JOB_SNAPSHOT_MAX_PAGES = int(os.environ.get('CATCH_JOB_SNAPSHOT_MAX_PAGES', '20'))
+JOB_SNAPSHOT_HISTORY = int(os.environ.get('CATCH_JOB_SNAPSHOT_HISTORY', '48'))
+
+# 공고 검색 색인 경로, 검색 API 기본/최대 페이지 크기
+JOB_INDEX_PATH = os.environ.get('CATCH_JOB_INDEX_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'jobs.sqlite3'))
+JOB_SEARCH_DEFAULT_LIMIT = int(os.environ.get('CATCH_JOB_SEARCH_DEFAULT_LIMIT', '50'))
+JOB_SEARCH_MAX_LIMIT = int(os.environ.get('CATCH_JOB_SEARCH_MAX_LIMIT', '500'))
+
+# 공고 목록 문구에서 지역/고용형태를 찾을 때 쓰는 값
+JOB_REGIONS = ['서울', '경기', '인천', '부산', '대구', '광주', '대전', '울산', '세종', '강원', '충북', '충남',
+               '전북', '전남', '경북', '경남', '제주', '전국', '해외']
+JOB_TYPES = ['정규직', '계약직', '인턴', '파견직', '프리랜서', '아르바이트']
+# 경력 필터 값별로 포함할 경력 구분 (신입 지원자에게는 경력무관/신입·경력 공고도 포함)
+JOB_CAREER_FILTERS = {
+    '신입': ['신입', '신입·경력', '경력무관'],
+    '경력': ['경력', '신입·경력', '경력무관'],
+    '경력무관': ['경력무관']
+}
+
+# 사이트 전체 요청 속도 조절 (초당 요청 수 초기값/최소/최대, 순간 허용량, 동시 요청 수 최소/최대,
+# 느린 응답 기준(초), 차단 감지 시 백오프 기본/최대(초), 요청당 최대 대기(초))
+GOVERNOR_RATE = float(os.environ.get('CATCH_GOVERNOR_RATE', '2'))
+GOVERNOR_MIN_RATE = float(os.environ.get('CATCH_GOVERNOR_MIN_RATE', '0.2'))
+GOVERNOR_MAX_RATE = float(os.environ.get('CATCH_GOVERNOR_MAX_RATE', '10'))
+GOVERNOR_BURST = float(os.environ.get('CATCH_GOVERNOR_BURST', '5'))
+GOVERNOR_MIN_CONCURRENCY = int(os.environ.get('CATCH_GOVERNOR_MIN_CONCURRENCY', '1'))
+GOVERNOR_MAX_CONCURRENCY = int(os.environ.get('CATCH_GOVERNOR_MAX_CONCURRENCY', '8'))
+GOVERNOR_LATENCY_TARGET = float(os.environ.get('CATCH_GOVERNOR_LATENCY_TARGET', '5'))
+GOVERNOR_BACKOFF_BASE = float(os.environ.get('CATCH_GOVERNOR_BACKOFF_BASE', '2'))
+GOVERNOR_BACKOFF_MAX = float(os.environ.get('CATCH_GOVERNOR_BACKOFF_MAX', '120'))
+GOVERNOR_MAX_WAIT = float(os.environ.get('CATCH_GOVERNOR_MAX_WAIT', '30'))
+
+# 요청 제한/봇 확인 페이지로 판단할 문구 (페이지 제목 또는 HTML에 포함되면 차단으로 간주)
+CHALLENGE_MARKERS = [
+    marker.strip() for marker in os.environ.get(
+        'CATCH_CHALLENGE_MARKERS',
+        'captcha,cf-challenge,challenge-platform,Access Denied,Too Many Requests,비정상적인 접근,접속이 제한'
+    ).split(',') if marker.strip()
+]
+# 차단으로 간주할 HTTP 상태 코드
+THROTTLE_STATUS_CODES = {403, 429, 503}
+
+# 응답 처리 설정
+# 사이트 요청이 필요한 엔드포인트의 동시 처리 수 (기본: 드라이버 풀 크기 + 대기 허용 수, 속도 조절기 최대 동시 요청 수 중 큰 값)
+# 운영 서버는 여기에 가벼운 엔드포인트용 스레드 수를 더해서 작업 스레드 수를 정함
+SERVE_HEAVY_SLOTS = int(os.environ.get('CATCH_SERVE_HEAVY_SLOTS', str(max(DRIVER_POOL_SIZE + DRIVER_MAX_WAITERS, GOVERNOR_MAX_CONCURRENCY))))
+SERVE_LIGHT_THREADS = int(os.environ.get('CATCH_SERVE_LIGHT_THREADS', '4'))
+# 종료 시 처리 중인 스크래핑 요청을 기다릴 최대 시간(초)
+SERVE_SHUTDOWN_GRACE = float(os.environ.get('CATCH_SERVE_SHUTDOWN_GRACE', '30'))
+# 직렬화한 응답 본문 캐시 (TTL(초), 최대 항목 수, 클라이언트 캐시 허용 시간(초))
+SERVE_PAYLOAD_CACHE_TTL = float(os.environ.get('CATCH_SERVE_PAYLOAD_CACHE_TTL', '3600'))
+SERVE_PAYLOAD_CACHE_MAX_ENTRIES = int(os.environ.get('CATCH_SERVE_PAYLOAD_CACHE_MAX_ENTRIES', '1000'))
+SERVE_PAYLOAD_MAX_AGE = int(os.environ.get('CATCH_SERVE_PAYLOAD_MAX_AGE', '300'))
+# 이 크기(바이트) 이상인 JSON/텍스트 응답만 압축
+SERVE_COMPRESS_MIN_BYTES = int(os.environ.get('CATCH_SERVE_COMPRESS_MIN_BYTES', '1024'))
+COMPRESSIBLE_MIMETYPES = {'application/json', 'text/plain', 'text/html'}
+
+# 기업 정보 캐시 설정 (초 단위 TTL, stale 응답 허용 시간, 샘플 데이터 TTL, 최대 항목 수)
+COMPANY_CACHE_TTL = float(os.environ.get('CATCH_COMPANY_CACHE_TTL', '21600'))
+COMPANY_CACHE_STALE_TTL = float(os.environ.get('CATCH_COMPANY_CACHE_STALE_TTL', '86400'))
+COMPANY_CACHE_FALLBACK_TTL = float(os.environ.get('CATCH_COMPANY_CACHE_FALLBACK_TTL', '60'))
+COMPANY_CACHE_MAX_ENTRIES = int(os.environ.get('CATCH_COMPANY_CACHE_MAX_ENTRIES', '500'))
 
 SELECTORS = {
     'login_button': [
         ('XPATH', "//a[contains(text(), '로그인')]")
     ],
+    'logout_button': [
+        ('XPATH', "//a[contains(text(), '로그아웃')]")
+    ],
     'recruit_menu': [
         ('XPATH', "//a[@href='/NCS/RecruitSearch']")
     ],
@@ -39,16 +277,816 @@ SELECTORS = {
     ]
 }
 
+# 설정에만 있는 직무 카테고리는 버튼 이름으로 선택자 생성
+for _category_key, _category_label in JOB_CATEGORY_LABELS.items():
+    SELECTORS.setdefault(_category_key, [
+        ('XPATH', f"//button[contains(@class, 'bt')]//span[contains(text(), '{_category_label}')]/..")
+    ])
+
+# 기업 검색/상세 페이지 요소
+COMPANY_SEARCH_INPUT = "//input[@placeholder='궁금한 기업을 검색해 보세요.']"
+COMPANY_SEARCH_BUTTON = "//button[@class='bt_sch']"
+COMPANY_SEARCH_RESULTS = "//ul[@class='list_corp_round']"
+COMPANY_SEARCH_RESULT_LINKS = f"{COMPANY_SEARCH_RESULTS}//li//p[@class='name']//a"
+COMPANY_DETAIL_HEADER = "//div[@class='name']//h2"
+COMPANY_DETAIL_INDUSTRY = "//span[contains(text(), '포털·플랫폼') or contains(text(), '은행·금융') or contains(text(), '게임') or contains(text(), '전기·전자')]"
+
+# 공고 상세 페이지 요소 (항목 이름 라벨 기준으로 값 영역을 찾음)
+JOB_DETAIL_TITLE = "//*[self::h2 or self::h3 or self::p][contains(@class, 'subj')]"
+JOB_DETAIL_COMPANY = "//*[self::p or self::a or self::span][contains(@class, 'name')]"
+JOB_DETAIL_CONTENT = "//div[contains(@class, 'recruit_detail') or contains(@class, 'view_cont')]"
+JOB_DETAIL_APPLY_LINK = "//a[contains(normalize-space(.), '지원하기')]"
+
+def _job_detail_field(label):
+    """라벨(dt)에 대응하는 값(dd) XPath"""
+    return f"//dt[contains(normalize-space(.), '{label}')]/following-sibling::dd[1]"
+
+def _job_detail_section(title):
+    """본문 소제목 바로 다음 요소 XPath"""
+    return f"//*[self::h3 or self::h4 or self::strong][contains(normalize-space(.), '{title}')]/following-sibling::*[1]"
+
+# 기업 리뷰 목록 페이지 요소 (최신순 정렬, page 파라미터로 페이지 이동)
+COMPANY_REVIEW_LIST = "//ul[contains(@class, 'list_review')]"
+COMPANY_REVIEW_ROWS = "//ul[contains(@class, 'list_review')]/li"
+COMPANY_REVIEW_NEXT_PAGE = SELECTORS['next_page'][0][1]
+
+# 공고 목록 tbody 변경을 감지하는 MutationObserver 설치 (페이지 이동 직전에 실행)
+PAGE_CHANGE_OBSERVER_SCRIPT = """
+if (window.__catchObserver) { window.__catchObserver.disconnect(); }
+window.__catchMutations = 0;
+var tbody = document.querySelector('tbody');
+if (tbody) {
+    window.__catchObserver = new MutationObserver(function (records) {
+        window.__catchMutations += records.length;
+    });
+    window.__catchObserver.observe(tbody, {childList: true, subtree: true, characterData: true});
+}
+"""
+
+# 변경 횟수와 첫 번째 공고 상태를 한 번의 호출로 조회
+PAGE_STATE_SCRIPT = """
+var rows = document.querySelectorAll('tbody tr');
+var first = rows.length ? rows[0] : null;
+var title = first ? first.querySelector('p.subj2') : null;
+var company = first ? first.querySelector('p.name2') : null;
+return {
+    mutations: window.__catchMutations || 0,
+    rows: rows.length,
+    first_title: title ? title.textContent.trim() : '',
+    first_company: company ? company.textContent.trim() : ''
+};
+"""
+
+# 추출 명세를 받아 모든 필드와 목록 행을 한 번의 execute_script 호출로 추출
+# 필드 정의는 [XPath, 모드] - 모드: text(첫 요소 텍스트), texts(텍스트 노드 목록), count(요소 수), 그 외는 속성 이름
+EXTRACT_SCRIPT = """
+var spec = arguments[0];
+function nodes(xpath, context) {
+    var snapshot = document.evaluate(xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var found = [];
+    for (var i = 0; i < snapshot.snapshotLength; i++) { found.push(snapshot.snapshotItem(i)); }
+    return found;
+}
+function texts(node) {
+    var walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT, null, false);
+    var values = [];
+    while (walker.nextNode()) {
+        var value = walker.currentNode.nodeValue.trim();
+        if (value) { values.push(value); }
+    }
+    return values;
+}
+function field(context, definition) {
+    var found = nodes(definition[0], context);
+    var mode = definition[1];
+    if (mode === 'count') { return found.length; }
+    if (!found.length) { return mode === 'texts' ? [] : null; }
+    if (mode === 'text') { return (found[0].textContent || '').trim(); }
+    if (mode === 'texts') { return texts(found[0]); }
+    if (mode === 'href' || mode === 'src') { return found[0][mode] || found[0].getAttribute(mode) || ''; }
+    return found[0].getAttribute(mode);
+}
+function fields(context, definitions) {
+    var result = {};
+    for (var name in definitions) { result[name] = field(context, definitions[name]); }
+    return result;
+}
+var result = fields(document, spec.fields || {});
+var lists = spec.lists || {};
+for (var name in lists) {
+    result[name] = nodes(lists[name].rows, document).map(function (row) { return fields(row, lists[name].fields); });
+}
+return result;
+"""
+
 app = Flask(__name__)
 CORS(app)
 
+# 지연 시간 히스토그램 버킷(초)
+METRICS_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 200)
+
+class Metrics:
+    """Prometheus 텍스트 형식으로 내보내는 카운터/히스토그램/게이지 모음"""
+
+    def __init__(self, buckets=METRICS_BUCKETS):
+        self.buckets = buckets
+        self._counters = {}
+        self._histograms = {}
+        self._gauges = []
+        self._help = {}
+        self._lock = threading.Lock()
+
+    def describe(self, name, kind, help_text):
+        """메트릭 설명 등록 (# HELP / # TYPE)"""
+        self._help[name] = (kind, help_text)
+
+    def inc(self, name, amount=1, **labels):
+        """카운터 증가"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        """히스토그램에 값 기록"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram["buckets"][index] += 1
+            histogram["sum"] += value
+            histogram["count"] += 1
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """with 블록 실행 시간을 히스토그램에 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def gauge(self, func):
+        """내보낼 때마다 호출되는 게이지 등록 (func는 (이름, 라벨, 값) 목록 반환)"""
+        self._gauges.append(func)
+        return func
+
+    @staticmethod
+    def _format_labels(labels):
+        if not labels:
+            return ''
+        escaped = [(key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')) for key, value in labels]
+        return '{' + ','.join(f'{key}="{value}"' for key, value in escaped) + '}'
+
+    def render(self):
+        """Prometheus 텍스트 형식으로 직렬화"""
+        samples = {}
+        with self._lock:
+            for (name, labels), value in self._counters.items():
+                samples.setdefault(name, []).append(f"{name}{self._format_labels(labels)} {value}")
+            for (name, labels), histogram in self._histograms.items():
+                lines = samples.setdefault(name, [])
+                for bound, count in zip(self.buckets, histogram["buckets"]):
+                    lines.append(f"{name}_bucket{self._format_labels(labels + (('le', bound),))} {count}")
+                lines.append(f"{name}_bucket{self._format_labels(labels + (('le', '+Inf'),))} {histogram['count']}")
+                lines.append(f"{name}_sum{self._format_labels(labels)} {histogram['sum']:.6f}")
+                lines.append(f"{name}_count{self._format_labels(labels)} {histogram['count']}")
+
+        for func in self._gauges:
+            try:
+                for name, labels, value in func():
+                    samples.setdefault(name, []).append(f"{name}{self._format_labels(tuple(sorted(labels.items())))} {value}")
+            except Exception as e:
+                print(f"게이지 수집 실패 ({func.__name__}): {e}")
+
+        output = []
+        for name in sorted(samples):
+            if name in self._help:
+                kind, help_text = self._help[name]
+                output.append(f"# HELP {name} {help_text}")
+                output.append(f"# TYPE {name} {kind}")
+            output.extend(samples[name])
+        return '\n'.join(output) + '\n'
+
+metrics = Metrics()
+metrics.describe('catch_http_request_seconds', 'histogram', 'Flask endpoint latency in seconds')
+metrics.describe('catch_scrape_stage_seconds', 'histogram', 'Scrape stage latency in seconds (navigate, wait, search, extract, login, login_restore, reviews)')
+metrics.describe('catch_sample_fallback_total', 'counter', 'Responses that fell back to sample company data, by cause')
+metrics.describe('catch_driver_pool_sessions', 'gauge', 'Driver pool sessions by state')
+metrics.describe('catch_driver_pool_waiting', 'gauge', 'Requests waiting for a driver session')
+metrics.describe('catch_scrape_job_queue', 'gauge', 'Async scrape jobs by status')
+metrics.describe('catch_cache_requests_total', 'counter', 'Result cache lookups by cache and result')
+metrics.describe('catch_cache_hit_ratio', 'gauge', 'Result cache hit ratio including stale hits')
+metrics.describe('catch_company_index_lookups_total', 'counter', 'Company index lookups by result')
+metrics.describe('catch_review_pages_total', 'counter', 'Company review list pages read by incremental crawls')
+metrics.describe('catch_reviews_added_total', 'counter', 'New company reviews stored by incremental crawls')
+metrics.describe('catch_login_total', 'counter', 'Login attempts by method (cookie restore or form) and result')
+metrics.describe('catch_heavy_requests_in_flight', 'gauge', 'Site-bound API requests currently being processed')
+metrics.describe('catch_heavy_requests_rejected_total', 'counter', 'Site-bound API requests rejected because all heavy slots were busy or the server was draining')
+metrics.describe('catch_response_not_modified_total', 'counter', 'Cached payload requests answered with 304, by endpoint')
+metrics.describe('catch_page_archive_records_total', 'counter', 'Pages written to the page archive, by page type and source')
+metrics.describe('catch_job_detail_revalidations_total', 'counter', 'Conditional job detail requests by result (not_modified, modified)')
+metrics.describe('catch_governor_rate', 'gauge', 'Current site-wide request rate limit (requests per second)')
+metrics.describe('catch_governor_concurrency_limit', 'gauge', 'Current site-wide concurrent request limit')
+metrics.describe('catch_governor_in_flight', 'gauge', 'Site requests currently in flight')
+metrics.describe('catch_governor_backoff_seconds', 'gauge', 'Remaining backoff before new site requests are allowed')
+metrics.describe('catch_governor_wait_seconds', 'histogram', 'Time spent waiting for the rate governor, by path')
+metrics.describe('catch_governor_outcomes_total', 'counter', 'Governed site requests by path and outcome (ok, slow, error, throttled)')
+metrics.describe('catch_driver_recycles_total', 'counter', 'Driver sessions replaced or restarted by the watchdog, by reason')
+metrics.describe('catch_driver_spares_ready', 'gauge', 'Pre-warmed spare driver sessions ready to replace a recycled one')
+metrics.describe('catch_orphan_processes_killed_total', 'counter', 'Leftover chrome/chromedriver processes killed')
+metrics.describe('catch_chrome_rss_bytes', 'gauge', 'Resident memory of chromedriver and its Chrome processes per session')
+
+def _process_children():
+    """/proc 기준 부모 PID -> 자식 PID 목록 (Linux 외에서는 빈 dict)"""
+    children = {}
+    if not os.path.isdir('/proc'):
+        return children
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                # comm에 공백/괄호가 들어갈 수 있으므로 마지막 ')' 이후를 기준으로 파싱
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+            children.setdefault(ppid, []).append(int(entry))
+        except (OSError, ValueError, IndexError):
+            continue
+    return children
+
+def _process_tree_pids(root_pid, children=None):
+    """프로세스와 모든 자손의 PID 목록"""
+    if not root_pid:
+        return []
+    children = _process_children() if children is None else children
+    pids = []
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        pids.append(pid)
+        pending.extend(children.get(pid, []))
+    return pids
+
+def _process_tree_rss(root_pid):
+    """/proc 기준으로 프로세스와 모든 자손의 RSS 합계(바이트) - Linux 외에서는 0"""
+    if not root_pid or not os.path.isdir('/proc'):
+        return 0
+
+    total = 0
+    for pid in _process_tree_pids(root_pid):
+        try:
+            with open(f'/proc/{pid}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1]) * 1024
+                        break
+        except OSError:
+            continue
+    return total
+
+def _kill_processes(pids):
+    """아직 살아 있는 프로세스 강제 종료 후 종료한 수 반환"""
+    killed = 0
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGKILL)
+            killed += 1
+        except (OSError, ValueError):
+            continue
+    if killed:
+        metrics.inc('catch_orphan_processes_killed_total', killed)
+    return killed
+
+def _process_alive(pid):
+    """PID의 프로세스가 살아 있는지 확인 (권한이 없어도 존재하면 True)"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+def _driver_owner(pid):
+    """프로세스 환경 변수의 소유 표시 (marker, 띄운 서비스 PID), 없거나 읽을 수 없으면 None"""
+    try:
+        with open(f'/proc/{pid}/environ', 'rb') as f:
+            environ = f.read().split(b'\0')
+    except OSError:
+        return None
+    prefix = f'{DRIVER_OWNER_ENV}='.encode()
+    for item in environ:
+        if item.startswith(prefix):
+            marker, _, owner_pid = item[len(prefix):].decode('utf-8', 'replace').partition(':')
+            return (marker, int(owner_pid)) if owner_pid.isdigit() else None
+    return None
+
+def _find_orphan_browser_processes(active_pids, retired_ports):
+    """이 서비스가 띄웠지만 소유한 세션이 없는 chrome/chromedriver 프로세스
+
+    소유 여부는 init_driver가 chromedriver에 넘긴 소유 표시 환경 변수(Chrome도 상속)로만 판단
+    - 이미 종료된 이전 서비스 프로세스가 띄운 chrome/chromedriver
+    - 이 프로세스가 띄웠고 교체/종료된 세션의 디버그 포트로 실행 중인 Chrome
+    - 이 프로세스가 띄웠고 부모가 죽어서 init에 입양된 chrome/chromedriver
+    다른 사용자/서비스나 실행 중인 다른 서비스 프로세스의 브라우저는 건드리지 않음
+    """
+    if not os.path.isdir('/proc'):
+        return []
+    own_pid = os.getpid()
+    # 컨테이너에서 이 프로세스가 PID 1이면 init 입양 여부로 고아를 판단할 수 없음
+    adopted_ppid = 1 if own_pid != 1 else None
+    retired_flags = {f'--remote-debugging-port={port}' for port in retired_ports}
+
+    orphans = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit() or int(entry) in active_pids:
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        comm = stat[stat.find('(') + 1:stat.rfind(')')]
+        if comm != 'chromedriver' and 'chrom' not in comm.lower():
+            continue
+        owner = _driver_owner(entry)
+        if not owner or owner[0] != DRIVER_OWNER_MARKER:
+            continue
+
+        owner_pid = owner[1]
+        if owner_pid != own_pid:
+            # 띄운 서비스 프로세스가 아직 살아 있으면 그 프로세스의 세션
+            if not _process_alive(owner_pid):
+                orphans.append(int(entry))
+            continue
+        ppid = int(stat.rsplit(')', 1)[1].split()[1])
+        if ppid == adopted_ppid:
+            orphans.append(int(entry))
+        elif comm != 'chromedriver':
+            try:
+                with open(f'/proc/{entry}/cmdline', 'rb') as f:
+                    args = f.read().decode('utf-8', 'replace').split('\0')
+            except OSError:
+                continue
+            if retired_flags.intersection(args):
+                orphans.append(int(entry))
+    return orphans
+
+class SiteThrottled(Exception):
+    """사이트가 요청을 제한하고 있음 (차단 페이지 감지 또는 백오프 대기 시간 초과)"""
+
+def _is_challenge_page(text):
+    """요청 제한/봇 확인 페이지인지 확인"""
+    lowered = (text or '').lower()
+    return any(marker.lower() in lowered for marker in CHALLENGE_MARKERS)
+
+class RateGovernor:
+    """사이트 전체 요청 속도 조절기 (브라우저 이동과 HTTP 요청 모두 통과)
+
+    토큰 버킷으로 초당 요청 수를, AIMD로 동시 요청 수를 제한하고 응답에 따라 두 한도를 조절
+    - 정상 응답: 동시 요청 한도를 1/한도씩, 속도를 조금씩 올림
+    - 느린 응답: 동시 요청 한도를 조금 낮춤
+    - 오류/차단: 두 한도를 줄이고 연속 실패 횟수에 따라 지터를 섞은 지수 백오프
+    """
+
+    def __init__(self, rate=GOVERNOR_RATE, min_rate=GOVERNOR_MIN_RATE, max_rate=GOVERNOR_MAX_RATE, burst=GOVERNOR_BURST,
+                 min_concurrency=GOVERNOR_MIN_CONCURRENCY, max_concurrency=GOVERNOR_MAX_CONCURRENCY,
+                 latency_target=GOVERNOR_LATENCY_TARGET, backoff_base=GOVERNOR_BACKOFF_BASE,
+                 backoff_max=GOVERNOR_BACKOFF_MAX, max_wait=GOVERNOR_MAX_WAIT):
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, min_rate)
+        self.rate = min(max(rate, self.min_rate), self.max_rate)
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(max_concurrency, self.min_concurrency)
+        self.concurrency_limit = float(self.max_concurrency)
+        self.latency_target = latency_target
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_wait = max_wait
+        self.in_flight = 0
+        self.backoff_until = 0.0
+        self.consecutive_failures = 0
+        self._last_refill = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def _acquire(self):
+        """백오프가 끝나고 동시 요청 슬롯과 토큰이 생길 때까지 대기 후 대기 시간 반환 (최대 대기를 넘기면 SiteThrottled)"""
+        started = time.monotonic()
+        deadline = started + self.max_wait
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.backoff_until:
+                    wait = self.backoff_until - now
+                elif self.in_flight >= int(self.concurrency_limit):
+                    wait = 1.0
+                elif self.tokens < 1:
+                    wait = (1 - self.tokens) / self.rate
+                else:
+                    self.tokens -= 1
+                    self.in_flight += 1
+                    return now - started
+
+                if now >= deadline:
+                    raise SiteThrottled(f"사이트 요청 제한으로 {self.max_wait:.0f}초 이상 대기해서 요청을 포기합니다.")
+                self._cond.wait(min(wait, deadline - now))
+
+    def _release(self, elapsed, outcome):
+        with self._cond:
+            self.in_flight -= 1
+            if outcome["result"] in ('throttled', 'error'):
+                decrease = 0.5 if outcome["result"] == 'throttled' else 0.7
+                self.concurrency_limit = max(self.min_concurrency, self.concurrency_limit * decrease)
+                self.rate = max(self.min_rate, self.rate * decrease)
+                self.consecutive_failures += 1
+                # 지수 백오프의 절반은 고정, 나머지 절반은 무작위 (대기 중인 요청이 한꺼번에 재시도하지 않도록)
+                backoff = min(self.backoff_max, self.backoff_base * 2 ** (self.consecutive_failures - 1))
+                backoff = random.uniform(backoff / 2, backoff)
+                if outcome["retry_after"]:
+                    backoff = max(backoff, min(self.backoff_max, outcome["retry_after"]))
+                self.backoff_until = max(self.backoff_until, time.monotonic() + backoff)
+            elif elapsed > self.latency_target:
+                outcome["result"] = 'slow'
+                self.concurrency_limit = max(self.min_concurrency, self.concurrency_limit * 0.9)
+            else:
+                self.consecutive_failures = 0
+                self.concurrency_limit = min(self.max_concurrency, self.concurrency_limit + 1 / self.concurrency_limit)
+                self.rate = min(self.max_rate, self.rate + 0.05)
+            self._cond.notify_all()
+
+    @contextmanager
+    def request(self, path):
+        """사이트 요청 하나를 감싸는 블록
+
+        블록 안에서 outcome["result"]를 'throttled'로 바꾸거나 SiteThrottled가 발생하면 차단,
+        그 외 예외는 오류로 기록 (예외는 그대로 호출 측에 전달)
+        """
+        waited = self._acquire()
+        metrics.observe('catch_governor_wait_seconds', waited, path=path)
+        outcome = {"result": 'ok', "retry_after": None}
+        started = time.monotonic()
+        try:
+            yield outcome
+        except SiteThrottled:
+            outcome["result"] = 'throttled'
+            raise
+        except Exception:
+            outcome["result"] = 'error'
+            raise
+        finally:
+            self._release(time.monotonic() - started, outcome)
+            metrics.inc('catch_governor_outcomes_total', path=path, outcome=outcome["result"])
+            if outcome["result"] == 'throttled':
+                stats = self.stats()
+                print(f"⚠️ 사이트 요청 제한 감지 ({path}) - 속도 {stats['rate']}/s, 동시 {stats['concurrency_limit']}로 조정, "
+                      f"{stats['backoff_seconds']}초 대기")
+
+    def stats(self):
+        """현재 한도와 백오프 상태"""
+        with self._cond:
+            return {
+                "rate": round(self.rate, 3),
+                "concurrency_limit": int(self.concurrency_limit),
+                "in_flight": self.in_flight,
+                "backoff_seconds": round(max(0.0, self.backoff_until - time.monotonic()), 3),
+                "consecutive_failures": self.consecutive_failures
+            }
+
+# 브라우저 이동과 HTTP 요청이 공유하는 사이트 요청 속도 조절기
+rate_governor = RateGovernor()
+
+class WaitBudget:
+    """요청 단위 총 대기 시간 예산 (단계마다 남은 시간만큼만 대기)"""
+
+    def __init__(self, driver, total=SCRAPE_WAIT_BUDGET, poll_frequency=0.2):
+        self.driver = driver
+        self.total = total
+        self.poll_frequency = poll_frequency
+        self.deadline = time.monotonic() + total
+
+    def remaining(self):
+        """남은 대기 시간(초)"""
+        return max(0.0, self.deadline - time.monotonic())
+
+    def until(self, condition, message=''):
+        """조건이 충족될 때까지 남은 예산 안에서 대기"""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise TimeoutException(f"대기 예산 초과 ({self.total}초): {message}")
+        with metrics.timer('catch_scrape_stage_seconds', stage='wait', path='browser'):
+            return WebDriverWait(self.driver, remaining, poll_frequency=self.poll_frequency).until(condition, message)
+
+def _build_company_detail(company_name, header_name="", industry=""):
+    """상세 페이지에서 읽은 값으로 기업 정보 구성 (브라우저/HTTP 경로 공용)"""
+    return {
+        "company_name": header_name or company_name,
+        "industry": industry or "IT/소프트웨어",
+        # 나머지 정보는 아직 추출하지 않으므로 기본값 사용
+        "company_type": "중견기업",
+        "location": "서울특별시",
+        "employee_count": "100-500명",
+        "revenue": "",
+        "ceo": "",
+        "establishment_date": "",
+        "company_form": "",
+        "credit_rating": "",
+        "tags": ["성장성", "워라밸", "복리후생"],
+        "recommendation_keywords": [],
+        "starting_salary": "",
+        "average_salary": "",
+        "industry_average_salary": "",
+        # 저장된 최근 리뷰 (아직 수집하지 않은 기업은 샘플 리뷰)
+        "reviews": review_store.recent(_normalize_company_name(company_name), COMPANY_DETAIL_REVIEW_COUNT) or [
+            {
+                "employee_status": "현직원",
+                "employee_info": ["정규직", "경력입사"],
+                "rating": "4.2",
+                "good_points": "성장할 수 있는 환경이며 동료들과의 협업이 좋습니다.",
+                "bad_points": "가끔 야근이 있고 급여 수준이 아쉽습니다.",
+                "review_date": "2024.09.20",
+                "likes": "15"
+            }
+        ]
+    }
+
+def _match_company_link(links, company_name):
+    """검색 결과 (기업명, URL) 목록에서 일치하는 기업의 URL 반환 (정확히 일치 우선, 없으면 정규화 이름 비교)"""
+    links = list(links)
+    for company_text, href in links:
+        if company_text.strip() == company_name:
+            print(f"정확한 기업명 발견: {company_text.strip()}")
+            return href
+
+    # "(주)카카오"와 "카카오"처럼 법인 표기만 다른 경우 (후보가 하나일 때만)
+    key = _normalize_company_name(company_name)
+    matches = [(company_text, href) for company_text, href in links if _normalize_company_name(company_text) == key]
+    if len(matches) == 1:
+        print(f"정규화 기업명 일치: {matches[0][0].strip()}")
+        return matches[0][1]
+    return None
+
+def _job_id_from_url(url, title='', company=''):
+    """공고 URL에서 공고 ID 추출 (없으면 회사명+제목 해시)"""
+    match = re.search(r'(\d{4,})(?!.*\d{4,})', url or '')
+    if match:
+        return f"catch_{match.group(1)}"
+    digest = hashlib.md5(f"{company}|{title}".encode('utf-8')).hexdigest()[:12]
+    return f"catch_{digest}"
+
+def _build_job_detail(job_url, detail):
+    """상세 페이지에서 읽은 값으로 공고 상세 구성 (브라우저/HTTP 경로 공용, 없는 항목은 빈 문자열)"""
+    job_detail = {name: detail.get(name) or '' for name in EXTRACTION_SPECS['job_detail']['fields']}
+    job_detail["job_id"] = _job_id_from_url(job_url, job_detail["job_title"], job_detail["company_name"])
+    job_detail["url"] = job_url
+    return job_detail
+
+def _finish_job_row(row):
+    """공고 행 후처리 (제목 없는 행 제외, 공고 ID 부여)"""
+    if not row.get("title"):
+        return None
+    row["url"] = row.get("url") or ''
+    row["job_id"] = _job_id_from_url(row["url"], row["title"], row.get("company") or '')
+    return row
+
+def _normalize_review_date(value):
+    """리뷰 작성일을 정렬 가능한 YYYY.MM.DD 형태로 변환 ("24.09.20", "2024-09-20" 등)"""
+    parts = re.findall(r'\d+', value or '')
+    if len(parts) < 3:
+        return (value or '').strip()
+    year, month, day = parts[:3]
+    if len(year) == 2:
+        year = f"20{year}"
+    return f"{year}.{int(month):02d}.{int(day):02d}"
+
+def _finish_review_row(row):
+    """리뷰 행 후처리 (내용 없는 행 제외, 리뷰 ID 부여)"""
+    if not row.get("good_points") and not row.get("bad_points"):
+        return None
+    review_id = row.get("review_id") or ''
+    if not review_id:
+        digest = hashlib.md5(f"{row.get('review_date')}|{row.get('good_points')}|{row.get('bad_points')}".encode('utf-8')).hexdigest()[:12]
+        review_id = digest
+    row["review_id"] = f"review_{review_id}"
+    return row
+
+# 페이지 종류별 추출 명세: 필드 이름 -> (XPath, 모드, 후처리 함수)
+# 목록은 rows XPath로 행을 찾고 행 기준 상대 XPath로 필드를 읽은 뒤 post 함수로 행을 후처리
+EXTRACTION_SPECS = {
+    'company_search': {
+        'fields': {
+            'result_lists': (COMPANY_SEARCH_RESULTS, 'count', None)
+        },
+        'lists': {
+            'links': {
+                'rows': COMPANY_SEARCH_RESULT_LINKS,
+                'fields': {
+                    'name': ('.', 'text', None),
+                    'href': ('.', 'href', None)
+                }
+            }
+        }
+    },
+    'company_detail': {
+        'fields': {
+            'header_name': (COMPANY_DETAIL_HEADER, 'text', None),
+            'industry': (COMPANY_DETAIL_INDUSTRY, 'text', None)
+        }
+    },
+    'company_reviews': {
+        'fields': {
+            'list_count': (COMPANY_REVIEW_LIST, 'count', None),
+            'has_next': (COMPANY_REVIEW_NEXT_PAGE, 'count', None)
+        },
+        'lists': {
+            'reviews': {
+                'rows': COMPANY_REVIEW_ROWS,
+                'fields': {
+                    'review_id': ('.', 'data-review-id', None),
+                    'employee_status': (".//span[contains(@class, 'status')]", 'text', None),
+                    'employee_info': (".//p[contains(@class, 'info')]", 'texts', None),
+                    'rating': (".//span[contains(@class, 'score')]", 'text', None),
+                    'good_points': (".//dl[contains(@class, 'good')]//dd", 'text', None),
+                    'bad_points': (".//dl[contains(@class, 'bad')]//dd", 'text', None),
+                    'review_date': (".//span[contains(@class, 'date')]", 'text', _normalize_review_date),
+                    'likes': (".//button[contains(@class, 'like')]//span", 'text', None)
+                },
+                'post': _finish_review_row
+            }
+        }
+    },
+    'job_detail': {
+        'fields': {
+            'job_title': (JOB_DETAIL_TITLE, 'text', None),
+            'company_name': (JOB_DETAIL_COMPANY, 'text', None),
+            'job_type': (_job_detail_field('고용형태'), 'text', None),
+            'location': (_job_detail_field('근무지역'), 'text', None),
+            'career_level': (_job_detail_field('경력'), 'text', None),
+            'education': (_job_detail_field('학력'), 'text', None),
+            'salary': (_job_detail_field('급여'), 'text', None),
+            'deadline': (_job_detail_field('마감'), 'text', None),
+            'job_description': (_job_detail_section('담당업무'), 'text', None),
+            'requirements': (_job_detail_section('자격요건'), 'text', None),
+            'preferred_qualifications': (_job_detail_section('우대사항'), 'text', None),
+            'benefits': (_job_detail_section('복리후생'), 'text', None),
+            'apply_url': (JOB_DETAIL_APPLY_LINK, 'href', None),
+            'full_content': (JOB_DETAIL_CONTENT, 'text', None)
+        }
+    },
+    'job_list': {
+        'lists': {
+            'jobs': {
+                'rows': SELECTORS['job_list'][0][1],
+                'fields': {
+                    'title': (".//p[contains(@class, 'subj2')]", 'text', None),
+                    'company': (".//p[contains(@class, 'name2')]", 'text', None),
+                    'url': (".//a[@href]", 'href', None),
+                    'conditions': ("./td[2]", 'texts', None),
+                    'job_info': ("./td[3]", 'texts', None),
+                    'registration_info': ("./td[4]", 'texts', None)
+                },
+                'post': _finish_job_row
+            }
+        }
+    }
+}
+
+def _spec_for_script(spec):
+    """추출 명세에서 후처리 함수를 빼고 EXTRACT_SCRIPT 인자 형태로 변환"""
+    def definitions(fields):
+        return {name: [xpath, mode] for name, (xpath, mode, _) in fields.items()}
+    return {
+        'fields': definitions(spec.get('fields', {})),
+        'lists': {
+            name: {'rows': list_spec['rows'], 'fields': definitions(list_spec['fields'])}
+            for name, list_spec in spec.get('lists', {}).items()
+        }
+    }
+
+def _apply_post_processors(raw, spec):
+    """추출된 원시 값에 필드/행 후처리 함수 적용"""
+    def finish(values, fields):
+        for name, (_, _, post) in fields.items():
+            if post is not None:
+                values[name] = post(values.get(name))
+        return values
+
+    result = finish(dict(raw), spec.get('fields', {}))
+    for name, list_spec in spec.get('lists', {}).items():
+        rows = []
+        for row in raw.get(name) or []:
+            row = finish(row, list_spec['fields'])
+            if list_spec.get('post') is not None:
+                row = list_spec['post'](row)
+            if row is not None:
+                rows.append(row)
+        result[name] = rows
+    return result
+
+def _tree_field(context, definition, base_url):
+    """lxml 요소에서 필드 하나 추출 (EXTRACT_SCRIPT와 같은 규칙)"""
+    xpath, mode = definition[0], definition[1]
+    found = context.xpath(xpath)
+    if mode == 'count':
+        return len(found)
+    if not found:
+        return [] if mode == 'texts' else None
+    if mode == 'text':
+        return found[0].text_content().strip()
+    if mode == 'texts':
+        return [value.strip() for value in found[0].itertext() if value.strip()]
+    value = found[0].get(mode)
+    if mode in ('href', 'src') and value is not None:
+        return urljoin(base_url, value)
+    return value
+
+_compiled_specs = {}
+
+def compile_extraction_spec(page_type):
+    """추출 명세를 스크립트 인자로 컴파일 (페이지 종류별로 한 번만)"""
+    if page_type not in _compiled_specs:
+        _compiled_specs[page_type] = _spec_for_script(EXTRACTION_SPECS[page_type])
+    return _compiled_specs[page_type]
+
+def extract_from_driver(driver, page_type):
+    """브라우저 페이지에서 명세의 모든 필드를 WebDriver 호출 1회로 추출 (기록 모드면 최종 DOM도 보관)"""
+    with metrics.timer('catch_scrape_stage_seconds', stage='extract', path='browser'):
+        raw = driver.execute_script(EXTRACT_SCRIPT, compile_extraction_spec(page_type)) or {}
+        result = _apply_post_processors(raw, EXTRACTION_SPECS[page_type])
+    if page_archive.records(page_type):
+        page_archive.record(page_type, driver.current_url, driver.page_source, 'browser', result)
+    return result
+
+def _extract_tree(tree, page_type, base_url):
+    """lxml 트리에서 명세의 모든 필드 추출 (측정/기록 없이, 다시 추출할 때도 사용)"""
+    spec = EXTRACTION_SPECS[page_type]
+    raw = {name: _tree_field(tree, definition, base_url) for name, definition in spec.get('fields', {}).items()}
+    for name, list_spec in spec.get('lists', {}).items():
+        raw[name] = [
+            {field: _tree_field(row, definition, base_url) for field, definition in list_spec['fields'].items()}
+            for row in tree.xpath(list_spec['rows'])
+        ]
+    return _apply_post_processors(raw, spec)
+
+def extract_from_tree(tree, page_type, base_url=BASE_URL):
+    """lxml 트리에서 같은 명세로 추출 (HTTP 경로용, 기록 모드면 HTML도 보관)"""
+    with metrics.timer('catch_scrape_stage_seconds', stage='extract', path='http'):
+        result = _extract_tree(tree, page_type, base_url)
+    if page_archive.records(page_type):
+        # HttpScraper는 응답의 최종 URL(쿼리/페이지 번호 포함)을 트리의 문서 URL로 넘겨 줌
+        url = tree.getroottree().docinfo.URL or base_url
+        page_archive.record(page_type, url, lxml_html.tostring(tree, encoding='unicode'), 'http', result, base_url)
+    return result
+
+def _review_page_url(review_url, page):
+    """리뷰 목록의 page번째 페이지 URL"""
+    return f"{review_url}?{urlencode({'page': page})}"
+
+def _find_free_port():
+    """사용 가능한 로컬 포트 번호 반환"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
 class CatchScraper:
-    def __init__(self):
+    def __init__(self, session_id=0):
+        self.session_id = session_id
         self.driver = None
+        self.debug_port = None
         self.is_logged_in = False
+        self.logged_in_user = None
+        self.last_login_failure = 0
+        self.last_navigation = None
+        self.navigation_totals = {"navigations": 0, "requests": 0, "bytes": 0, "blocked": 0}
+        self.driver_navigations = 0
+        self.in_use = False
+
+    def is_driver_alive(self):
+        """드라이버가 살아서 응답하는지 확인"""
+        if not self.driver:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
 
     def init_driver(self):
-        """Chrome 드라이버 초기화"""
+        """Chrome 드라이버 초기화 (정상 동작 중인 드라이버가 있으면 재사용)"""
+        if self.is_driver_alive():
+            return True
+
+        # 죽은 드라이버가 남아 있으면 Chrome 프로세스가 새지 않도록 먼저 종료
+        self.close_driver()
+
         try:
             chrome_options = Options()
             chrome_options.add_argument('--headless')
@@ -58,12 +1096,14 @@ class CatchScraper:
             chrome_options.add_argument('--disable-extensions')
             chrome_options.add_argument('--disable-web-security')
             chrome_options.add_argument('--disable-features=VizDisplayCompositor')
-            chrome_options.add_argument('--remote-debugging-port=9222')
+            # 여러 Chrome 인스턴스가 공존할 수 있도록 세션마다 별도 포트 사용
+            self.debug_port = _find_free_port()
+            chrome_options.add_argument(f'--remote-debugging-port={self.debug_port}')
             chrome_options.add_argument('--disable-background-timer-throttling')
             chrome_options.add_argument('--disable-renderer-backgrounding')
             chrome_options.add_argument('--disable-backgrounding-occluded-windows')
             chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+            chrome_options.add_argument(f'--user-agent={USER_AGENT}')
 
             prefs = {
                 'profile.default_content_setting_values': {
@@ -77,17 +1117,105 @@ class CatchScraper:
             }
             chrome_options.add_experimental_option('prefs', prefs)
 
-            self.driver = webdriver.Chrome(options=chrome_options)
+            # lean 프로필은 DOMContentLoaded까지만 기다리고 나머지는 명시적 요소 대기로 처리
+            if PAGE_LOAD_PROFILE == 'lean':
+                chrome_options.page_load_strategy = 'eager'
+
+            # 이동 단위 요청 수/전송량 측정을 위한 성능 로그
+            if NAVIGATION_STATS:
+                chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
 
+            # 고아 프로세스 정리에서 이 서비스가 띄운 프로세스만 고르도록 소유 표시를 환경 변수로 전달
+            service = Service(env={**os.environ, DRIVER_OWNER_ENV: f'{DRIVER_OWNER_MARKER}:{os.getpid()}'})
+            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.driver_navigations = 0
+
+            # 요소 대기는 WaitBudget의 명시적 조건으로만 처리 (암묵적 대기 없음)
             self.driver.set_page_load_timeout(30)
-            self.driver.implicitly_wait(10)
+
+            if PAGE_LOAD_PROFILE == 'lean':
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': LEAN_BLOCKED_URL_PATTERNS})
 
             return True
         except Exception:
             return False
 
+    def navigate(self, url):
+        """페이지 이동 (이동마다 요청 수, 전송 바이트, 차단된 요청 수 기록)"""
+        # 이전 페이지에서 늦게 끝난 요청은 이전 기록에 합산
+        self._collect_network_stats()
+
+        started = time.time()
+        with rate_governor.request('browser') as outcome:
+            with metrics.timer('catch_scrape_stage_seconds', stage='navigate', path='browser'):
+                self.driver.get(url)
+            # 차단 페이지는 정상 로드처럼 보이므로 제목으로 확인 (WebDriver 호출 1회)
+            if _is_challenge_page(self.driver.title):
+                outcome["result"] = 'throttled'
+        self.last_navigation = {
+            "url": url,
+            "load_ms": round((time.time() - started) * 1000),
+            "requests": 0,
+            "bytes": 0,
+            "blocked": 0
+        }
+        self.navigation_totals["navigations"] += 1
+        self.driver_navigations += 1
+        self._collect_network_stats()
+
+        record = self.last_navigation
+        if NAVIGATION_STATS:
+            print(f"[세션 {self.session_id}] {url} 로드 {record['load_ms']}ms, "
+                  f"요청 {record['requests']}건 ({record['bytes'] / 1024:.1f}KB), 차단 {record['blocked']}건")
+        if outcome["result"] == 'throttled':
+            raise SiteThrottled(f"사이트가 요청을 제한하고 있습니다: {url}")
+
+    @contextmanager
+    def site_action(self):
+        """페이지를 새로 불러오는 클릭/제출을 navigate와 같은 속도 조절로 감싸고, 끝난 뒤 차단 페이지인지 확인
+
+        블록 안에서 클릭하고 결과가 나타날 때까지 기다리면 그 시간까지 한 번의 사이트 요청으로 기록
+        """
+        with rate_governor.request('browser') as outcome:
+            yield
+            if _is_challenge_page(self.driver.title):
+                outcome["result"] = 'throttled'
+        if outcome["result"] == 'throttled':
+            raise SiteThrottled(f"사이트가 요청을 제한하고 있습니다: {self.driver.current_url}")
+
+    def _collect_network_stats(self):
+        """성능 로그를 읽어서 마지막 이동 기록과 누적 통계에 반영"""
+        if not NAVIGATION_STATS or not self.driver:
+            return
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception:
+            return
+
+        requests_count = bytes_count = blocked_count = 0
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                requests_count += 1
+            elif method == 'Network.loadingFinished':
+                bytes_count += int(params.get('encodedDataLength', 0))
+            elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+                blocked_count += 1
+
+        for stats in (self.last_navigation, self.navigation_totals):
+            if stats is not None:
+                stats["requests"] += requests_count
+                stats["bytes"] += bytes_count
+                stats["blocked"] += blocked_count
+
     def _find_element_with_fallbacks(self, wait, selectors):
-        """여러 선택자를 시도해서 요소 찾기"""
+        """여러 선택자를 시도해서 요소 찾기 (wait은 WebDriverWait 또는 WaitBudget)"""
         for selector_value in [s[1] for s in selectors]:
             try:
                 return wait.until(EC.element_to_be_clickable((By.XPATH, selector_value)))
@@ -95,74 +1223,166 @@ class CatchScraper:
                 continue
         return None
 
+    def _watch_page_change(self, driver):
+        """페이지 이동 직전에 공고 목록 변경 감지 시작"""
+        try:
+            driver.execute_script(PAGE_CHANGE_OBSERVER_SCRIPT)
+        except Exception:
+            pass
+
     def _is_page_changed(self, driver, previous_first_job_title):
-        """페이지가 실제로 변경되었는지 확인"""
+        """페이지가 실제로 변경되었는지 확인 (WebDriver 호출 1회)"""
         try:
-            # 현재 첫 번째 공고 제목 가져오기
-            current_first_job = driver.find_element(By.XPATH, "//tbody//tr[1]//p[contains(@class, 'subj2')]")
-            current_first_job_title = current_first_job.text.strip()
+            state = driver.execute_script(PAGE_STATE_SCRIPT)
+            current_first_job_title = state["first_title"]
 
             # 이전 제목과 다르면 페이지가 변경된 것
             if current_first_job_title != previous_first_job_title and current_first_job_title != "":
                 print(f"페이지 변경 확인: '{previous_first_job_title}' -> '{current_first_job_title}'")
                 return True
 
-            # 공고 목록이 로드되었는지도 확인
-            job_rows = driver.find_elements(By.XPATH, "//tbody//tr")
-            if len(job_rows) > 0:
-                # 첫 번째 공고의 회사명도 확인
-                try:
-                    first_company = driver.find_element(By.XPATH, "//tbody//tr[1]//p[contains(@class, 'name2')]")
-                    if first_company.text.strip() != "":
-                        return True
-                except Exception:
-                    pass
-
-            return False
+            # 제목이 같더라도 tbody가 다시 그려졌고 공고가 채워져 있으면 변경된 것
+            return state["mutations"] > 0 and state["rows"] > 0 and state["first_company"] != ""
 
         except Exception:
             return False
 
-    def login(self, username='test0137', password='#test0808'):
-        """CATCH 사이트 로그인"""
-        try:
-            self.driver.get(BASE_URL)
+    def _wait_for_page_change(self, budget, previous_first_job_title):
+        """공고 목록이 바뀔 때까지 예산 안에서 대기"""
+        return budget.until(
+            lambda driver: self._is_page_changed(driver, previous_first_job_title),
+            "공고 목록 변경 대기"
+        )
 
-            wait = WebDriverWait(self.driver, 15)
-            login_button = self._find_element_with_fallbacks(wait, SELECTORS['login_button'])
-            if not login_button:
-                return {"success": False, "message": "로그인 버튼을 찾을 수 없습니다."}
+    def login(self, username=CATCH_USERNAME, password=CATCH_PASSWORD):
+        """CATCH 사이트 로그인 (같은 계정으로 이미 로그인된 세션이면 생략)
 
-            self.driver.execute_script("arguments[0].click();", login_button)
+        저장된 로그인 쿠키가 유효하면 주입만 하고, 쿠키가 없거나 만료된 경우에만 로그인 폼 사용
+        여러 세션이 동시에 로그인해도 폼 로그인은 한 번만 하고 나머지는 그 쿠키를 재사용
+        """
+        if self.is_logged_in and self.logged_in_user == username and self.is_driver_alive():
+            return {"success": True, "message": "이미 로그인되어 있습니다."}
 
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, "id_login"))
-            )
+        if not self.init_driver():
+            return {"success": False, "message": "드라이버 초기화에 실패했습니다."}
+
+        self.is_logged_in = False
+        self.logged_in_user = None
 
-            id_input = self.driver.find_element(By.ID, "id_login")
-            password_input = self.driver.find_element(By.ID, "pw_login")
+        with login_lock:
+            if self.restore_login(username):
+                return {"success": True, "message": "저장된 로그인 쿠키로 로그인 상태를 복원했습니다.", "restored": True}
 
-            id_input.clear()
-            id_input.send_keys(username)
-            password_input.clear()
-            password_input.send_keys(password)
-            password_input.send_keys(Keys.RETURN)
+            result = self._login_with_form(username, password)
+            metrics.inc('catch_login_total', method='form', result='success' if result.get("success") else 'failure')
+            if result.get("success"):
+                cookies = self.driver.get_cookies()
+                login_cookies.save(username, cookies)
+                http_scraper.load_cookies(cookies)
+            return result
 
+    def restore_login(self, username=CATCH_USERNAME):
+        """저장된 로그인 쿠키를 주입하고 실제 로그인 상태인지 확인 (유효하지 않으면 저장된 쿠키 폐기)"""
+        cookies = login_cookies.get(username)
+        if not cookies:
+            return False
+
+        with metrics.timer('catch_scrape_stage_seconds', stage='login_restore', path='browser'):
             try:
-                WebDriverWait(self.driver, 15).until(
-                    lambda driver: "Login" not in driver.current_url or
-                    len(driver.find_elements(By.ID, "id_login")) == 0
+                # 쿠키는 같은 도메인 페이지에서만 추가할 수 있으므로 먼저 사이트를 연 뒤 주입하고 다시 로드
+                self.navigate(BASE_URL)
+                self.driver.delete_all_cookies()
+                for cookie in cookies:
+                    try:
+                        self.driver.add_cookie(cookie)
+                    except Exception:
+                        continue
+                self.navigate(BASE_URL)
+
+                budget = WaitBudget(self.driver, LOGIN_RESTORE_WAIT_BUDGET)
+                budget.until(
+                    lambda driver: driver.find_elements(By.XPATH, SELECTORS['logout_button'][0][1]) or
+                    driver.find_elements(By.XPATH, SELECTORS['login_button'][0][1]),
+                    "로그인 상태 확인"
                 )
-                self.is_logged_in = True
-                return {"success": True, "message": "로그인 성공"}
-            except Exception:
+                logged_in = bool(self.driver.find_elements(By.XPATH, SELECTORS['logout_button'][0][1]))
+            except Exception as e:
+                print(f"[세션 {self.session_id}] 로그인 쿠키 복원 실패: {e}")
+                logged_in = False
+
+        metrics.inc('catch_login_total', method='cookie', result='success' if logged_in else 'failure')
+        if not logged_in:
+            print(f"[세션 {self.session_id}] 저장된 로그인 쿠키가 유효하지 않아 다시 로그인합니다.")
+            login_cookies.invalidate(username)
+            return False
+
+        print(f"[세션 {self.session_id}] 저장된 로그인 쿠키로 로그인 상태 복원")
+        self.is_logged_in = True
+        self.logged_in_user = username
+        return True
+
+    def _login_with_form(self, username, password):
+        """로그인 폼에 계정 정보를 입력해서 로그인"""
+        with metrics.timer('catch_scrape_stage_seconds', stage='login', path='browser'):
+            try:
+                self.navigate(BASE_URL)
+
+                budget = WaitBudget(self.driver, LOGIN_WAIT_BUDGET)
+                login_button = self._find_element_with_fallbacks(budget, SELECTORS['login_button'])
+                if not login_button:
+                    return {"success": False, "message": "로그인 버튼을 찾을 수 없습니다."}
+
+                with self.site_action():
+                    self.driver.execute_script("arguments[0].click();", login_button)
+                    budget.until(EC.presence_of_element_located((By.ID, "id_login")), "로그인 폼 대기")
+
+                id_input = self.driver.find_element(By.ID, "id_login")
+                password_input = self.driver.find_element(By.ID, "pw_login")
+
+                id_input.clear()
+                id_input.send_keys(username)
+                password_input.clear()
+                password_input.send_keys(password)
+
                 try:
-                    return {"success": False, "message": self.driver.find_element(By.CLASS_NAME, 'error-message').text}
+                    with self.site_action():
+                        password_input.send_keys(Keys.RETURN)
+                        budget.until(
+                            lambda driver: "Login" not in driver.current_url or
+                            len(driver.find_elements(By.ID, "id_login")) == 0,
+                            "로그인 완료 대기"
+                        )
+                    self.is_logged_in = True
+                    self.logged_in_user = username
+                    return {"success": True, "message": "로그인 성공"}
+                except SiteThrottled:
+                    raise
                 except Exception:
-                    return {"success": False, "message": "로그인 실패 - 로그인 페이지에 머물러 있음" if 'login' in self.driver.current_url else "로그인 상태 확인 실패"}
+                    try:
+                        return {"success": False, "message": self.driver.find_element(By.CLASS_NAME, 'error-message').text}
+                    except Exception:
+                        return {"success": False, "message": "로그인 실패 - 로그인 페이지에 머물러 있음" if 'login' in self.driver.current_url else "로그인 상태 확인 실패"}
 
-        except Exception as e:
-            return {"success": False, "message": str(e)}
+            except Exception as e:
+                return {"success": False, "message": str(e)}
+
+    def ensure_ready(self, username=CATCH_USERNAME, password=CATCH_PASSWORD):
+        """첫 사용 시 드라이버 초기화 및 로그인 (이미 준비된 세션이면 바로 반환)"""
+        if not self.init_driver():
+            return False
+
+        if self.is_logged_in:
+            return True
+
+        # 로그인이 계속 실패하는 경우 요청마다 로그인 대기 시간을 쓰지 않도록 재시도 간격 유지
+        if time.time() - self.last_login_failure < LOGIN_RETRY_INTERVAL:
+            return True
+
+        result = self.login(username, password)
+        if not result.get("success"):
+            print(f"[세션 {self.session_id}] 로그인 실패, 비로그인 상태로 진행: {result.get('message')}")
+            self.last_login_failure = time.time()
+        return True
 
     def get_current_status(self):
         """현재 상태 확인"""
@@ -171,9 +1391,13 @@ class CatchScraper:
 
         try:
             return {
+                "session_id": self.session_id,
                 "is_logged_in": self.is_logged_in,
                 "current_url": self.driver.current_url,
-                "page_title": self.driver.title
+                "page_title": self.driver.title,
+                "page_load_profile": PAGE_LOAD_PROFILE,
+                "last_navigation": self.last_navigation,
+                "navigation_totals": self.navigation_totals
             }
         except Exception as e:
             return {"error": str(e)}
@@ -182,119 +1406,63 @@ class CatchScraper:
         """기업 검색 및 상세 정보 추출 (통합 함수)"""
         try:
             print(f"기업 검색 페이지로 이동: {company_name}")
-            self.driver.get("https://www.catch.co.kr/Comp/CompMajor/SearchPage")
+            search_started = time.perf_counter()
+            self.navigate(COMPANY_SEARCH_URL)
 
-            wait = WebDriverWait(self.driver, 10)
+            budget = WaitBudget(self.driver, SCRAPE_WAIT_BUDGET)
 
-            # 페이지 로딩 대기
-            import time
-            time.sleep(3)
-
-            # 검색창 찾기
-            search_input = wait.until(EC.presence_of_element_located((By.XPATH, "//input[@placeholder='궁금한 기업을 검색해 보세요.']")))
+            # 검색창이 나타날 때까지 대기
+            search_input = budget.until(EC.presence_of_element_located((By.XPATH, COMPANY_SEARCH_INPUT)), "검색창 대기")
             search_input.clear()
             search_input.send_keys(company_name)
 
             # 검색 버튼 클릭
-            search_button = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[@class='bt_sch']")))
-            search_button.click()
-
-            # 검색 결과 로딩 대기
-            time.sleep(3)
+            search_button = budget.until(EC.element_to_be_clickable((By.XPATH, COMPANY_SEARCH_BUTTON)), "검색 버튼 대기")
+            with self.site_action():
+                search_button.click()
+                # 검색 결과 목록(list_corp_round)이 채워질 때까지 대기
+                budget.until(EC.presence_of_element_located((By.XPATH, COMPANY_SEARCH_RESULT_LINKS)), "검색 결과 대기")
 
-            # 검색 결과에서 정확한 기업명 찾기
-            company_links = wait.until(EC.presence_of_all_elements_located((By.XPATH, "//ul[@class='list_corp_round']//li//p[@class='name']//a")))
-
-            target_company_url = None
-            for link in company_links:
-                company_text = link.text.strip()
-                if company_text == company_name:
-                    target_company_url = link.get_attribute('href')
-                    print(f"정확한 기업명 발견: {company_text}")
-                    break
+            # 결과 링크의 기업명과 URL을 한 번의 호출로 추출
+            search_result = extract_from_driver(self.driver, 'company_search')
+            target_company_url = _match_company_link(
+                ((link["name"], link["href"]) for link in search_result["links"]),
+                company_name
+            )
+            company_index.record_search(company_name, search_result["links"], target_company_url)
+            metrics.observe('catch_scrape_stage_seconds', time.perf_counter() - search_started, stage='search', path='browser')
 
             if not target_company_url:
                 # 샘플 데이터 반환 (실제 검색 실패 시)
-                return {
-                    "success": True,
-                    "company_detail": self._get_sample_company_data(company_name),
-                    "message": f"'{company_name}' 기업 정보 (샘플 데이터)"
-                }
+                return self._sample_company_result(company_name, f"'{company_name}' 기업 정보 (샘플 데이터)", 'not_found')
 
-            # 기업 상세 정보 추출
-            return self._extract_company_detail(target_company_url, company_name)
+            # 기업 상세 정보 추출 (남은 대기 예산 공유)
+            return self._extract_company_detail(target_company_url, company_name, budget)
 
         except Exception as e:
             print(f"기업 검색 중 오류: {e}")
-            # 오류 발생 시에도 샘플 데이터 반환
-            return {
-                "success": True,
-                "company_detail": self._get_sample_company_data(company_name),
-                "message": f"'{company_name}' 기업 정보 (샘플 데이터 - 스크래핑 오류)"
-            }
+            # 오류 발생 시에도 샘플 데이터 반환 (요청 제한은 원인을 구분해서 기록)
+            cause = 'throttled' if isinstance(e, SiteThrottled) else 'search_error'
+            return self._sample_company_result(company_name, f"'{company_name}' 기업 정보 (샘플 데이터 - 스크래핑 오류)", cause)
 
-    def _extract_company_detail(self, company_url, company_name):
+    def _extract_company_detail(self, company_url, company_name, budget=None):
         """기업 상세 정보 추출"""
         try:
             print(f"기업 상세 페이지로 이동: {company_url}")
-            self.driver.get(company_url)
-
-            wait = WebDriverWait(self.driver, 10)
-
-            # 페이지 로딩 대기
-            import time
-            time.sleep(3)
-
-            company_detail = {
-                "company_name": company_name,
-                "industry": "",
-                "company_type": "",
-                "location": "",
-                "employee_count": "",
-                "revenue": "",
-                "ceo": "",
-                "establishment_date": "",
-                "company_form": "",
-                "credit_rating": "",
-                "tags": [],
-                "recommendation_keywords": [],
-                "starting_salary": "",
-                "average_salary": "",
-                "industry_average_salary": "",
-                "reviews": []
-            }
+            self.navigate(company_url)
+
+            if budget is None:
+                budget = WaitBudget(self.driver, SCRAPE_WAIT_BUDGET)
 
             # 기본 정보 추출 시도 (실패해도 계속 진행)
+            # 상세 헤더가 렌더링되면 나머지 정적 요소도 준비된 것으로 보고 추가 대기 없이 조회
             try:
-                company_name_element = wait.until(EC.presence_of_element_located((By.XPATH, "//div[@class='name']//h2")))
-                company_detail["company_name"] = company_name_element.text.strip()
-            except:
+                budget.until(EC.presence_of_element_located((By.XPATH, COMPANY_DETAIL_HEADER)), "기업 상세 헤더 대기")
+            except TimeoutException:
                 pass
 
-            try:
-                industry_element = wait.until(EC.presence_of_element_located((By.XPATH, "//span[contains(text(), '포털·플랫폼') or contains(text(), '은행·금융') or contains(text(), '게임') or contains(text(), '전기·전자')]")))
-                company_detail["industry"] = industry_element.text.strip()
-            except:
-                company_detail["industry"] = "IT/소프트웨어"
-
-            # 나머지 정보들도 비슷하게 시도하되 실패 시 기본값 사용
-            company_detail["company_type"] = "중견기업"
-            company_detail["location"] = "서울특별시"
-            company_detail["employee_count"] = "100-500명"
-            company_detail["tags"] = ["성장성", "워라밸", "복리후생"]
-
-            # 샘플 리뷰 데이터 추가
-            company_detail["reviews"] = [
-                {
-                    "employee_status": "현직원",
-                    "employee_info": ["정규직", "경력입사"],
-                    "rating": "4.2",
-                    "good_points": "성장할 수 있는 환경이며 동료들과의 협업이 좋습니다.",
-                    "bad_points": "가끔 야근이 있고 급여 수준이 아쉽습니다.",
-                    "review_date": "2024.09.20",
-                    "likes": "15"
-                }
-            ]
+            detail = extract_from_driver(self.driver, 'company_detail')
+            company_detail = _build_company_detail(company_name, detail["header_name"], detail["industry"])
 
             return {
                 "success": True,
@@ -304,11 +1472,18 @@ class CatchScraper:
 
         except Exception as e:
             print(f"기업 상세 정보 추출 실패: {e}")
-            return {
-                "success": True,
-                "company_detail": self._get_sample_company_data(company_name),
-                "message": f"'{company_name}' 기업 정보 (샘플 데이터)"
-            }
+            cause = 'throttled' if isinstance(e, SiteThrottled) else 'detail_error'
+            return self._sample_company_result(company_name, f"'{company_name}' 기업 정보 (샘플 데이터)", cause)
+
+    def _sample_company_result(self, company_name, message, cause):
+        """샘플 기업 데이터 응답 (캐시가 짧은 TTL을 적용할 수 있도록 is_sample 표시)"""
+        metrics.inc('catch_sample_fallback_total', cause=cause)
+        return {
+            "success": True,
+            "company_detail": self._get_sample_company_data(company_name),
+            "message": message,
+            "is_sample": True
+        }
 
     def _get_sample_company_data(self, company_name):
         """샘플 기업 데이터 반환"""
@@ -440,8 +1615,107 @@ class CatchScraper:
             "message": f"{company_name} 지원 꿀팁 정보"
         }
 
+    def _open_job_category(self, category_key, budget):
+        """채용 검색 페이지에서 직무 카테고리 선택"""
+        self.navigate(RECRUIT_SEARCH_URL)
+
+        job_category = self._find_element_with_fallbacks(budget, SELECTORS['job_category'])
+        if not job_category:
+            raise TimeoutException("직무 필터 버튼을 찾을 수 없습니다.")
+        with self.site_action():
+            self.driver.execute_script("arguments[0].click();", job_category)
+
+        category = self._find_element_with_fallbacks(budget, SELECTORS[category_key])
+        if not category:
+            raise TimeoutException(f"'{category_key}' 카테고리를 찾을 수 없습니다.")
+
+        # 필터 적용 전 첫 번째 공고를 기준으로 목록이 바뀔 때까지 대기
+        previous_first_job_title = self.driver.execute_script(PAGE_STATE_SCRIPT)["first_title"]
+        with self.site_action():
+            self._watch_page_change(self.driver)
+            self.driver.execute_script("arguments[0].click();", category)
+            self._wait_for_page_change(budget, previous_first_job_title)
+
+    def _parse_job_rows(self):
+        """현재 페이지의 공고 목록 파싱 (모든 행을 한 번의 호출로 추출)"""
+        return extract_from_driver(self.driver, 'job_list')["jobs"]
+
+    def _go_to_next_page(self, current_page, previous_first_job_title, budget):
+        """다음 페이지로 이동 (번호 링크 우선, 없으면 다음 버튼) - 이동하지 못하면 False"""
+        target = None
+        for link in self.driver.find_elements(By.XPATH, SELECTORS['page_number'][0][1]):
+            if link.text.strip() == str(current_page + 1):
+                target = link
+                break
+
+        if target is None:
+            next_buttons = self.driver.find_elements(By.XPATH, SELECTORS['next_page'][0][1])
+            if not next_buttons:
+                return False
+            target = next_buttons[0]
+
+        # 페이지 번호 클릭도 목록을 새로 요청하므로 속도 조절 대상
+        with self.site_action():
+            self._watch_page_change(self.driver)
+            self.driver.execute_script("arguments[0].click();", target)
+            self._wait_for_page_change(budget, previous_first_job_title)
+        return True
+
+    def iter_job_pages(self, category_key, max_pages=HOMEPAGE_JOBS_MAX_PAGES):
+        """카테고리의 공고 목록을 페이지 단위로 yield (page, jobs)"""
+        self._open_job_category(category_key, WaitBudget(self.driver, SCRAPE_WAIT_BUDGET))
+
+        page = 1
+        while True:
+            jobs = self._parse_job_rows()
+            print(f"[{category_key}] {page}페이지 공고 {len(jobs)}개 수집")
+            yield page, jobs
+
+            if page >= max_pages or not jobs:
+                break
+
+            budget = WaitBudget(self.driver, SCRAPE_WAIT_BUDGET)
+            if not self._go_to_next_page(page, jobs[0]["title"], budget):
+                break
+            page += 1
+
+    def iter_review_pages(self, review_url, start_page=1):
+        """리뷰 목록을 start_page부터 페이지 단위로 yield (page, reviews, has_next)"""
+        page = start_page
+        while True:
+            self.navigate(_review_page_url(review_url, page))
+            budget = WaitBudget(self.driver, SCRAPE_WAIT_BUDGET)
+            try:
+                budget.until(EC.presence_of_element_located((By.XPATH, COMPANY_REVIEW_LIST)), "리뷰 목록 대기")
+            except TimeoutException:
+                print(f"리뷰 목록을 찾을 수 없습니다: {review_url} ({page}페이지)")
+                return
+
+            result = extract_from_driver(self.driver, 'company_reviews')
+            yield page, result["reviews"], bool(result["has_next"])
+            page += 1
+
     def get_job_detail(self, job_url):
-        """공고 상세 정보 반환 (샘플 데이터)"""
+        """공고 상세 정보 추출 (실패하면 샘플 데이터)"""
+        try:
+            print(f"공고 상세 페이지로 이동: {job_url}")
+            self.navigate(job_url)
+            budget = WaitBudget(self.driver, SCRAPE_WAIT_BUDGET)
+            budget.until(EC.presence_of_element_located((By.XPATH, JOB_DETAIL_TITLE)), "공고 제목 대기")
+
+            detail = extract_from_driver(self.driver, 'job_detail')
+            return {
+                "success": True,
+                "job_detail": _build_job_detail(job_url, detail),
+                "message": "공고 상세 정보 추출 완료"
+            }
+        except Exception as e:
+            print(f"공고 상세 정보 추출 실패: {e}")
+            metrics.inc('catch_sample_fallback_total', cause='throttled' if isinstance(e, SiteThrottled) else 'job_detail_error')
+            return dict(self._get_sample_job_detail(), is_sample=True)
+
+    def _get_sample_job_detail(self):
+        """샘플 공고 상세 반환"""
         return {
             "success": True,
             "job_detail": {
@@ -463,39 +1737,2468 @@ class CatchScraper:
             "message": "공고 상세 정보 (샘플 데이터)"
         }
 
-    def close_driver(self):
-        """드라이버 종료"""
-        if self.driver:
-            self.driver.quit()
+    def driver_pid(self):
+        """chromedriver 프로세스 ID (없으면 None)"""
+        try:
+            return self.driver.service.process.pid
+        except Exception:
+            return None
 
-# 전역 스크래퍼 인스턴스
-scraper = CatchScraper()
+    def is_process_alive(self):
+        """chromedriver 프로세스가 살아 있는지 (WebDriver 호출 없음)"""
+        if not self.driver:
+            return False
+        try:
+            return self.driver.service.process.poll() is None
+        except Exception:
+            return False
+
+    def recycle_reason(self, check_memory=False, check_responsive=False):
+        """드라이버를 교체해야 하는 이유 (필요 없으면 None)
+
+        메모리/응답 확인은 비용이 있어서 감시 스레드가 유휴 세션을 점검할 때만 사용
+        """
+        if not self.driver:
+            return None
+        if not self.is_process_alive():
+            return 'crashed'
+        if DRIVER_MAX_NAVIGATIONS and self.driver_navigations >= DRIVER_MAX_NAVIGATIONS:
+            return 'navigations'
+        if check_memory and DRIVER_MAX_RSS_MB and _process_tree_rss(self.driver_pid()) > DRIVER_MAX_RSS_MB * 1024 * 1024:
+            return 'memory'
+        if check_responsive and not self.is_driver_alive():
+            return 'unresponsive'
+        return None
+
+    def health(self):
+        """WebDriver 호출 없이 확인하는 세션 상태 (사용 중인 드라이버를 기다리지 않음)"""
+        process_alive = self.is_process_alive()
+        return {
+            "session_id": self.session_id,
+            "initialized": self.driver is not None,
+            "alive": process_alive,
+            "in_use": self.in_use,
+            "is_logged_in": self.is_logged_in and process_alive,
+            "navigations": self.navigation_totals["navigations"],
+            "driver_navigations": self.driver_navigations
+        }
+
+    def close_driver(self):
+        """드라이버 종료 (quit 후에도 남은 chromedriver/Chrome 프로세스는 강제 종료)"""
+        if self.driver:
+            pids = _process_tree_pids(self.driver_pid())
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+            survivors = [pid for pid in pids if os.path.exists(f'/proc/{pid}')]
+            if survivors:
+                print(f"[세션 {self.session_id}] 종료되지 않은 프로세스 {len(survivors)}개 강제 종료")
+                _kill_processes(survivors)
+        self.is_logged_in = False
+        self.logged_in_user = None
+
+class HttpScraper:
+    """브라우저 없이 HTTP 요청 + lxml 파싱으로 서버 렌더링 페이지 스크래핑"""
+
+    def __init__(self, pool_size=HTTP_POOL_SIZE, timeout=HTTP_TIMEOUT):
+        self.enabled = HTTP_FAST_PATH and requests is not None
+        self.timeout = timeout
+        self.session = None
+        if self.enabled:
+            # keep-alive 연결을 재사용하도록 세션 하나에 연결 풀 장착
+            self.session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+            self.session.headers.update({
+                'User-Agent': USER_AGENT,
+                'Accept-Language': 'ko-KR,ko;q=0.9'
+            })
+
+    def load_cookies(self, cookies):
+        """Selenium 형식 쿠키 목록을 HTTP 세션에 설정"""
+        if not self.enabled:
+            return
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain'), path=cookie.get('path', '/')
+            )
+
+    def sync_cookies(self, driver):
+        """Selenium 로그인 세션의 쿠키를 HTTP 세션으로 복사"""
+        if not self.enabled or not driver:
+            return
+        try:
+            self.load_cookies(driver.get_cookies())
+        except Exception as e:
+            print(f"쿠키 동기화 실패: {e}")
+
+    def restore_login(self, username=CATCH_USERNAME):
+        """저장된 로그인 쿠키를 HTTP 세션에 주입하고 홈 페이지로 로그인 상태 확인 (유효하지 않으면 폐기)"""
+        cookies = login_cookies.get(username)
+        if not self.enabled or not cookies:
+            return False
+        try:
+            self.load_cookies(cookies)
+            logged_in = bool(self.fetch_tree(BASE_URL).xpath(SELECTORS['logout_button'][0][1]))
+        except Exception as e:
+            print(f"HTTP 로그인 쿠키 확인 실패: {e}")
+            return False
+
+        metrics.inc('catch_login_total', method='cookie', result='success' if logged_in else 'failure')
+        if not logged_in:
+            print("저장된 로그인 쿠키가 유효하지 않아 HTTP 세션에서 제거합니다.")
+            self.session.cookies.clear()
+            login_cookies.invalidate(username)
+        return logged_in
+
+    def get(self, url, **kwargs):
+        """속도 조절기를 거쳐 GET 요청 (차단 상태 코드나 차단 페이지면 SiteThrottled)"""
+        with rate_governor.request('http') as outcome:
+            with metrics.timer('catch_scrape_stage_seconds', stage='navigate', path='http'):
+                response = self.session.get(url, timeout=self.timeout, **kwargs)
+            if response.status_code in THROTTLE_STATUS_CODES or (response.status_code == 200 and _is_challenge_page(response.text[:20000])):
+                retry_after = response.headers.get('Retry-After', '')
+                outcome["retry_after"] = float(retry_after) if retry_after.isdigit() else None
+                raise SiteThrottled(f"사이트가 요청을 제한하고 있습니다 (HTTP {response.status_code}): {url}")
+        return response
+
+    def fetch_tree(self, url, params=None):
+        """페이지를 받아서 lxml 트리로 반환"""
+        response = self.get(url, params=params)
+        response.raise_for_status()
+        return lxml_html.fromstring(response.content, base_url=response.url)
+
+    def find_company_url(self, company_name):
+        """검색 결과에서 기업 상세 URL 찾기
+
+        결과 목록이 서버에서 렌더링되지 않았으면(JS 필요) None, 목록은 있지만
+        비어 있거나 정확히 일치하는 기업이 없으면 빈 문자열 반환
+        """
+        try:
+            tree = self.fetch_tree(COMPANY_SEARCH_URL, {COMPANY_SEARCH_PARAM: company_name})
+            result = extract_from_tree(tree, 'company_search', COMPANY_SEARCH_URL)
+            links = result["links"]
+            if not links:
+                # 목록 영역이 있으면 검색 결과가 0건인 것이므로 브라우저로 다시 찾지 않음
+                return '' if result["result_lists"] else None
+
+            company_url = _match_company_link(((link["name"], link["href"]) for link in links), company_name)
+            company_index.record_search(company_name, links, company_url)
+            return company_url or ''
+        except Exception as e:
+            print(f"HTTP 기업 검색 실패, 브라우저로 전환: {e}")
+            return None
+
+    def extract_company_detail(self, company_url, company_name):
+        """기업 상세 정보 추출 (상세 헤더가 없으면 JS 렌더링이 필요한 것으로 보고 None 반환)"""
+        try:
+            print(f"기업 상세 페이지 HTTP 요청: {company_url}")
+            tree = self.fetch_tree(company_url)
+            detail = extract_from_tree(tree, 'company_detail', company_url)
+            if not detail["header_name"]:
+                return None
+
+            return {
+                "success": True,
+                "company_detail": _build_company_detail(company_name, detail["header_name"], detail["industry"]),
+                "message": "기업 상세 정보 추출 완료"
+            }
+        except Exception as e:
+            print(f"HTTP 기업 상세 추출 실패, 브라우저로 전환: {e}")
+            return None
+
+    def iter_review_pages(self, review_url, start_page=1):
+        """리뷰 목록을 페이지 단위로 yield (목록이 서버에서 렌더링되지 않았거나 요청이 실패하면 중단)"""
+        page = start_page
+        while True:
+            try:
+                tree = self.fetch_tree(_review_page_url(review_url, page))
+                result = extract_from_tree(tree, 'company_reviews', review_url)
+            except Exception as e:
+                print(f"HTTP 리뷰 목록 요청 실패: {e}")
+                return
+            if not result["list_count"]:
+                return
+            yield page, result["reviews"], bool(result["has_next"])
+            page += 1
+
+    def fetch_job_detail(self, job_url, previous=None):
+        """공고 상세 페이지 요청 (이전 결과의 ETag/Last-Modified로 조건부 요청)
+
+        304면 이전 결과를 그대로 반환, 본문에 공고 제목이 없으면(JS 렌더링 필요) None
+        """
+        headers = {}
+        validators = (previous or {}).get("validators") or {}
+        if validators.get("etag"):
+            headers['If-None-Match'] = validators["etag"]
+        if validators.get("last_modified"):
+            headers['If-Modified-Since'] = validators["last_modified"]
+
+        try:
+            response = self.get(job_url, headers=headers)
+            if response.status_code == 304 and previous:
+                metrics.inc('catch_job_detail_revalidations_total', result='not_modified')
+                return previous
+            response.raise_for_status()
+            if headers:
+                metrics.inc('catch_job_detail_revalidations_total', result='modified')
+
+            tree = lxml_html.fromstring(response.content, base_url=response.url)
+            detail = extract_from_tree(tree, 'job_detail', response.url)
+            if not detail["job_title"]:
+                return None
+            return {
+                "success": True,
+                "job_detail": _build_job_detail(job_url, detail),
+                "validators": {
+                    "etag": response.headers.get('ETag'),
+                    "last_modified": response.headers.get('Last-Modified')
+                },
+                "message": "공고 상세 정보 추출 완료"
+            }
+        except Exception as e:
+            print(f"HTTP 공고 상세 추출 실패, 브라우저로 전환: {e}")
+            return None
+
+class LoginCookieJar:
+    """계정별 로그인 쿠키 저장소 (JSON 파일, 계정 정보에 준하므로 소유자만 읽을 수 있게 저장)"""
+
+    def __init__(self, path=LOGIN_COOKIE_PATH, max_age=LOGIN_COOKIE_MAX_AGE):
+        self.path = path
+        self.max_age = max_age
+        self._accounts = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """저장된 쿠키 읽기"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                self._accounts = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"로그인 쿠키 로드 실패: {e}")
+
+    def _save(self):
+        """임시 파일(0600)에 쓴 뒤 교체"""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._accounts, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"로그인 쿠키 저장 실패: {e}")
+
+    def get(self, username):
+        """유효 기간 안의 쿠키 목록 (없거나 오래됐으면 None)"""
+        with self._lock:
+            entry = self._accounts.get(username)
+        if not entry or time.time() - entry.get("saved_at", 0) > self.max_age:
+            return None
+        now = time.time()
+        cookies = [dict(cookie) for cookie in entry.get("cookies", []) if not cookie.get("expiry") or cookie["expiry"] > now]
+        return cookies or None
+
+    def save(self, username, cookies):
+        """로그인 직후 쿠키 저장"""
+        with self._lock:
+            self._accounts[username] = {"cookies": cookies, "saved_at": time.time()}
+            self._save()
+
+    def invalidate(self, username):
+        """만료된 쿠키 삭제"""
+        with self._lock:
+            if self._accounts.pop(username, None) is not None:
+                self._save()
+
+    def stats(self):
+        """저장된 계정별 쿠키 상태"""
+        with self._lock:
+            return {
+                username: {"cookies": len(entry.get("cookies", [])), "saved_at": entry.get("saved_at")}
+                for username, entry in self._accounts.items()
+            }
+
+class DriverPoolTimeout(Exception):
+    """대기 시간 안에 세션을 대여하지 못함"""
+
+class DriverPoolFull(Exception):
+    """대기열이 가득 차서 요청을 받을 수 없음"""
+
+class DriverPool:
+    """WebDriver 세션 풀 (요청마다 세션 하나를 대여하고 반납)
+
+    교체가 필요한 세션은 미리 로그인해 둔 예비 세션과 바꿔서 요청 경로에서 콜드 스타트가 없도록 함
+    """
+
+    def __init__(self, size=DRIVER_POOL_SIZE, acquire_timeout=DRIVER_ACQUIRE_TIMEOUT, max_waiters=DRIVER_MAX_WAITERS, spares=DRIVER_WARM_SPARES):
+        self.size = max(1, size)
+        self.acquire_timeout = acquire_timeout
+        self.max_waiters = max_waiters
+        self.spare_count = max(0, spares)
+        self.sessions = [CatchScraper(session_id=i) for i in range(self.size)]
+        self._idle = queue.Queue()
+        for session in self.sessions:
+            self._idle.put(session)
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._spares = []
+        self._next_session_id = self.size
+        self._retired_ports = OrderedDict()
+        self.recycles = 0
+
+    def acquire(self, timeout=None):
+        """유휴 세션 대여 (대기열이 가득 차면 즉시 거절)"""
+        with self._lock:
+            if self._idle.empty() and self._waiting >= self.max_waiters:
+                raise DriverPoolFull(f"스크래퍼 대기열이 가득 찼습니다. (대기 {self._waiting}건)")
+            self._waiting += 1
+
+        try:
+            session = self._idle.get(timeout=self.acquire_timeout if timeout is None else timeout)
+            # 반납 이후 Chrome이 죽었으면 예비 세션으로 교체 (예비 세션이 없으면 ensure_ready가 다시 띄움)
+            if session.recycle_reason() == 'crashed':
+                session = self._swap_with_spare(session, 'crashed')
+            session.in_use = True
+            return session
+        except queue.Empty:
+            raise DriverPoolTimeout("사용 가능한 스크래퍼 세션이 없습니다. 잠시 후 다시 시도해주세요.")
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def release(self, session):
+        """세션 반납 (교체 기준에 도달했고 예비 세션이 있으면 바꿔서 반납)"""
+        session.in_use = False
+        reason = session.recycle_reason()
+        if reason:
+            session = self._swap_with_spare(session, reason)
+        self._idle.put(session)
+
+    def _swap_with_spare(self, session, reason):
+        """예비 세션을 풀에 넣고 기존 세션은 백그라운드에서 종료 (예비 세션이 없으면 그대로 반환)"""
+        with self._lock:
+            if not self._spares:
+                return session
+            spare = self._spares.pop(0)
+            spare.session_id = session.session_id
+            self.sessions[self.sessions.index(session)] = spare
+
+        self._record_recycle(session, reason)
+        threading.Thread(target=session.close_driver, name=f'driver-retire-{session.session_id}', daemon=True).start()
+        return spare
+
+    def _record_recycle(self, session, reason):
+        self.recycles += 1
+        metrics.inc('catch_driver_recycles_total', reason=reason)
+        print(f"[세션 {session.session_id}] 드라이버 교체 ({reason}, 이동 {session.driver_navigations}회)")
+        if session.debug_port:
+            with self._lock:
+                self._retired_ports[session.debug_port] = time.time()
+                while len(self._retired_ports) > 64:
+                    self._retired_ports.popitem(last=False)
+
+    def warm_spares(self):
+        """예비 세션을 정해진 수만큼 띄우고 로그인 (감시 스레드에서 호출)"""
+        while len(self._spares) < self.spare_count:
+            with self._lock:
+                spare = CatchScraper(session_id=self._next_session_id)
+                self._next_session_id += 1
+            if not spare.ensure_ready():
+                print("예비 드라이버 준비 실패")
+                spare.close_driver()
+                return
+            with self._lock:
+                self._spares.append(spare)
+            print(f"예비 드라이버 준비 완료 (로그인: {spare.is_logged_in})")
+
+        # 대기 중에 죽은 예비 세션은 버리고 다음 점검에서 다시 준비
+        with self._lock:
+            dead = [spare for spare in self._spares if not spare.is_process_alive()]
+            self._spares = [spare for spare in self._spares if spare not in dead]
+        for spare in dead:
+            spare.close_driver()
+
+    def recycle_idle(self):
+        """유휴 세션을 하나씩 꺼내 점검 (메모리/응답 포함) 후 예비 세션과 교체
+
+        준비된 예비 세션이 없으면 교체를 다음 점검으로 미룸 (제자리 재시작은 그동안 풀 용량이
+        줄어드므로 예비 세션을 쓰지 않도록 설정한 경우에만)
+        """
+        for _ in range(self._idle.qsize()):
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                reason = session.recycle_reason(check_memory=True, check_responsive=True)
+                if reason:
+                    replacement = self._swap_with_spare(session, reason)
+                    if replacement is session and not self.spare_count:
+                        self._record_recycle(session, reason)
+                        session.close_driver()
+                        session.ensure_ready()
+                    session = replacement
+            finally:
+                self._idle.put(session)
+
+    def active_pids(self):
+        """풀/예비 세션이 소유한 chromedriver와 Chrome 프로세스 PID"""
+        children = _process_children()
+        pids = set()
+        with self._lock:
+            owners = self.sessions + self._spares
+        for session in owners:
+            pids.update(_process_tree_pids(session.driver_pid(), children))
+        return pids
+
+    def kill_orphans(self):
+        """소유한 세션이 없는 chrome/chromedriver 프로세스 정리"""
+        active = self.active_pids()
+        active.add(os.getpid())
+        with self._lock:
+            retired_ports = list(self._retired_ports)
+        orphans = _find_orphan_browser_processes(active, retired_ports)
+        if orphans:
+            print(f"고아 chrome/chromedriver 프로세스 {len(orphans)}개 종료")
+        return _kill_processes(orphans)
+
+    @contextmanager
+    def session(self, timeout=None):
+        """with 블록 동안 세션 하나를 대여"""
+        session = self.acquire(timeout)
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def available(self):
+        """지금 바로 대여할 수 있는 유휴 세션 수"""
+        return self._idle.qsize()
+
+    def stats(self):
+        """풀 사용 현황"""
+        idle = self._idle.qsize()
+        return {
+            "size": self.size,
+            "in_use": self.size - idle,
+            "idle": idle,
+            "waiting": self._waiting,
+            "max_waiters": self.max_waiters,
+            "spares_ready": len(self._spares),
+            "recycles": self.recycles
+        }
+
+    def close_all(self):
+        """모든 세션과 예비 세션의 드라이버 종료"""
+        with self._lock:
+            spares, self._spares = self._spares, []
+        for session in self.sessions + spares:
+            session.close_driver()
+
+class DriverWatchdog:
+    """드라이버 상태 주기 점검 (예비 세션 준비, 유휴 세션 교체, 고아 프로세스 정리)"""
+
+    def __init__(self, pool, interval=DRIVER_WATCHDOG_INTERVAL):
+        self.pool = pool
+        self.interval = interval
+        self.last_check = None
+        self.last_error = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def check(self):
+        """한 번 점검 (예비 세션을 먼저 준비해야 교체 시 콜드 스타트가 없음)"""
+        self.pool.warm_spares()
+        self.pool.recycle_idle()
+        self.pool.kill_orphans()
+        self.last_check = time.time()
+
+    def _run(self):
+        # 이전 실행에서 남은 프로세스부터 정리
+        self.pool.kill_orphans()
+        while not self._stop.is_set():
+            try:
+                self.check()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"드라이버 점검 중 오류: {e}")
+            self._stop.wait(self.interval)
+
+    def start(self):
+        """감시 스레드 시작 (주기가 0이면 시작하지 않음)"""
+        if self.interval <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='driver-watchdog', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """감시 스레드 종료 요청"""
+        self._stop.set()
+
+    def stats(self):
+        """감시 상태"""
+        return {
+            "running": bool(self._thread and self._thread.is_alive()),
+            "interval": self.interval,
+            "last_check": self.last_check,
+            "last_error": self.last_error
+        }
+
+class ResultCache:
+    """TTL + LRU 결과 캐시 (만료된 항목은 백그라운드 갱신 동안 stale 응답으로 제공)"""
+
+    def __init__(self, ttl, stale_ttl, max_entries, ttl_for=None):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.ttl_for = ttl_for
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """(값, 상태) 반환 - 상태는 'fresh', 'stale', None 중 하나"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, None
+            value, expires_at, stale_until = entry
+            if now < expires_at:
+                self._entries.move_to_end(key)
+                return value, 'fresh'
+            if now < stale_until:
+                self._entries.move_to_end(key)
+                return value, 'stale'
+            del self._entries[key]
+            return None, None
+
+    def set(self, key, value):
+        """값 저장 (ttl_for가 있으면 값에 따라 TTL 결정)"""
+        ttl = self.ttl_for(value) if self.ttl_for else self.ttl
+        now = time.time()
+        # 기본 TTL보다 짧게 저장되는 값(샘플 데이터 등)은 stale 응답으로 제공하지 않음
+        stale_until = now + self.stale_ttl if ttl >= self.ttl else now + ttl
+        with self._lock:
+            self._entries[key] = (value, now + ttl, stale_until)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key, loader):
+        """캐시 조회 후 없으면 loader 실행, stale이면 즉시 반환하고 백그라운드에서 갱신"""
+        value, state = self.get(key)
+        if state == 'fresh':
+            self.hits += 1
+            return value
+        if state == 'stale':
+            self.stale_hits += 1
+            self._refresh_in_background(key, loader)
+            return value
+
+        self.misses += 1
+        value = loader()
+        self.set(key, value)
+        return value
+
+    def _refresh_in_background(self, key, loader):
+        """같은 키에 대해 갱신 스레드는 하나만 실행"""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self.set(key, loader())
+            except Exception as e:
+                print(f"캐시 백그라운드 갱신 실패 ({key}): {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """캐시 사용 현황"""
+        total = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.hits + self.stale_hits) / total, 4) if total else 0.0
+        }
+
+class SingleFlight:
+    """같은 키에 대한 동시 호출을 하나의 실행으로 합침"""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key, func):
+        """진행 중인 호출이 있으면 그 결과를 기다려서 공유, 없으면 직접 실행"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = {"event": threading.Event(), "result": None, "error": None}
+                self._calls[key] = call
+                leader = True
+            else:
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            call["event"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+
+        try:
+            call["result"] = func()
+            return call["result"]
+        except Exception as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["event"].set()
+
+    def in_flight(self):
+        """진행 중인 키 수"""
+        return len(self._calls)
+
+def _normalize_company_name(company_name):
+    """캐시 키용 기업명 정규화 ((주), 주식회사, 공백 제거 및 소문자 변환)"""
+    name = company_name.strip().lower()
+    name = re.sub(r'\(주\)|㈜|주식회사|\(유\)|유한회사', '', name)
+    return re.sub(r'\s+', '', name)
+
+def _loose_company_key(key):
+    """정규화 키에서 구두점과 법인 표기까지 제거 (표기만 다른 같은 기업명 비교용)
+
+    "카카오페이"와 "카카오페이지"처럼 글자가 다른 이름은 같은 키가 되지 않음
+    """
+    key = re.sub(r'\(재\)|재단법인|\(사\)|사단법인', '', key)
+    key = re.sub(r'[^\w]|_', '', key)
+    return re.sub(r'(coltd|corporation|corp|inc|llc|ltd)$', '', key) or key
+
+class CompanyIndex:
+    """정규화 기업명/별칭 -> 상세 페이지 URL 로컬 색인 (JSON 파일에 저장)
+
+    변경은 메모리에 바로 반영하고 파일은 save_delay초 동안 모아서 한 번에 저장 (종료 시 flush)
+    """
+
+    def __init__(self, path=COMPANY_INDEX_PATH, save_delay=COMPANY_INDEX_SAVE_DELAY):
+        self.path = path
+        self.save_delay = save_delay
+        self._entries = {}
+        self._aliases = {}
+        self._loose = {}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._save_timer = None
+        self._dirty = False
+        self.hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        """저장된 색인 읽기"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"기업 색인 로드 실패: {e}")
+            return
+
+        for key, entry in entries.items():
+            self._entries[key] = entry
+            self._add_loose(key, key)
+            for alias in entry.get("aliases", []):
+                self._aliases[alias] = key
+                self._add_loose(alias, key)
+
+    def _add_loose(self, name_key, canonical):
+        self._loose.setdefault(_loose_company_key(name_key), set()).add(canonical)
+
+    def _remove_loose(self, name_key, canonical):
+        loose_key = _loose_company_key(name_key)
+        canonicals = self._loose.get(loose_key)
+        if canonicals:
+            canonicals.discard(canonical)
+            if not canonicals:
+                del self._loose[loose_key]
+
+    def _mark_dirty(self):
+        """저장 예약 (이미 예약되어 있으면 그 저장에 합침, 잠금을 잡은 상태에서 호출)"""
+        self._dirty = True
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(self.save_delay, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """변경된 내용이 있으면 임시 파일에 쓴 뒤 교체 (중간에 죽어도 색인이 깨지지 않도록)"""
+        with self._lock:
+            self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            data = json.dumps(self._entries, ensure_ascii=False)
+        with self._save_lock:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                temp_path = f"{self.path}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(temp_path, self.path)
+            except Exception as e:
+                print(f"기업 색인 저장 실패: {e}")
+
+    def lookup(self, company_name):
+        """기업 상세 URL 조회 (정규화 이름/별칭 일치 우선, 없으면 구두점/법인 표기만 다른 이름)"""
+        key = _normalize_company_name(company_name)
+        with self._lock:
+            canonical = key if key in self._entries else self._aliases.get(key)
+            if canonical:
+                self.hits += 1
+                return self._entries[canonical]["url"]
+
+            canonical = self._fuzzy_match(key)
+            if canonical:
+                self.fuzzy_hits += 1
+                print(f"기업 색인 표기 차이 일치: {company_name} -> {self._entries[canonical]['name']}")
+                return self._entries[canonical]["url"]
+
+        self.misses += 1
+        return None
+
+    def _fuzzy_match(self, key):
+        """구두점/법인 표기를 뺀 이름이 정확히 같은 기업 (여러 기업이면 매칭하지 않음)
+
+        글자가 다른 이름은 비슷해도 다른 기업일 수 있으므로 (카카오페이/카카오페이지) 사이트 검색으로 넘김
+        """
+        if not key:
+            return None
+        canonicals = self._loose.get(_loose_company_key(key))
+        if canonicals and len(canonicals) == 1:
+            return next(iter(canonicals))
+        return None
+
+    def record(self, company_name, url, alias=None):
+        """기업명과 상세 URL 등록 (alias는 같은 기업을 가리키는 다른 이름)"""
+        key = _normalize_company_name(company_name)
+        if not key or not url:
+            return
+        with self._lock:
+            self._record(key, company_name.strip(), url, alias)
+            self._mark_dirty()
+
+    def _record(self, key, name, url, alias=None):
+        entry = self._entries.setdefault(key, {"name": name, "url": url, "aliases": []})
+        entry["url"] = url
+        entry["updated_at"] = time.time()
+        self._add_loose(key, key)
+
+        alias_key = _normalize_company_name(alias) if alias else ''
+        if alias_key and alias_key != key and alias_key not in self._entries:
+            if alias_key not in entry["aliases"]:
+                entry["aliases"].append(alias_key)
+            self._aliases[alias_key] = key
+            self._add_loose(alias_key, key)
+
+    def record_search(self, query, links, matched_url):
+        """검색 결과 전체를 색인에 반영하고 검색어를 일치한 기업의 별칭으로 등록"""
+        with self._lock:
+            for link in links:
+                key = _normalize_company_name(link["name"] or '')
+                if key and link["href"]:
+                    alias = query if link["href"] == matched_url else None
+                    self._record(key, link["name"].strip(), link["href"], alias)
+            self._mark_dirty()
+
+    def clear(self):
+        """색인 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self._loose.clear()
+            self._mark_dirty()
+
+    def forget(self, company_name):
+        """상세 페이지가 더 이상 유효하지 않은 기업 삭제"""
+        key = _normalize_company_name(company_name)
+        with self._lock:
+            canonical = key if key in self._entries else self._aliases.get(key) or self._fuzzy_match(key)
+            if not canonical:
+                return
+            entry = self._entries.pop(canonical)
+            self._remove_loose(canonical, canonical)
+            for alias in entry.get("aliases", []):
+                self._aliases.pop(alias, None)
+                self._remove_loose(alias, canonical)
+            self._mark_dirty()
+
+    def stats(self):
+        """색인 사용 현황"""
+        return {
+            "entries": len(self._entries),
+            "aliases": len(self._aliases),
+            "hits": self.hits,
+            "fuzzy_hits": self.fuzzy_hits,
+            "misses": self.misses
+        }
+
+class ReviewStore:
+    """기업 리뷰 로컬 저장소 (SQLite, 기업별 워터마크로 이미 저장된 리뷰 이후만 수집)
+
+    리뷰는 (review_date, review_id) 내림차순으로 조회하며 마지막 항목을 커서로 사용
+    """
+
+    def __init__(self, path=REVIEW_STORE_PATH):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        """첫 사용 시 DB 파일과 테이블 생성"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS reviews (
+                    company_key TEXT NOT NULL,
+                    review_id TEXT NOT NULL,
+                    review_date TEXT NOT NULL DEFAULT '',
+                    data TEXT NOT NULL,
+                    first_seen_at REAL NOT NULL,
+                    PRIMARY KEY (company_key, review_id)
+                );
+                CREATE INDEX IF NOT EXISTS reviews_recent ON reviews (company_key, review_date DESC, review_id DESC);
+                CREATE TABLE IF NOT EXISTS review_watermarks (
+                    company_key TEXT PRIMARY KEY,
+                    company_name TEXT NOT NULL,
+                    newest_date TEXT,
+                    newest_review_id TEXT,
+                    backfill_page INTEGER,
+                    review_count INTEGER NOT NULL DEFAULT 0,
+                    last_crawled_at REAL
+                );
+            """)
+            self._conn = conn
+        return self._conn
+
+    def watermark(self, company_key):
+        """기업의 수집 워터마크 (한 번도 수집하지 않았으면 None)
+
+        backfill_page는 이전 수집이 페이지 한도로 끝까지 읽지 못했을 때 이어서 읽을 페이지
+        """
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT company_name, newest_date, newest_review_id, backfill_page, review_count, last_crawled_at "
+                "FROM review_watermarks WHERE company_key = ?", (company_key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "company_name": row[0],
+            "newest_date": row[1],
+            "newest_review_id": row[2],
+            "backfill_page": row[3],
+            "review_count": row[4],
+            "last_crawled_at": row[5]
+        }
+
+    def add(self, company_key, reviews):
+        """새 리뷰 저장 후 (추가된 수, 이미 저장되어 있던 리뷰 ID 집합) 반환"""
+        if not reviews:
+            return 0, set()
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            placeholders = ','.join('?' for _ in reviews)
+            known = {row[0] for row in conn.execute(
+                f"SELECT review_id FROM reviews WHERE company_key = ? AND review_id IN ({placeholders})",
+                [company_key] + [review["review_id"] for review in reviews]
+            )}
+            new_reviews = [review for review in reviews if review["review_id"] not in known]
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO reviews (company_key, review_id, review_date, data, first_seen_at) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (company_key, review["review_id"], review.get("review_date") or '', json.dumps(review, ensure_ascii=False), now)
+                        for review in new_reviews
+                    ]
+                )
+        return len(new_reviews), known
+
+    def mark_crawled(self, company_key, company_name, backfill_page):
+        """수집 종료 시 최신 리뷰 기준 워터마크 갱신"""
+        with self._lock:
+            conn = self._connection()
+            newest = conn.execute(
+                "SELECT review_date, review_id FROM reviews WHERE company_key = ? ORDER BY review_date DESC, review_id DESC LIMIT 1",
+                (company_key,)
+            ).fetchone() or (None, None)
+            count = conn.execute("SELECT COUNT(*) FROM reviews WHERE company_key = ?", (company_key,)).fetchone()[0]
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO review_watermarks "
+                    "(company_key, company_name, newest_date, newest_review_id, backfill_page, review_count, last_crawled_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (company_key, company_name, newest[0], newest[1], backfill_page, count, time.time())
+                )
+
+    def page(self, company_key, limit, cursor=None):
+        """최신순 리뷰 한 페이지와 다음 커서 반환 (커서가 잘못되면 ValueError)"""
+        params = [company_key]
+        condition = ''
+        if cursor:
+            review_date, review_id = self._decode_cursor(cursor)
+            condition = "AND (review_date < ? OR (review_date = ? AND review_id < ?))"
+            params += [review_date, review_date, review_id]
+
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT review_date, review_id, data FROM reviews WHERE company_key = ? {condition} "
+                "ORDER BY review_date DESC, review_id DESC LIMIT ?",
+                params + [limit + 1]
+            ).fetchall()
+
+        next_cursor = self._encode_cursor(rows[limit - 1][0], rows[limit - 1][1]) if len(rows) > limit else None
+        return [json.loads(row[2]) for row in rows[:limit]], next_cursor
+
+    def recent(self, company_key, limit):
+        """최근 리뷰 limit개 (저장소를 열 수 없으면 빈 목록)"""
+        try:
+            return self.page(company_key, limit)[0]
+        except Exception as e:
+            print(f"리뷰 저장소 조회 실패: {e}")
+            return []
+
+    @staticmethod
+    def _encode_cursor(review_date, review_id):
+        return base64.urlsafe_b64encode(json.dumps([review_date, review_id]).encode('utf-8')).decode('ascii')
+
+    @staticmethod
+    def _decode_cursor(cursor):
+        try:
+            review_date, review_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            return str(review_date), str(review_id)
+        except Exception:
+            raise ValueError("잘못된 커서입니다.")
+
+    def clear(self):
+        """저장된 리뷰와 워터마크 모두 삭제"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM reviews")
+                conn.execute("DELETE FROM review_watermarks")
+
+    def stats(self):
+        """저장소 현황"""
+        with self._lock:
+            conn = self._connection()
+            reviews = conn.execute("SELECT COUNT(*) FROM reviews").fetchone()[0]
+            companies = conn.execute("SELECT COUNT(*) FROM review_watermarks").fetchone()[0]
+        return {"reviews": reviews, "companies": companies}
+
+class PageArchive:
+    """추출한 페이지의 최종 HTML과 메타데이터를 보관하는 추가 전용 압축 아카이브
+
+    페이지마다 JSON 한 줄을 gzip 멤버 하나로 압축해서 세그먼트 파일 끝에 덧붙임
+    (이어 붙인 gzip 멤버는 하나의 gzip 스트림으로 읽히고, 쓰다 끊긴 마지막 멤버는 읽을 때 건너뜀)
+    """
+
+    def __init__(self, directory=PAGE_ARCHIVE_DIR, recording=PAGE_ARCHIVE_MODE == 'record',
+                 segment_bytes=PAGE_ARCHIVE_SEGMENT_MB * 1024 * 1024, page_types=PAGE_ARCHIVE_PAGE_TYPES):
+        self.directory = directory
+        self.recording = recording
+        self.segment_bytes = segment_bytes
+        self.page_types = set(page_types or [])
+        self.written = 0
+        self.write_errors = 0
+        self._segment = None
+        self._lock = threading.Lock()
+
+    def records(self, page_type):
+        """이 페이지 종류를 기록하는지 여부"""
+        return self.recording and (not self.page_types or page_type in self.page_types)
+
+    def _segment_path(self):
+        """현재 세그먼트 경로 (크기를 넘으면 새 세그먼트로 교체)"""
+        if self._segment is None or os.path.getsize(self._segment) >= self.segment_bytes:
+            os.makedirs(self.directory, exist_ok=True)
+            stamp = datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')
+            self._segment = os.path.join(self.directory, f"pages-{stamp}-{os.getpid()}-{uuid.uuid4().hex[:6]}.jsonl.gz")
+        return self._segment
+
+    def record(self, page_type, url, html, source, extracted, base_url=None):
+        """페이지 하나 기록 (url은 실제로 받은 페이지 주소, base_url은 추출 때 링크 해석 기준이 다를 때만)"""
+        entry = {
+            "page_type": page_type,
+            "url": url,
+            "base_url": base_url or url,
+            "source": source,
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "html": html,
+            "extracted": extracted
+        }
+        try:
+            member = gzip.compress((json.dumps(entry, ensure_ascii=False) + "\n").encode('utf-8'))
+            with self._lock:
+                with open(self._segment_path(), 'ab') as f:
+                    f.write(member)
+                self.written += 1
+            metrics.inc('catch_page_archive_records_total', page_type=page_type, source=source)
+        except Exception as e:
+            self.write_errors += 1
+            print(f"페이지 기록 실패 ({url}): {e}")
+
+    def segments(self):
+        """세그먼트 파일 목록 (기록 순서)"""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            os.path.join(self.directory, name) for name in os.listdir(self.directory)
+            if name.startswith('pages-') and name.endswith('.jsonl.gz')
+        )
+
+    def iter_records(self, page_types=None):
+        """기록된 페이지를 순서대로 읽기 (page_types로 종류 제한)"""
+        for path in self.segments():
+            try:
+                with gzip.open(path, 'rt', encoding='utf-8') as f:
+                    for line in f:
+                        entry = json.loads(line)
+                        if not page_types or entry["page_type"] in page_types:
+                            yield entry
+            except (EOFError, OSError, ValueError) as e:
+                # 기록 도중 종료되어 마지막 멤버가 잘린 세그먼트는 읽을 수 있는 데까지만 사용
+                print(f"페이지 아카이브 세그먼트 일부를 읽지 못했습니다 ({os.path.basename(path)}): {e}")
+
+    def stats(self):
+        """아카이브 현황"""
+        segments = self.segments()
+        return {
+            "recording": self.recording,
+            "directory": self.directory,
+            "segments": len(segments),
+            "bytes": sum(os.path.getsize(path) for path in segments),
+            "written": self.written,
+            "write_errors": self.write_errors
+        }
+
+def _is_empty_extraction(extracted):
+    """필드와 목록이 모두 비어 있는지 (선택자가 깨졌을 때의 모습)"""
+    return not any(value for value in extracted.values())
+
+def _replay_entries(entries):
+    """기록된 페이지를 브라우저 없이 다시 추출 (프로세스 풀 작업 단위)"""
+    results = []
+    for entry in entries:
+        result = {
+            "page_type": entry["page_type"],
+            "url": entry["url"],
+            "source": entry["source"],
+            "recorded_at": entry["recorded_at"],
+            "recorded": entry.get("extracted")
+        }
+        try:
+            base_url = entry.get("base_url") or entry["url"]
+            tree = lxml_html.fromstring(entry["html"], base_url=base_url)
+            result["extracted"] = _extract_tree(tree, entry["page_type"], base_url)
+            result["empty"] = _is_empty_extraction(result["extracted"])
+            result["changed"] = result["extracted"] != result["recorded"]
+            result["error"] = None
+        except Exception as e:
+            result.update(extracted=None, empty=True, changed=True, error=f"{type(e).__name__}: {e}")
+        results.append(result)
+    return results
+
+def replay_page_archive(archive=None, page_types=None, workers=None, chunk_size=32):
+    """아카이브의 모든 페이지를 현재 추출 명세로 다시 추출 (여러 프로세스에서 병렬, 기록 순서대로 결과 반환)
+
+    읽기와 제출을 작업 수의 두 배까지만 앞서 나가서 아카이브가 커도 메모리를 일정하게 사용
+    """
+    if lxml_html is None:
+        raise RuntimeError("다시 추출하려면 lxml이 필요합니다.")
+    archive = archive or page_archive
+    workers = workers or os.cpu_count() or 1
+    entries = archive.iter_records(page_types)
+
+    def chunks():
+        chunk = []
+        for entry in entries:
+            chunk.append(entry)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = OrderedDict()
+        for index, chunk in enumerate(chunks()):
+            pending[index] = executor.submit(_replay_entries, chunk)
+            while len(pending) >= workers * 2:
+                yield from pending.popitem(last=False)[1].result()
+        while pending:
+            yield from pending.popitem(last=False)[1].result()
+
+def summarize_replay(results):
+    """다시 추출한 결과를 페이지 종류별 (페이지 수, 빈 추출, 기록 시점과 달라진 수, 오류) 요약"""
+    summary = {}
+    for result in results:
+        counts = summary.setdefault(result["page_type"], {"pages": 0, "empty": 0, "changed": 0, "errors": 0})
+        counts["pages"] += 1
+        counts["empty"] += result["empty"]
+        counts["changed"] += result["changed"]
+        counts["errors"] += result["error"] is not None
+    return summary
+
+# 전역 드라이버 풀과 감시 스레드
+driver_pool = DriverPool()
+driver_watchdog = DriverWatchdog(driver_pool)
+
+# 기업명 -> 상세 페이지 URL 색인
+company_index = CompanyIndex()
+
+# 기업 정보 캐시 (샘플 데이터는 짧은 TTL)
+company_cache = ResultCache(
+    ttl=COMPANY_CACHE_TTL,
+    stale_ttl=COMPANY_CACHE_STALE_TTL,
+    max_entries=COMPANY_CACHE_MAX_ENTRIES,
+    ttl_for=lambda result: COMPANY_CACHE_FALLBACK_TTL if result.get("is_sample") else COMPANY_CACHE_TTL
+)
+
+# 같은 기업에 대한 동시 스크래핑 합치기
+company_flights = SingleFlight()
+
+# 기업 리뷰 저장소와 같은 기업에 대한 동시 리뷰 수집 합치기
+review_store = ReviewStore()
+review_flights = SingleFlight()
+
+# 일괄 기업 조회용 작업 스레드
+company_batch_executor = ThreadPoolExecutor(max_workers=COMPANY_BATCH_WORKERS, thread_name_prefix='company-batch')
+
+# 직렬화한 응답 본문 캐시 (엔드포인트별 키 -> 본문, ETag, 압축본)
+payload_cache = ResultCache(
+    ttl=SERVE_PAYLOAD_CACHE_TTL,
+    stale_ttl=SERVE_PAYLOAD_CACHE_TTL,
+    max_entries=SERVE_PAYLOAD_CACHE_MAX_ENTRIES
+)
+
+# 공고 상세 캐시 (URL 기준, 샘플 데이터는 짧은 TTL)와 동시 요청 합치기, 일괄 조회용 작업 스레드
+job_detail_cache = ResultCache(
+    ttl=JOB_DETAIL_CACHE_TTL,
+    stale_ttl=JOB_DETAIL_CACHE_STALE_TTL,
+    max_entries=JOB_DETAIL_CACHE_MAX_ENTRIES,
+    ttl_for=lambda result: COMPANY_CACHE_FALLBACK_TTL if result.get("is_sample") else JOB_DETAIL_CACHE_TTL
+)
+job_detail_flights = SingleFlight()
+job_detail_executor = ThreadPoolExecutor(max_workers=JOB_DETAIL_BATCH_WORKERS, thread_name_prefix='job-detail')
+
+# 직무 카테고리 동시 수집용 작업 스레드
+job_crawl_executor = ThreadPoolExecutor(max_workers=JOB_CRAWL_WORKERS, thread_name_prefix='job-crawl')
+
+# 드라이버가 필요 없는 샘플 데이터 엔드포인트용 인스턴스
+content_scraper = CatchScraper()
+
+# 로그인 쿠키 저장소와 폼 로그인 직렬화용 잠금 (한 세션의 로그인을 모든 세션이 재사용)
+login_cookies = LoginCookieJar()
+login_lock = threading.Lock()
+
+# 브라우저 없이 동작하는 HTTP 스크래퍼 (로그인 쿠키는 저장된 쿠키와 브라우저 세션에서 공유)
+http_scraper = HttpScraper()
+http_scraper.load_cookies(login_cookies.get(CATCH_USERNAME) or [])
+
+def _scrape_company_info(company_name):
+    """기업 정보 스크래핑 (색인에 있으면 검색 생략, HTTP 빠른 경로 우선, JS가 필요한 페이지만 브라우저 사용)"""
+    indexed_url = company_index.lookup(company_name)
+    if indexed_url:
+        result = _scrape_company_detail(indexed_url, company_name)
+        if not result.get("is_sample"):
+            return result
+        # 색인된 상세 페이지가 더 이상 유효하지 않으면 색인에서 지우고 검색부터 다시 진행
+        company_index.forget(company_name)
+
+    company_url = http_scraper.find_company_url(company_name) if http_scraper.enabled else None
+    if company_url == '':
+        return content_scraper._sample_company_result(company_name, f"'{company_name}' 기업 정보 (샘플 데이터)", 'not_found')
+
+    # 검색 결과는 HTTP로 찾았으면 상세 페이지만 처리
+    if company_url:
+        return _scrape_company_detail(company_url, company_name)
+
+    with driver_pool.session() as scraper:
+        _prepare_browser_session(scraper)
+        return scraper.search_company_info(company_name)
+
+def _scrape_company_detail(company_url, company_name):
+    """상세 페이지만 스크래핑 (HTTP 우선, JS가 필요하면 브라우저)"""
+    if http_scraper.enabled:
+        result = http_scraper.extract_company_detail(company_url, company_name)
+        if result is not None:
+            return result
+
+    with driver_pool.session() as scraper:
+        _prepare_browser_session(scraper)
+        return scraper._extract_company_detail(company_url, company_name)
+
+def _prepare_browser_session(scraper):
+    """브라우저 세션 준비 후 로그인 쿠키를 HTTP 세션과 공유"""
+    if not scraper.ensure_ready():
+        raise RuntimeError("드라이버 초기화에 실패했습니다.")
+    if scraper.is_logged_in:
+        http_scraper.sync_cookies(scraper.driver)
+
+def get_company_info(company_name):
+    """캐시를 거쳐 기업 정보 조회 (같은 기업의 동시 스크래핑은 하나로 합침)"""
+    key = _normalize_company_name(company_name)
+    return company_cache.get_or_load(
+        key,
+        lambda: company_flights.do(key, lambda: _scrape_company_info(company_name))
+    )
+
+def iter_company_batch(company_names):
+    """여러 기업을 병렬 조회해서 끝나는 순서대로 yield"""
+    futures = {
+        company_batch_executor.submit(get_company_info, company_name): (index, company_name)
+        for index, company_name in enumerate(company_names)
+    }
+    for future in as_completed(futures):
+        index, company_name = futures[future]
+        try:
+            yield {"type": "result", "index": index, "company_name": company_name, "result": future.result()}
+        except Exception as e:
+            yield {"type": "error", "index": index, "company_name": company_name, "message": str(e)}
+
+def _company_review_url(company_url):
+    """기업 상세 URL의 기업 ID로 리뷰 목록 URL 구성 (ID가 없으면 None)"""
+    match = re.search(r'/(\d+)(?:[/?#]|$)', company_url or '')
+    if not match:
+        return None
+    return urljoin(BASE_URL, COMPANY_REVIEW_PATH.format(company_id=match.group(1)))
+
+def _resolve_company_url(company_name):
+    """기업 상세 URL 조회 (색인에 없으면 기업 정보 조회로 색인을 채운 뒤 다시 조회)"""
+    company_url = company_index.lookup(company_name)
+    if not company_url:
+        get_company_info(company_name)
+        company_url = company_index.lookup(company_name)
+    return company_url
+
+def _iter_review_pages(review_url, start_page):
+    """리뷰 목록 페이지 순회 (HTTP 우선, 목록이 서버에서 렌더링되지 않으면 브라우저)"""
+    if http_scraper.enabled:
+        pages = http_scraper.iter_review_pages(review_url, start_page)
+        first = next(pages, None)
+        if first is not None:
+            yield first
+            yield from pages
+            return
+
+    with driver_pool.session() as scraper:
+        _prepare_browser_session(scraper)
+        yield from scraper.iter_review_pages(review_url, start_page)
+
+def _store_review_pages(company_key, review_url, start_page, page_budget, watermark=None):
+    """start_page부터 리뷰를 저장하며 페이지를 넘김
+
+    watermark가 있으면 이미 저장된 리뷰나 워터마크보다 오래된 리뷰가 나온 페이지에서 중단
+    반환: (추가된 리뷰 수, 읽은 페이지 수, 다음에 이어서 읽을 페이지 - 마지막 페이지까지 읽었으면 None)
+    """
+    added = read = 0
+    next_page = start_page
+    with closing(_iter_review_pages(review_url, start_page)) as pages:
+        for page, reviews, has_next in pages:
+            read += 1
+            next_page = page + 1
+            count, known = review_store.add(company_key, reviews)
+            added += count
+            if not reviews or not has_next:
+                return added, read, None
+            if watermark and (known or any((review.get("review_date") or '') < (watermark["newest_date"] or '') for review in reviews)):
+                return added, read, next_page
+            if read >= page_budget:
+                return added, read, next_page
+    return added, read, next_page
+
+def crawl_company_reviews(company_name, max_pages=REVIEW_CRAWL_MAX_PAGES):
+    """기업 리뷰 증분 수집
+
+    최신 리뷰부터 읽다가 이미 저장된 리뷰를 만나면 중단하고, 이전 수집이 페이지 한도로
+    끝까지 가지 못했으면 멈췄던 페이지부터 남은 한도만큼 이어서 읽음
+    """
+    company_key = _normalize_company_name(company_name)
+    review_url = _company_review_url(_resolve_company_url(company_name))
+    if not review_url:
+        return {"success": False, "company_name": company_name, "message": f"'{company_name}' 기업의 리뷰 페이지를 찾을 수 없습니다."}
+
+    started = time.perf_counter()
+    watermark = review_store.watermark(company_key)
+    if watermark is None:
+        added, read, backfill_page = _store_review_pages(company_key, review_url, 1, max_pages)
+    else:
+        added, read, _ = _store_review_pages(company_key, review_url, 1, max_pages, watermark)
+        backfill_page = watermark["backfill_page"]
+        if backfill_page and read < max_pages:
+            more, more_read, backfill_page = _store_review_pages(company_key, review_url, backfill_page, max_pages - read)
+            added += more
+            read += more_read
+
+    review_store.mark_crawled(company_key, company_name, backfill_page)
+    metrics.observe('catch_scrape_stage_seconds', time.perf_counter() - started, stage='reviews', path='crawl')
+    metrics.inc('catch_review_pages_total', read)
+    metrics.inc('catch_reviews_added_total', added)
+    print(f"[{company_name}] 리뷰 {read}페이지 확인, 새 리뷰 {added}개 저장")
+
+    return {
+        "success": True,
+        "company_name": company_name,
+        "added": added,
+        "pages": read,
+        "complete": backfill_page is None,
+        "watermark": review_store.watermark(company_key),
+        "message": f"새 리뷰 {added}개 저장"
+    }
+
+def refresh_company_reviews(company_name, max_pages=REVIEW_CRAWL_MAX_PAGES):
+    """같은 기업의 동시 리뷰 수집을 하나로 합쳐서 실행"""
+    key = _normalize_company_name(company_name)
+    return review_flights.do(key, lambda: crawl_company_reviews(company_name, max_pages))
+
+def _normalize_job_url(job_url):
+    """공고 URL을 사이트 기준 절대 URL로 변환 (다른 사이트 URL은 ValueError)"""
+    job_url = urljoin(BASE_URL, (job_url or '').strip())
+    if urlparse(job_url).netloc != urlparse(BASE_URL).netloc:
+        raise ValueError(f"캐치 공고 URL만 조회할 수 있습니다: {job_url}")
+    return job_url
+
+def _scrape_job_detail(job_url):
+    """공고 상세 스크래핑 (HTTP 조건부 요청 우선, JS가 필요한 페이지만 브라우저)"""
+    previous, _ = job_detail_cache.get(job_url)
+    if http_scraper.enabled:
+        result = http_scraper.fetch_job_detail(job_url, previous if previous and not previous.get("is_sample") else None)
+        if result is not None:
+            return result
+
+    with driver_pool.session() as scraper:
+        _prepare_browser_session(scraper)
+        return scraper.get_job_detail(job_url)
+
+def fetch_job_detail(job_url):
+    """캐시를 거쳐 공고 상세 조회 (만료 항목은 stale 응답 후 백그라운드 재검증, 같은 URL 동시 요청은 하나로 합침)"""
+    job_url = _normalize_job_url(job_url)
+    result = job_detail_cache.get_or_load(
+        job_url,
+        lambda: job_detail_flights.do(job_url, lambda: _scrape_job_detail(job_url))
+    )
+    # 재검증용 헤더 값은 응답에서 제외
+    return {key: value for key, value in result.items() if key != "validators"}
+
+def iter_job_detail_batch(job_urls):
+    """여러 공고 상세를 제한된 동시성으로 조회해서 끝나는 순서대로 yield"""
+    futures = {
+        job_detail_executor.submit(fetch_job_detail, job_url): (index, job_url)
+        for index, job_url in enumerate(job_urls)
+    }
+    for future in as_completed(futures):
+        index, job_url = futures[future]
+        try:
+            yield {"type": "result", "index": index, "job_url": job_url, "result": future.result()}
+        except Exception as e:
+            yield {"type": "error", "index": index, "job_url": job_url, "message": str(e)}
+
+def _select_job_categories(names=None):
+    """요청한 카테고리(SELECTORS 키 또는 응답 키)만 설정 순서대로 반환 (지정하지 않으면 전체)"""
+    if not names:
+        return list(JOB_CATEGORIES)
+    wanted = set(names)
+    selected = [(category_key, result_key) for category_key, result_key in JOB_CATEGORIES if category_key in wanted or result_key in wanted]
+    if not selected:
+        raise ValueError(f"지원하지 않는 카테고리입니다: {', '.join(names)}")
+    return selected
+
+def _crawl_job_category(category_key, result_key, max_pages, events, stop, pool_errors, session):
+    """카테고리 하나를 별도 드라이버 세션에서 수집해서 이벤트 대기열에 넣음"""
+    try:
+        with session() as scraper:
+            if not scraper.ensure_ready():
+                raise RuntimeError("드라이버 초기화에 실패했습니다.")
+            for page, jobs in scraper.iter_job_pages(category_key, max_pages):
+                events.put({"type": "page", "category": result_key, "page": page, "jobs": jobs})
+                if stop.is_set():
+                    break
+    except (DriverPoolTimeout, DriverPoolFull) as e:
+        pool_errors.append(e)
+        events.put({"type": "error", "category": result_key, "message": str(e)})
+    except Exception as e:
+        print(f"[{category_key}] 공고 수집 중 오류: {e}")
+        events.put({"type": "error", "category": result_key, "message": str(e)})
+
+def _crawl_job_categories(pending, max_pages, events, stop, pool_errors, session):
+    """대기 중인 카테고리를 하나씩 꺼내 수집 (세션은 카테고리마다 반납, 끝나면 None)"""
+    try:
+        while not stop.is_set():
+            try:
+                category_key, result_key = pending.get_nowait()
+            except queue.Empty:
+                break
+            _crawl_job_category(category_key, result_key, max_pages, events, stop, pool_errors, session)
+    finally:
+        events.put(None)
+
+def iter_homepage_jobs(max_pages=HOMEPAGE_JOBS_MAX_PAGES, categories=None, max_sessions=None, session=None):
+    """카테고리별 공고를 페이지가 수집되는 대로 yield하는 파이프라인
+
+    카테고리마다 별도 드라이버 세션에서 수집하되, 동시에 수집하는 카테고리 수는 시작 시점의
+    유휴 세션 수로 제한 (최소 1) - 나머지는 앞 카테고리가 세션을 반납하면 이어서 수집하므로
+    다른 요청과 세션을 다투다 대여 시간 초과로 빠지지 않음
+    max_sessions로 동시 세션 수를 더 줄이거나, session으로 풀 대신 다른 세션 대여 방법을 지정
+    모든 카테고리가 세션을 얻지 못하면 풀 예외를 그대로 발생
+    """
+    selected = _select_job_categories(categories)
+    events = queue.Queue()
+    stop = threading.Event()
+    pool_errors = []
+    pending = queue.Queue()
+    for category in selected:
+        pending.put(category)
+    workers = max(1, min(len(selected), driver_pool.available(), max_sessions or len(selected)))
+    for _ in range(workers):
+        job_crawl_executor.submit(_crawl_job_categories, pending, max_pages, events, stop, pool_errors, session or driver_pool.session)
+
+    remaining = workers
+    try:
+        while remaining:
+            event = events.get()
+            if event is None:
+                remaining -= 1
+                continue
+            yield event
+    finally:
+        # 소비자가 중간에 멈추면 남은 카테고리는 현재 페이지까지만 수집하고 세션 반납
+        stop.set()
+
+    if len(pool_errors) == len(selected):
+        raise pool_errors[0]
+
+def _merge_job_postings(postings, category, jobs):
+    """공고 ID 기준으로 카테고리 간 중복 제거
+
+    categories에는 공고가 나온 모든 카테고리를 설정 순서로 기록하고, 내용과 category는
+    설정 순서상 가장 앞선 카테고리 기준으로 유지 (수집 완료 순서와 무관하게 결과가 같도록)
+    """
+    for job in jobs:
+        existing = postings.get(job["job_id"])
+        categories = sorted(set(existing["categories"] if existing else []) | {category}, key=lambda key: JOB_CATEGORY_ORDER.get(key, len(JOB_CATEGORY_ORDER)))
+        if existing is None or categories[0] == category:
+            postings[job["job_id"]] = dict(job, category=category, categories=categories)
+        else:
+            existing["categories"] = categories
+    return postings
+
+def _collect_homepage_jobs(max_pages, categories=None):
+    """스트리밍 파이프라인을 모아서 카테고리별 목록, 중복 제거된 공고 목록, 오류 목록으로 변환"""
+    selected = _select_job_categories(categories)
+    results = {result_key: [] for _, result_key in selected}
+    postings = OrderedDict()
+    errors = []
+    for event in iter_homepage_jobs(max_pages, categories):
+        if event["type"] == "page":
+            results[event["category"]].extend(event["jobs"])
+            _merge_job_postings(postings, event["category"], event["jobs"])
+        else:
+            errors.append(event)
+    return results, list(postings.values()), errors
+
+def _encode_stream_event(event, fmt):
+    """이벤트를 NDJSON 한 줄 또는 SSE 메시지로 직렬화"""
+    payload = json.dumps(event, ensure_ascii=False)
+    if fmt == 'sse':
+        return f"event: {event['type']}\ndata: {payload}\n\n"
+    return payload + "\n"
+
+def _stream_response(events, fmt):
+    """이벤트 제너레이터를 스트리밍 응답으로 변환"""
+    mimetype = 'text/event-stream' if fmt == 'sse' else 'application/x-ndjson'
+    response = Response(stream_with_context(events), mimetype=mimetype)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+def _stream_homepage_jobs(max_pages, fmt, categories=None):
+    """파이프라인 이벤트를 NDJSON 또는 SSE 형식으로 직렬화 (done 이벤트에 중복 제거 후 공고 수 포함)"""
+    counts = {}
+    job_ids = set()
+
+    def encode(event):
+        return _encode_stream_event(event, fmt)
+
+    try:
+        counts = {result_key: 0 for _, result_key in _select_job_categories(categories)}
+        for event in iter_homepage_jobs(max_pages, categories):
+            if event["type"] == "page":
+                counts[event["category"]] += len(event["jobs"])
+                job_ids.update(job["job_id"] for job in event["jobs"])
+            yield encode(event)
+        yield encode({"type": "done", "counts": counts, "unique": len(job_ids)})
+    except (DriverPoolTimeout, DriverPoolFull) as e:
+        yield encode({"type": "error", "message": str(e), "pool": driver_pool.stats()})
+    except Exception as e:
+        yield encode({"type": "error", "message": str(e)})
+
+def _job_fingerprint(job):
+    """공고 내용 비교용 해시"""
+    return hashlib.md5(json.dumps(job, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+class JobSnapshot:
+    """공고 ID 기준 메모리 스냅샷 (버전별 지문을 보관해서 증분 diff 제공)"""
+
+    def __init__(self, history=JOB_SNAPSHOT_HISTORY):
+        self.postings = {}
+        self.version = 0
+        self.generated_at = None
+        self.last_error = None
+        self._history = OrderedDict()
+        self._history_size = history
+        self._lock = threading.Lock()
+
+    def is_ready(self):
+        """한 번 이상 수집이 끝났는지 여부"""
+        return self.version > 0
+
+    def replace(self, postings):
+        """새 수집 결과로 교체하고 직전 버전과의 diff 반환"""
+        generated_at = datetime.now(timezone.utc).isoformat()
+        fingerprints = {job_id: _job_fingerprint(job) for job_id, job in postings.items()}
+        with self._lock:
+            previous_version = self.version
+            self.postings = postings
+            self.version += 1
+            self.generated_at = generated_at
+            self._history[self.version] = fingerprints
+            while len(self._history) > self._history_size:
+                self._history.popitem(last=False)
+        return self.diff_since(previous_version)
+
+    def jobs(self):
+        """중복 제거된 전체 공고 목록"""
+        with self._lock:
+            return list(self.postings.values())
+
+    def results(self, categories=None):
+        """기존 homepage-jobs 응답 형태(카테고리별 목록)로 변환 (여러 카테고리 공고는 각 목록에 포함)"""
+        results = {result_key: [] for _, result_key in _select_job_categories(categories)}
+        for job in self.jobs():
+            for category in job.get("categories", [job["category"]]):
+                if category in results:
+                    results[category].append(job)
+        return results
+
+    def diff_since(self, version):
+        """지정 버전 이후 추가/삭제/변경된 공고 (보관 범위를 벗어나면 full_resync)"""
+        with self._lock:
+            current = self._history.get(self.version, {})
+            postings = self.postings
+            diff = {
+                "from_version": version,
+                "to_version": self.version,
+                "generated_at": self.generated_at,
+                "full_resync": False,
+                "added": [],
+                "removed": [],
+                "changed": []
+            }
+
+            if version == self.version:
+                return diff
+
+            if version == 0:
+                previous = {}
+            elif version in self._history:
+                previous = self._history[version]
+            else:
+                diff["full_resync"] = True
+                diff["added"] = list(postings.values())
+                return diff
+
+            for job_id, fingerprint in current.items():
+                if job_id not in previous:
+                    diff["added"].append(postings[job_id])
+                elif previous[job_id] != fingerprint:
+                    diff["changed"].append(postings[job_id])
+            diff["removed"] = [job_id for job_id in previous if job_id not in current]
+            return diff
+
+def _job_career_type(career_level):
+    """경력 문구를 신입/경력/신입·경력/경력무관 중 하나로 분류 (알 수 없으면 빈 문자열)"""
+    if '무관' in career_level:
+        return '경력무관'
+    if '신입' in career_level and '경력' in career_level:
+        return '신입·경력'
+    if '신입' in career_level:
+        return '신입'
+    if '경력' in career_level:
+        return '경력'
+    return ''
+
+def _job_deadline(text, now=None):
+    """마감 문구("D-12", "~10.31", "2024.10.31", "오늘마감", "상시채용")를 YYYY-MM-DD로 변환 (상시/알 수 없으면 빈 문자열)"""
+    now = now or datetime.now()
+    if '오늘' in text or re.search(r'D-?day', text, re.IGNORECASE):
+        return now.strftime('%Y-%m-%d')
+    match = re.search(r'D-(\d+)', text)
+    if match:
+        return (now + timedelta(days=int(match.group(1)))).strftime('%Y-%m-%d')
+    match = re.search(r'(\d{4})[./-](\d{1,2})[./-](\d{1,2})', text)
+    if match:
+        return f"{match.group(1)}-{int(match.group(2)):02d}-{int(match.group(3)):02d}"
+    match = re.search(r'~\s*(\d{1,2})[./](\d{1,2})', text)
+    if match:
+        month, day = int(match.group(1)), int(match.group(2))
+        # 연도가 없는 날짜는 가장 가까운 미래로 해석 (12월에 본 "~01.15"는 다음 해)
+        year = now.year + 1 if month < now.month - 6 else now.year
+        return f"{year}-{month:02d}-{day:02d}"
+    return ''
+
+def _job_index_fields(job, now=None):
+    """목록 행의 문구 배열에서 색인용 필드(지역, 경력, 고용형태, 마감일) 추출"""
+    texts = [text.strip() for key in ('conditions', 'job_info', 'registration_info') for text in job.get(key) or [] if text and text.strip()]
+    location = next((text for text in texts if text.split()[0] in JOB_REGIONS), '')
+    career_level = next((text for text in texts if '경력' in text or '신입' in text), '')
+    job_type = next((job_type for text in texts for job_type in JOB_TYPES if job_type in text), '')
+    deadline = next((deadline for deadline in (_job_deadline(text, now) for text in job.get('registration_info') or []) if deadline), '')
+    return {
+        "location": location,
+        "region": location.split()[0] if location else '',
+        "career_level": career_level,
+        "career_type": _job_career_type(career_level),
+        "job_type": job_type,
+        "deadline": deadline
+    }
+
+class JobIndex:
+    """수집한 공고 검색 색인 (SQLite, 제목/기업/지역/경력/직무 문구 전문 검색 + 필터/정렬/커서)
+
+    FTS5를 쓸 수 없는 SQLite 빌드에서는 LIKE 검색으로 대신함
+    """
+
+    # 정렬 이름 -> (정렬 컬럼, 내림차순 여부)
+    SORTS = {
+        'relevance': ('m.score', False),
+        'deadline': ('j.deadline_sort', False),
+        'recent': ('j.first_seen_at', True),
+        'company': ('j.company', False),
+        'title': ('j.title', False)
+    }
+    FACETS = ('category', 'region', 'career_type', 'job_type')
+
+    def __init__(self, path=JOB_INDEX_PATH):
+        self.path = path
+        self.fts = False
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        """첫 사용 시 DB 파일과 테이블 생성"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY,
+                    job_id TEXT NOT NULL UNIQUE,
+                    title TEXT NOT NULL,
+                    company TEXT NOT NULL DEFAULT '',
+                    region TEXT NOT NULL DEFAULT '',
+                    career_type TEXT NOT NULL DEFAULT '',
+                    job_type TEXT NOT NULL DEFAULT '',
+                    deadline TEXT NOT NULL DEFAULT '',
+                    deadline_sort TEXT NOT NULL DEFAULT '9999-12-31',
+                    search_text TEXT NOT NULL DEFAULT '',
+                    data TEXT NOT NULL,
+                    first_seen_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS jobs_deadline ON jobs (deadline_sort, job_id);
+                CREATE INDEX IF NOT EXISTS jobs_recent ON jobs (first_seen_at DESC, job_id);
+                CREATE INDEX IF NOT EXISTS jobs_company ON jobs (company, job_id);
+                CREATE TABLE IF NOT EXISTS job_categories (
+                    job_id TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    PRIMARY KEY (job_id, category)
+                );
+                CREATE INDEX IF NOT EXISTS job_categories_category ON job_categories (category, job_id);
+            """)
+            try:
+                conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(search_text, tokenize='unicode61')")
+                self.fts = True
+            except sqlite3.OperationalError as e:
+                print(f"FTS5를 사용할 수 없어 LIKE 검색으로 대신합니다: {e}")
+            self._conn = conn
+        return self._conn
+
+    def _upsert(self, conn, jobs, now):
+        """공고 저장 (처음 본 시각은 유지), 저장한 공고 ID 집합 반환"""
+        job_ids = set()
+        for job in jobs:
+            fields = _job_index_fields(job)
+            row = dict(job, **fields)
+            categories = job.get("categories") or [job.get("category")]
+            search_text = ' '.join(filter(None, [
+                job.get("title"), job.get("company"), fields["location"], fields["career_level"], fields["job_type"],
+                ' '.join(job.get("job_info") or []), ' '.join(JOB_CATEGORY_LABELS.get(key, key) for key, result_key in JOB_CATEGORIES if result_key in categories)
+            ]))
+            conn.execute(
+                "INSERT INTO jobs (job_id, title, company, region, career_type, job_type, deadline, deadline_sort, search_text, data, first_seen_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET title = excluded.title, company = excluded.company, region = excluded.region, "
+                "career_type = excluded.career_type, job_type = excluded.job_type, deadline = excluded.deadline, "
+                "deadline_sort = excluded.deadline_sort, search_text = excluded.search_text, data = excluded.data, updated_at = excluded.updated_at",
+                (job["job_id"], job.get("title") or '', job.get("company") or '', fields["region"], fields["career_type"], fields["job_type"],
+                 fields["deadline"], fields["deadline"] or '9999-12-31', search_text, json.dumps(row, ensure_ascii=False), now, now)
+            )
+            conn.execute("DELETE FROM job_categories WHERE job_id = ?", (job["job_id"],))
+            conn.executemany("INSERT OR IGNORE INTO job_categories (job_id, category) VALUES (?, ?)",
+                             [(job["job_id"], category) for category in categories if category])
+            if self.fts:
+                rowid = conn.execute("SELECT id FROM jobs WHERE job_id = ?", (job["job_id"],)).fetchone()[0]
+                conn.execute("DELETE FROM jobs_fts WHERE rowid = ?", (rowid,))
+                conn.execute("INSERT INTO jobs_fts (rowid, search_text) VALUES (?, ?)", (rowid, search_text))
+            job_ids.add(job["job_id"])
+        return job_ids
+
+    def upsert(self, jobs):
+        """공고 추가/갱신 (일부 카테고리만 수집한 결과용, 기존 공고는 삭제하지 않음)"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                return len(self._upsert(conn, jobs, time.time()))
+
+    def replace(self, jobs):
+        """전체 수집 결과로 교체 (이번 결과에 없는 공고는 삭제)"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                job_ids = self._upsert(conn, jobs, time.time())
+                conn.execute("CREATE TEMP TABLE IF NOT EXISTS current_jobs (job_id TEXT PRIMARY KEY)")
+                conn.execute("DELETE FROM current_jobs")
+                conn.executemany("INSERT INTO current_jobs (job_id) VALUES (?)", [(job_id,) for job_id in job_ids])
+                if self.fts:
+                    conn.execute("DELETE FROM jobs_fts WHERE rowid IN (SELECT id FROM jobs WHERE job_id NOT IN (SELECT job_id FROM current_jobs))")
+                conn.execute("DELETE FROM job_categories WHERE job_id NOT IN (SELECT job_id FROM current_jobs)")
+                removed = conn.execute("DELETE FROM jobs WHERE job_id NOT IN (SELECT job_id FROM current_jobs)").rowcount
+        return {"indexed": len(job_ids), "removed": removed}
+
+    def _match_query(self, keyword):
+        """검색어를 FTS5 질의로 변환 (단어마다 접두어 검색, 모든 단어 포함)"""
+        terms = [term.replace('"', '') for term in keyword.split()]
+        return ' '.join(f'"{term}"*' for term in terms if term)
+
+    def _filters(self, keyword, filters):
+        """(JOIN 절, WHERE 조건 목록, 인자 목록) 구성"""
+        join = ''
+        conditions = []
+        params = []
+        if keyword and self._match_query(keyword):
+            if self.fts:
+                join = "JOIN (SELECT rowid, bm25(jobs_fts) AS score FROM jobs_fts WHERE jobs_fts MATCH ?) m ON m.rowid = j.id"
+                params.append(self._match_query(keyword))
+            else:
+                for term in keyword.split():
+                    conditions.append("j.search_text LIKE ?")
+                    params.append(f"%{term}%")
+
+        if filters.get("categories"):
+            placeholders = ','.join('?' for _ in filters["categories"])
+            conditions.append(f"EXISTS (SELECT 1 FROM job_categories c WHERE c.job_id = j.job_id AND c.category IN ({placeholders}))")
+            params += filters["categories"]
+        for column in ('region', 'job_type', 'company'):
+            values = filters.get(column)
+            if values:
+                conditions.append(f"j.{column} IN ({','.join('?' for _ in values)})")
+                params += values
+        if filters.get("career"):
+            career_types = sorted({career_type for career in filters["career"] for career_type in JOB_CAREER_FILTERS.get(career, [career])})
+            conditions.append(f"j.career_type IN ({','.join('?' for _ in career_types)})")
+            params += career_types
+        if filters.get("deadline_before"):
+            conditions.append("j.deadline_sort <= ?")
+            params.append(filters["deadline_before"])
+        if not filters.get("include_expired"):
+            conditions.append("j.deadline_sort >= ?")
+            params.append(datetime.now().strftime('%Y-%m-%d'))
+        return join, conditions, params
+
+    def search(self, keyword='', filters=None, sort=None, limit=JOB_SEARCH_DEFAULT_LIMIT, cursor=None, facets=False):
+        """조건에 맞는 공고 한 페이지, 다음 커서, 전체 일치 수, 패싯별 개수 반환
+
+        정렬 값과 공고 ID를 커서로 써서 페이지를 넘겨도 같은 색인 범위만 읽음
+        (정렬 이름이나 커서가 잘못되면 ValueError)
+        """
+        filters = filters or {}
+        keyword = (keyword or '').strip()
+        searching = bool(keyword and self._match_query(keyword))
+        sort = sort or ('relevance' if searching and self.fts else 'deadline')
+        if sort not in self.SORTS:
+            raise ValueError(f"지원하지 않는 정렬입니다: {sort} (가능: {', '.join(self.SORTS)})")
+        if sort == 'relevance' and not (searching and self.fts):
+            sort = 'deadline'
+        column, descending = self.SORTS[sort]
+
+        with self._lock:
+            conn = self._connection()
+            join, conditions, params = self._filters(keyword, filters)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+            total = conn.execute(f"SELECT COUNT(*) FROM jobs j {join} {where}", params).fetchone()[0]
+
+            facet_counts = {}
+            if facets:
+                for facet in self.FACETS:
+                    if facet == 'category':
+                        query = (f"SELECT c.category, COUNT(*) FROM jobs j {join} JOIN job_categories c ON c.job_id = j.job_id "
+                                 f"{where} GROUP BY c.category ORDER BY COUNT(*) DESC")
+                    else:
+                        query = f"SELECT j.{facet}, COUNT(*) FROM jobs j {join} {where} GROUP BY j.{facet} ORDER BY COUNT(*) DESC"
+                    facet_counts[facet] = {value or '': count for value, count in conn.execute(query, params)}
+
+            page_conditions = list(conditions)
+            page_params = list(params)
+            if cursor:
+                sort_value, job_id = self._decode_cursor(cursor)
+                page_conditions.append(f"({column} {'<' if descending else '>'} ? OR ({column} = ? AND j.job_id > ?))")
+                page_params += [sort_value, sort_value, job_id]
+            page_where = f"WHERE {' AND '.join(page_conditions)}" if page_conditions else ''
+            rows = conn.execute(
+                f"SELECT j.data, {column}, j.job_id FROM jobs j {join} {page_where} "
+                f"ORDER BY {column} {'DESC' if descending else 'ASC'}, j.job_id ASC LIMIT ?",
+                page_params + [limit + 1]
+            ).fetchall()
+
+        next_cursor = self._encode_cursor(rows[limit - 1][1], rows[limit - 1][2]) if len(rows) > limit else None
+        return {
+            "jobs": [json.loads(row[0]) for row in rows[:limit]],
+            "next_cursor": next_cursor,
+            "total": total,
+            "sort": sort,
+            "facets": facet_counts if facets else None
+        }
+
+    @staticmethod
+    def _encode_cursor(sort_value, job_id):
+        return base64.urlsafe_b64encode(json.dumps([sort_value, job_id]).encode('utf-8')).decode('ascii')
+
+    @staticmethod
+    def _decode_cursor(cursor):
+        try:
+            sort_value, job_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            return sort_value, str(job_id)
+        except Exception:
+            raise ValueError("잘못된 커서입니다.")
+
+    def clear(self):
+        """색인 전체 삭제"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM jobs")
+                conn.execute("DELETE FROM job_categories")
+                if self.fts:
+                    conn.execute("DELETE FROM jobs_fts")
+
+    def stats(self):
+        """색인 현황"""
+        with self._lock:
+            conn = self._connection()
+            jobs, updated_at = conn.execute("SELECT COUNT(*), MAX(updated_at) FROM jobs").fetchone()
+        return {"jobs": jobs, "updated_at": updated_at, "fts": self.fts}
+
+class JobSnapshotScheduler:
+    """주기적으로 공고 카테고리를 다시 수집해서 스냅샷 갱신
+
+    대화형 요청이 쓸 세션이 남도록 풀 세션은 최대 (풀 크기 - 1)개만 사용하고,
+    풀 크기가 1이면 풀 대신 갱신할 때만 띄우는 전용 세션으로 카테고리를 차례로 수집
+    """
+
+    def __init__(self, snapshot, interval=JOB_SNAPSHOT_INTERVAL, max_pages=JOB_SNAPSHOT_MAX_PAGES, initial_delay=JOB_SNAPSHOT_INITIAL_DELAY):
+        self.snapshot = snapshot
+        self.interval = interval
+        self.max_pages = max_pages
+        self.initial_delay = initial_delay
+        self._stop = threading.Event()
+        self._thread = None
+        self._scraper = None
+
+    @contextmanager
+    def _dedicated_session(self, timeout=None):
+        if self._scraper is None:
+            self._scraper = CatchScraper(session_id='snapshot')
+        yield self._scraper
+
+    def _iter_jobs(self):
+        if driver_pool.size > 1:
+            return iter_homepage_jobs(self.max_pages, max_sessions=driver_pool.size - 1)
+        return iter_homepage_jobs(self.max_pages, max_sessions=1, session=self._dedicated_session)
+
+    def refresh(self):
+        """전체 카테고리 수집 후 스냅샷 교체 (이미 갱신 중이면 새로 수집하지 않고 그 결과를 함께 받음)"""
+        return job_index_flights.do('refresh', self._refresh_once)
+
+    def _refresh_once(self):
+        try:
+            return self._refresh()
+        finally:
+            # 전용 세션은 다음 갱신까지 쓰지 않으므로 Chrome을 남겨 두지 않음
+            if self._scraper:
+                self._scraper.close_driver()
+
+    def _refresh(self):
+        started = time.time()
+        postings = OrderedDict()
+        errors = []
+        for event in self._iter_jobs():
+            if event["type"] != "page":
+                errors.append(event)
+                continue
+            _merge_job_postings(postings, event["category"], event["jobs"])
+
+        # 일부 카테고리 수집이 실패하면 해당 공고가 삭제된 것처럼 보이지 않도록 기존 스냅샷 유지
+        # (색인에는 이번에 수집된 공고만 추가)
+        if errors:
+            self.snapshot.last_error = errors
+            job_index.upsert(postings.values())
+            print(f"공고 스냅샷 갱신 실패, 기존 스냅샷 유지: {errors}")
+            return None
+
+        diff = self.snapshot.replace(postings)
+        job_index.replace(postings.values())
+        self.snapshot.last_error = None
+        print(f"공고 스냅샷 v{self.snapshot.version} 갱신 ({len(postings)}개, {time.time() - started:.1f}초): "
+              f"추가 {len(diff['added'])}, 삭제 {len(diff['removed'])}, 변경 {len(diff['changed'])}")
+        return diff
+
+    def _run(self):
+        # 시작 직후에는 풀을 로그인/첫 요청에 양보하고 잠시 뒤 첫 갱신
+        if self._stop.wait(self.initial_delay):
+            return
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                self.snapshot.last_error = str(e)
+                print(f"공고 스냅샷 갱신 중 오류: {e}")
+            self._stop.wait(self.interval)
+
+    def start(self):
+        """백그라운드 갱신 스레드 시작 (주기가 0이면 시작하지 않음)"""
+        if self.interval <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='job-snapshot', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """갱신 스레드 종료 요청 (갱신 중인 전용 세션이 있으면 종료)"""
+        self._stop.set()
+        if self._scraper:
+            self._scraper.close_driver()
+
+# 공고 스냅샷과 갱신 스케줄러
+job_snapshot = JobSnapshot()
+job_snapshot_scheduler = JobSnapshotScheduler(job_snapshot)
+
+# 페이지 기록 아카이브 (CATCH_PAGE_ARCHIVE=record일 때만 기록)
+page_archive = PageArchive()
+
+# 공고 검색 색인 (스냅샷 갱신과 /api/homepage-jobs 수집 결과로 채움, 갱신은 job_index_flights로 하나만 실행)
+job_index = JobIndex()
+job_index_flights = SingleFlight()
+
+class ScrapeJobQueueFull(Exception):
+    """작업 대기열이 가득 참"""
+
+def _run_company_info_job(params, report):
+    """단일 기업 조회 작업"""
+    company_name = params.get('company_name', '')
+    if not company_name:
+        raise ValueError("기업명을 입력해주세요.")
+    return get_company_info(company_name)
+
+def _run_company_batch_job(params, report):
+    """일괄 기업 조회 작업 (끝나는 기업마다 부분 결과 보고)"""
+    company_names = [name for name in params.get('company_names', []) if isinstance(name, str) and name.strip()]
+    if not company_names:
+        raise ValueError("기업명 목록을 입력해주세요.")
+    results = [None] * len(company_names)
+    for event in iter_company_batch(company_names[:COMPANY_BATCH_MAX_SIZE]):
+        report(event)
+        results[event["index"]] = event.get("result") or {"success": False, "message": event.get("message")}
+    return {"success": True, "results": results}
+
+def _run_homepage_jobs_job(params, report):
+    """채용 공고 크롤링 작업 (페이지마다 부분 결과 보고)"""
+    categories = params.get('categories') or None
+    results = {result_key: [] for _, result_key in _select_job_categories(categories)}
+    postings = OrderedDict()
+    errors = []
+    for event in iter_homepage_jobs(int(params.get('max_pages', HOMEPAGE_JOBS_MAX_PAGES)), categories):
+        report(event)
+        if event["type"] == "page":
+            results[event["category"]].extend(event["jobs"])
+            _merge_job_postings(postings, event["category"], event["jobs"])
+        else:
+            errors.append(event)
+    return {"success": True, "results": results, "jobs": list(postings.values()), "errors": errors}
+
+def _run_company_reviews_job(params, report):
+    """기업 리뷰 증분 수집 작업"""
+    company_name = params.get('company_name', '')
+    if not company_name:
+        raise ValueError("기업명을 입력해주세요.")
+    return refresh_company_reviews(company_name, int(params.get('max_pages', REVIEW_CRAWL_MAX_PAGES)))
+
+# 작업 종류별 실행 함수와 기본 우선순위
+SCRAPE_JOB_HANDLERS = {
+    'company_info': (_run_company_info_job, 'interactive'),
+    'company_batch': (_run_company_batch_job, 'batch'),
+    'homepage_jobs': (_run_homepage_jobs_job, 'bulk'),
+    'company_reviews': (_run_company_reviews_job, 'batch')
+}
+
+def _check_callback_url(url):
+    """콜백 URL 검증 (http/https만, 허용 목록에 없는 호스트는 공인 주소로만 연결되어야 함)"""
+    parsed = urlparse(url)
+    if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+        raise ValueError(f"콜백 URL은 http/https 주소여야 합니다: {url}")
+    host = parsed.hostname.lower()
+    if host in SCRAPE_JOB_CALLBACK_ALLOWED_HOSTS:
+        return
+    try:
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, port, proto=socket.IPPROTO_TCP)}
+    except (OSError, ValueError) as e:
+        raise ValueError(f"콜백 URL의 호스트를 확인할 수 없습니다: {host} ({e})")
+    for address in addresses:
+        ip = ipaddress.ip_address(address.split('%', 1)[0])
+        ip = getattr(ip, 'ipv4_mapped', None) or ip
+        if not ip.is_global or ip.is_multicast:
+            raise ValueError(f"내부망/루프백 주소로는 콜백을 보낼 수 없습니다: {host} ({ip})")
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    """콜백 응답의 리다이렉트를 따라가지 않음 (검증한 호스트 밖으로 나가지 않도록)"""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+_callback_opener = urllib.request.build_opener(_NoRedirect)
+
+class ScrapeJobQueue:
+    """우선순위가 있는 비동기 스크래핑 작업 대기열 (제출 즉시 작업 ID 반환)"""
+
+    def __init__(self, workers=SCRAPE_JOB_WORKERS, max_size=SCRAPE_JOB_QUEUE_SIZE, retention=SCRAPE_JOB_RETENTION):
+        self.workers = workers
+        self.retention = retention
+        self._queue = queue.PriorityQueue(maxsize=max_size)
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._threads = []
+
+    def start(self):
+        """작업 스레드 시작"""
+        if self._threads:
+            return
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f'scrape-job-{index}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, job_type, params, priority=None, callback_url=None):
+        """작업 등록 후 작업 정보 반환 (대기열이 가득 차면 ScrapeJobQueueFull)"""
+        if job_type not in SCRAPE_JOB_HANDLERS:
+            raise ValueError(f"지원하지 않는 작업 종류입니다: {job_type}")
+        priority = priority or SCRAPE_JOB_HANDLERS[job_type][1]
+        if priority not in SCRAPE_JOB_PRIORITIES:
+            raise ValueError(f"지원하지 않는 우선순위입니다: {priority}")
+        if callback_url:
+            _check_callback_url(callback_url)
+
+        self._purge_expired()
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "type": job_type,
+            "params": params,
+            "priority": priority,
+            "status": "queued",
+            "callback_url": callback_url,
+            "created_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "partial": [],
+            "result": None,
+            "error": None
+        }
+
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            self._jobs[job["job_id"]] = job
+        try:
+            self._queue.put_nowait((SCRAPE_JOB_PRIORITIES[priority], seq, job["job_id"]))
+        except queue.Full:
+            with self._lock:
+                del self._jobs[job["job_id"]]
+            raise ScrapeJobQueueFull(f"작업 대기열이 가득 찼습니다. (대기 {self._queue.qsize()}건)")
+
+        self.start()
+        return job
+
+    def get(self, job_id):
+        """작업 조회"""
+        return self._jobs.get(job_id)
+
+    def describe(self, job, partial_offset=0):
+        """응답용 작업 상태 (partial_offset 이후 부분 결과만 포함)"""
+        return {
+            "job_id": job["job_id"],
+            "type": job["type"],
+            "priority": job["priority"],
+            "status": job["status"],
+            "created_at": job["created_at"],
+            "started_at": job["started_at"],
+            "finished_at": job["finished_at"],
+            "partial": job["partial"][partial_offset:],
+            "partial_count": len(job["partial"]),
+            "result": job["result"],
+            "error": job["error"]
+        }
+
+    def stats(self):
+        """대기열 현황"""
+        with self._lock:
+            statuses = [job["status"] for job in self._jobs.values()]
+        return {
+            "workers": self.workers,
+            "queued": statuses.count("queued"),
+            "running": statuses.count("running"),
+            "done": statuses.count("done"),
+            "failed": statuses.count("failed")
+        }
+
+    def _purge_expired(self):
+        """보관 시간이 지난 완료 작업 삭제"""
+        cutoff = time.time() - self.retention
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items() if job["finished_at"] and job["finished_at"] < cutoff]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+    def _worker(self):
+        while True:
+            _, _, job_id = self._queue.get()
+            job = self._jobs.get(job_id)
+            if job is None:
+                continue
+
+            handler = SCRAPE_JOB_HANDLERS[job["type"]][0]
+            job["status"] = "running"
+            job["started_at"] = time.time()
+            try:
+                job["result"] = handler(job["params"], job["partial"].append)
+                job["status"] = "done"
+            except Exception as e:
+                print(f"스크래핑 작업 실패 ({job['type']} {job_id}): {e}")
+                job["error"] = str(e)
+                job["status"] = "failed"
+            job["finished_at"] = time.time()
+
+            if job["callback_url"]:
+                self._send_callback(job)
+
+    def _send_callback(self, job):
+        """완료된 작업 결과를 콜백 URL로 POST"""
+        try:
+            # 제출 이후 DNS가 바뀌었을 수 있으므로 보내기 직전에 다시 검증
+            _check_callback_url(job["callback_url"])
+            body = json.dumps(self.describe(job), ensure_ascii=False).encode('utf-8')
+            callback = urllib.request.Request(job["callback_url"], data=body, headers={'Content-Type': 'application/json'}, method='POST')
+            _callback_opener.open(callback, timeout=SCRAPE_JOB_CALLBACK_TIMEOUT).close()
+        except Exception as e:
+            print(f"작업 콜백 전송 실패 ({job['callback_url']}): {e}")
+
+# 비동기 스크래핑 작업 대기열 (첫 제출 시 작업 스레드 시작)
+scrape_jobs = ScrapeJobQueue()
+
+@metrics.gauge
+def _service_gauges():
+    """풀/대기열/캐시/Chrome 메모리 게이지"""
+    pool = driver_pool.stats()
+    samples = [
+        ('catch_driver_pool_sessions', {"state": "in_use"}, pool["in_use"]),
+        ('catch_driver_pool_sessions', {"state": "idle"}, pool["idle"]),
+        ('catch_driver_pool_waiting', {}, pool["waiting"]),
+        ('catch_driver_spares_ready', {}, pool["spares_ready"])
+    ]
+    governor = rate_governor.stats()
+    samples += [
+        ('catch_governor_rate', {}, governor["rate"]),
+        ('catch_governor_concurrency_limit', {}, governor["concurrency_limit"]),
+        ('catch_governor_in_flight', {}, governor["in_flight"]),
+        ('catch_governor_backoff_seconds', {}, governor["backoff_seconds"])
+    ]
+    for status, count in scrape_jobs.stats().items():
+        if status != "workers":
+            samples.append(('catch_scrape_job_queue', {"status": status}, count))
+
+    samples.append(('catch_heavy_requests_in_flight', {}, request_bulkhead.in_flight))
+    for name, result_cache in (("company", company_cache), ("job_detail", job_detail_cache), ("payload", payload_cache)):
+        cache = result_cache.stats()
+        for result in ("hits", "stale_hits", "misses"):
+            samples.append(('catch_cache_requests_total', {"cache": name, "result": result}, cache[result]))
+        samples.append(('catch_cache_hit_ratio', {"cache": name}, cache["hit_ratio"]))
+
+    index = company_index.stats()
+    for result in ("hits", "fuzzy_hits", "misses"):
+        samples.append(('catch_company_index_lookups_total', {"result": result}, index[result]))
+
+    for session in driver_pool.sessions:
+        samples.append(('catch_chrome_rss_bytes', {"session": session.session_id}, _process_tree_rss(session.driver_pid())))
+    return samples
+
+@app.before_request
+def _start_request_timer():
+    g.request_started = time.perf_counter()
+
+class RequestBulkhead:
+    """사이트 요청이 필요한 엔드포인트의 동시 처리 수 제한
+
+    자리가 없으면 기다리지 않고 바로 거절해서, 스크래핑 요청이 서버 작업 스레드를 모두 차지해도
+    가벼운 엔드포인트(헬스 체크, 스냅샷/색인 조회 등)용 스레드가 항상 남도록 함
+    """
+
+    def __init__(self, slots=SERVE_HEAVY_SLOTS):
+        self.slots = slots
+        self.in_flight = 0
+        self.rejected = 0
+        self.draining = False
+        self._cond = threading.Condition()
+
+    def enter(self):
+        """자리가 있으면 차지하고 True (종료 중이거나 가득 차면 False)"""
+        with self._cond:
+            if self.draining or self.in_flight >= self.slots:
+                self.rejected += 1
+                return False
+            self.in_flight += 1
+            return True
+
+    def leave(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def drain(self, timeout=SERVE_SHUTDOWN_GRACE):
+        """새 요청을 거절하고 처리 중인 요청이 끝날 때까지 대기 (남은 요청 수 반환)"""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self.draining = True
+            while self.in_flight and time.monotonic() < deadline:
+                self._cond.wait(deadline - time.monotonic())
+            return self.in_flight
+
+    def stats(self):
+        """동시 처리 현황"""
+        return {"slots": self.slots, "in_flight": self.in_flight, "rejected": self.rejected, "draining": self.draining}
+
+request_bulkhead = RequestBulkhead()
+
+# 항상 사이트 요청이 필요한 엔드포인트 (나머지는 _is_heavy_request에서 인자로 판단)
+HEAVY_ENDPOINTS = {
+    'init_scraper', 'login', 'search_company_info', 'search_company_info_batch', 'get_job_detail', 'get_job_detail_batch'
+}
+
+def _is_heavy_request():
+    """이 요청이 브라우저/사이트 요청을 기다릴 수 있는지 여부"""
+    endpoint = request.endpoint
+    if endpoint in HEAVY_ENDPOINTS:
+        return True
+    if endpoint == 'get_homepage_jobs':
+        return bool(request.args.get('stream')) or request.args.get('fresh') == '1' or not job_snapshot.is_ready()
+    if endpoint == 'get_company_reviews':
+        return request.args.get('refresh') == '1'
+    return False
+
+@app.before_request
+def _limit_heavy_requests():
+    if not _is_heavy_request():
+        return None
+    if not request_bulkhead.enter():
+        metrics.inc('catch_heavy_requests_rejected_total', endpoint=request.endpoint)
+        message = "서버를 종료하는 중입니다." if request_bulkhead.draining else "처리 중인 스크래핑 요청이 많습니다. 잠시 후 다시 시도해주세요."
+        response = jsonify({"success": False, "message": message, "bulkhead": request_bulkhead.stats()})
+        response.status_code = 503
+        response.headers['Retry-After'] = '5'
+        return response
+    g.heavy_request = True
+    return None
+
+@app.teardown_request
+def _release_heavy_request(exc):
+    # 스트리밍 응답은 stream_with_context로 스트림이 끝난 뒤에 반납됨
+    if g.pop('heavy_request', False):
+        request_bulkhead.leave()
+
+def _accepted_encoding():
+    """클라이언트가 받을 수 있는 압축 방식 (brotli 우선, 없으면 gzip, 둘 다 아니면 None)"""
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        return 'br'
+    if accepted['gzip']:
+        return 'gzip'
+    return None
+
+def _compress(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+def _prepare_payload(result):
+    """결과를 한 번 직렬화하고 ETag 계산 (압축본은 처음 요청될 때 만들어서 함께 보관)"""
+    body = app.json.dumps(result).encode('utf-8')
+    return {"body": body, "etag": hashlib.sha1(body).hexdigest(), "encoded": {}}
+
+def _cached_json_response(key, build, cache_control=f"public, max-age={SERVE_PAYLOAD_MAX_AGE}"):
+    """직렬화한 응답 본문을 key별로 캐시해서 ETag/Cache-Control과 함께 반환 (If-None-Match가 같으면 304)"""
+    payload = payload_cache.get_or_load(key, lambda: _prepare_payload(build()))
+    if request.if_none_match.contains(payload["etag"]):
+        metrics.inc('catch_response_not_modified_total', endpoint=request.endpoint)
+        response = Response(status=304)
+    else:
+        body = payload["body"]
+        encoding = _accepted_encoding() if len(body) >= SERVE_COMPRESS_MIN_BYTES else None
+        response = Response(mimetype='application/json')
+        if encoding:
+            if encoding not in payload["encoded"]:
+                payload["encoded"][encoding] = _compress(body, encoding)
+            body = payload["encoded"][encoding]
+            response.headers['Content-Encoding'] = encoding
+        response.set_data(body)
+    response.set_etag(payload["etag"])
+    response.headers['Cache-Control'] = cache_control
+    response.vary.add('Accept-Encoding')
+    return response
+
+@app.after_request
+def _record_request_latency(response):
+    started = getattr(g, 'request_started', None)
+    if started is not None:
+        endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+        metrics.observe('catch_http_request_seconds', time.perf_counter() - started,
+                        endpoint=endpoint, method=request.method, status=response.status_code)
+    return response
+
+@app.after_request
+def _compress_response(response):
+    """큰 JSON/텍스트 응답 압축 (스트리밍, 이미 압축된 응답, 캐시된 본문은 제외)"""
+    if (response.direct_passthrough or response.is_streamed or response.status_code != 200
+            or 'Content-Encoding' in response.headers or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+    encoding = _accepted_encoding()
+    if not encoding or response.content_length is None or response.content_length < SERVE_COMPRESS_MIN_BYTES:
+        return response
+    response.set_data(_compress(response.get_data(), encoding))
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
 
 def _handle_api_error(e):
     """API 에러 처리 헬퍼 함수"""
     return jsonify({"success": False, "message": str(e)})
 
+def _handle_pool_error(e):
+    """풀 포화 에러 처리 헬퍼 함수 (503 + Retry-After)"""
+    response = jsonify({"success": False, "message": str(e), "pool": driver_pool.stats()})
+    response.status_code = 503
+    response.headers['Retry-After'] = '5'
+    return response
+
+def start_background_services():
+    """주기 작업 시작 (공고 스냅샷 갱신, 드라이버 감시, 저장된 로그인 쿠키 확인)"""
+    job_snapshot_scheduler.start()
+    driver_watchdog.start()
+    # 저장된 로그인 쿠키를 HTTP 세션에서 미리 확인 (만료됐으면 첫 브라우저 세션이 다시 로그인)
+    threading.Thread(target=http_scraper.restore_login, name='login-restore', daemon=True).start()
+
+def stop_background_services():
+    """주기 작업 종료 후 저장 대기 중인 기업 색인을 쓰고 모든 드라이버 종료"""
+    job_snapshot_scheduler.stop()
+    driver_watchdog.stop()
+    company_index.flush()
+    driver_pool.close_all()
+
 @app.route('/api/init', methods=['POST'])
 def init_scraper():
-    """스크래퍼 초기화"""
+    """스크래퍼 초기화 (이미 초기화된 세션이면 재사용)"""
     try:
-        success = scraper.init_driver()
+        with driver_pool.session() as scraper:
+            success = scraper.init_driver()
         return jsonify({
             "success": success,
-            "message": "스크래퍼가 초기화되었습니다." if success else "스크래퍼 초기화에 실패했습니다."
+            "message": "스크래퍼가 초기화되었습니다." if success else "스크래퍼 초기화에 실패했습니다.",
+            "pool": driver_pool.stats()
         })
+    except (DriverPoolTimeout, DriverPoolFull) as e:
+        return _handle_pool_error(e)
     except Exception as e:
         return _handle_api_error(e)
 
 @app.route('/api/login', methods=['POST'])
 def login():
-    """로그인"""
+    """로그인 (이미 로그인된 세션이면 생략)"""
     try:
-        data = request.get_json()
-        username = data.get('username', 'test0137')
-        password = data.get('password', '#test0808')
+        data = request.get_json(silent=True) or {}
+        username = data.get('username', CATCH_USERNAME)
+        password = data.get('password', CATCH_PASSWORD)
 
-        return jsonify(scraper.login(username, password))
+        with driver_pool.session() as scraper:
+            result = scraper.login(username, password)
+            if result.get("success"):
+                http_scraper.sync_cookies(scraper.driver)
+        return jsonify(result)
+    except (DriverPoolTimeout, DriverPoolFull) as e:
+        return _handle_pool_error(e)
     except Exception as e:
         return _handle_api_error(e)
 
@@ -503,7 +4206,10 @@ def login():
 def get_status():
     """현재 상태 확인"""
     try:
-        return jsonify(scraper.get_current_status())
+        return jsonify({
+            "pool": driver_pool.stats(),
+            "sessions": [session.get_current_status() for session in driver_pool.sessions]
+        })
     except Exception as e:
         return _handle_api_error(e)
 
@@ -517,42 +4223,169 @@ def search_company_info():
         if not company_name:
             return jsonify({"success": False, "message": "기업명을 입력해주세요."})
 
-        result = scraper.search_company_info(company_name)
+        result = get_company_info(company_name)
         return jsonify(result)
 
+    except (DriverPoolTimeout, DriverPoolFull) as e:
+        return _handle_pool_error(e)
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/search-company-info/batch', methods=['POST'])
+def search_company_info_batch():
+    """여러 기업 일괄 조회 (stream=ndjson|sse 이면 끝나는 순서대로 스트리밍)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        company_names = [name.strip() for name in data.get('company_names', []) if isinstance(name, str) and name.strip()]
+        stream = request.args.get('stream', data.get('stream', ''))
+
+        if not company_names:
+            return jsonify({"success": False, "message": "기업명 목록을 입력해주세요."})
+        if len(company_names) > COMPANY_BATCH_MAX_SIZE:
+            return jsonify({"success": False, "message": f"한 번에 최대 {COMPANY_BATCH_MAX_SIZE}개 기업까지 조회할 수 있습니다."})
+
+        if stream in ('ndjson', 'sse'):
+            def events():
+                for event in iter_company_batch(company_names):
+                    yield _encode_stream_event(event, stream)
+                yield _encode_stream_event({"type": "done", "count": len(company_names)}, stream)
+            return _stream_response(events(), stream)
+
+        results = [None] * len(company_names)
+        for event in iter_company_batch(company_names):
+            if event["type"] == "result":
+                results[event["index"]] = dict(event["result"], company_name=event["company_name"])
+            else:
+                results[event["index"]] = {"success": False, "company_name": event["company_name"], "message": event["message"]}
+
+        return jsonify({
+            "success": True,
+            "results": results,
+            "message": f"{len(company_names)}개 기업 조회 완료"
+        })
+
     except Exception as e:
         return _handle_api_error(e)
 
-@app.route('/api/job-essays', methods=['POST'])
+@app.route('/api/company-reviews', methods=['GET'])
+def get_company_reviews():
+    """저장된 기업 리뷰 최신순 조회 (limit, cursor로 페이지 이동, refresh=1이면 먼저 증분 수집)"""
+    try:
+        company_name = request.args.get('company_name', '').strip()
+        if not company_name:
+            return jsonify({"success": False, "message": "기업명을 입력해주세요."})
+
+        limit = max(1, min(request.args.get('limit', 20, type=int), REVIEW_PAGE_MAX_LIMIT))
+        crawl = None
+        if request.args.get('refresh') == '1':
+            crawl = refresh_company_reviews(company_name, request.args.get('max_pages', REVIEW_CRAWL_MAX_PAGES, type=int))
+
+        company_key = _normalize_company_name(company_name)
+        try:
+            reviews, next_cursor = review_store.page(company_key, limit, request.args.get('cursor'))
+        except ValueError as e:
+            response = jsonify({"success": False, "message": str(e)})
+            response.status_code = 400
+            return response
+
+        watermark = review_store.watermark(company_key)
+        return jsonify({
+            "success": True,
+            "company_name": company_name,
+            "reviews": reviews,
+            "next_cursor": next_cursor,
+            "watermark": watermark,
+            "crawl": crawl,
+            "message": f"리뷰 {len(reviews)}개" if watermark else "아직 수집된 리뷰가 없습니다. refresh=1 또는 company_reviews 작업으로 수집하세요."
+        })
+
+    except (DriverPoolTimeout, DriverPoolFull) as e:
+        return _handle_pool_error(e)
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/scrape-jobs', methods=['POST'])
+def submit_scrape_job():
+    """비동기 스크래핑 작업 등록 (즉시 작업 ID 반환)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        job = scrape_jobs.submit(
+            data.get('type', ''),
+            data.get('params', {}),
+            priority=data.get('priority'),
+            callback_url=data.get('callback_url')
+        )
+        response = jsonify({
+            "success": True,
+            "job_id": job["job_id"],
+            "status": job["status"],
+            "priority": job["priority"],
+            "status_url": f"/api/scrape-jobs/{job['job_id']}"
+        })
+        response.status_code = 202
+        return response
+
+    except ValueError as e:
+        response = jsonify({"success": False, "message": str(e)})
+        response.status_code = 400
+        return response
+    except ScrapeJobQueueFull as e:
+        response = jsonify({"success": False, "message": str(e), "queue": scrape_jobs.stats()})
+        response.status_code = 503
+        response.headers['Retry-After'] = '10'
+        return response
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/scrape-jobs/<job_id>', methods=['GET'])
+def get_scrape_job(job_id):
+    """작업 상태와 부분 결과 조회 (offset 이후 부분 결과만 반환)"""
+    try:
+        job = scrape_jobs.get(job_id)
+        if not job:
+            response = jsonify({"success": False, "message": "작업을 찾을 수 없습니다."})
+            response.status_code = 404
+            return response
+
+        offset = request.args.get('offset', 0, type=int)
+        return jsonify(dict(scrape_jobs.describe(job, offset), success=True))
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/job-essays', methods=['GET', 'POST'])
 def get_job_essays():
-    """합격 자소서 정보"""
+    """합격 자소서 정보 (기업/직무별로 직렬화한 응답을 캐시, GET이면 ETag로 304 응답 가능)"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True) or request.args
         company_name = data.get('company_name', '')
         job_position = data.get('job_position', None)
 
         if not company_name:
             return jsonify({"success": False, "message": "기업명을 입력해주세요."})
 
-        result = scraper.get_job_essays(company_name, job_position)
-        return jsonify(result)
+        return _cached_json_response(
+            ('get_job_essays', company_name, job_position or ''),
+            lambda: content_scraper.get_job_essays(company_name, job_position)
+        )
 
     except Exception as e:
         return _handle_api_error(e)
 
-@app.route('/api/job-tips', methods=['POST'])
+@app.route('/api/job-tips', methods=['GET', 'POST'])
 def get_job_tips():
-    """지원 꿀팁 정보"""
+    """지원 꿀팁 정보 (기업/직무별로 직렬화한 응답을 캐시, GET이면 ETag로 304 응답 가능)"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True) or request.args
         company_name = data.get('company_name', '')
         job_position = data.get('job_position', None)
 
         if not company_name:
             return jsonify({"success": False, "message": "기업명을 입력해주세요."})
 
-        result = scraper.get_job_tips(company_name, job_position)
-        return jsonify(result)
+        return _cached_json_response(
+            ('get_job_tips', company_name, job_position or ''),
+            lambda: content_scraper.get_job_tips(company_name, job_position)
+        )
 
     except Exception as e:
         return _handle_api_error(e)
@@ -567,19 +4400,202 @@ def get_job_detail():
         if not job_url:
             return jsonify({"success": False, "message": "공고 URL을 입력해주세요."})
 
-        result = scraper.get_job_detail(job_url)
+        result = fetch_job_detail(job_url)
         return jsonify(result)
 
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)})
+    except (DriverPoolTimeout, DriverPoolFull) as e:
+        return _handle_pool_error(e)
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/job-detail/batch', methods=['POST'])
+def get_job_detail_batch():
+    """여러 공고 상세 일괄 조회 (입력 순서대로 결과 반환, stream=ndjson|sse 이면 끝나는 순서대로 스트리밍)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        job_urls = [url.strip() for url in data.get('job_urls', []) if isinstance(url, str) and url.strip()]
+        stream = request.args.get('stream', data.get('stream', ''))
+
+        if not job_urls:
+            return jsonify({"success": False, "message": "공고 URL 목록을 입력해주세요."})
+        if len(job_urls) > JOB_DETAIL_BATCH_MAX_SIZE:
+            return jsonify({"success": False, "message": f"한 번에 최대 {JOB_DETAIL_BATCH_MAX_SIZE}개 공고까지 조회할 수 있습니다."})
+
+        if stream in ('ndjson', 'sse'):
+            def events():
+                for event in iter_job_detail_batch(job_urls):
+                    yield _encode_stream_event(event, stream)
+                yield _encode_stream_event({"type": "done", "count": len(job_urls)}, stream)
+            return _stream_response(events(), stream)
+
+        results = [None] * len(job_urls)
+        failed = 0
+        for event in iter_job_detail_batch(job_urls):
+            if event["type"] == "result":
+                results[event["index"]] = dict(event["result"], job_url=event["job_url"])
+            else:
+                failed += 1
+                results[event["index"]] = {"success": False, "job_url": event["job_url"], "message": event["message"]}
+
+        return jsonify({
+            "success": True,
+            "results": results,
+            "message": f"{len(job_urls)}개 공고 조회 완료 (실패 {failed}개)"
+        })
+
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/homepage-jobs', methods=['GET'])
+def get_homepage_jobs():
+    """직무 카테고리별 채용 공고 수집 (categories=키,키 로 일부만, stream=ndjson|sse 이면 페이지 단위 스트리밍)
+
+    results는 카테고리별 목록(여러 카테고리 공고는 각 목록에 포함), jobs는 공고 ID로 중복을 제거하고
+    categories 목록을 붙인 전체 공고
+    """
+    try:
+        max_pages = request.args.get('max_pages', HOMEPAGE_JOBS_MAX_PAGES, type=int)
+        stream = request.args.get('stream', '')
+        categories = [name.strip() for name in request.args.get('categories', '').split(',') if name.strip()] or None
+        selected = {result_key for _, result_key in _select_job_categories(categories)}
+
+        if stream in ('ndjson', 'sse'):
+            return _stream_response(_stream_homepage_jobs(max_pages, stream, categories), stream)
+
+        # 스냅샷이 준비되어 있으면 크롤링 없이 바로 응답 (fresh=1이면 실시간 수집)
+        # (버전별로 직렬화해 두고 클라이언트는 ETag로 재검증)
+        if job_snapshot.is_ready() and request.args.get('fresh') != '1':
+            version = job_snapshot.version
+
+            def build():
+                results = job_snapshot.results(categories)
+                jobs = [job for job in job_snapshot.jobs() if selected.intersection(job.get("categories", [job["category"]]))]
+                total = sum(len(category_jobs) for category_jobs in results.values())
+                return {
+                    "success": True,
+                    "results": results,
+                    "jobs": jobs,
+                    "total": total,
+                    "unique_total": len(jobs),
+                    "version": job_snapshot.version,
+                    "generated_at": job_snapshot.generated_at,
+                    "message": f"채용 공고 {len(jobs)}개 (스냅샷)"
+                }
+
+            return _cached_json_response(('homepage_jobs', version, tuple(sorted(selected))), build, cache_control='no-cache')
+
+        results, jobs, errors = _collect_homepage_jobs(max_pages, categories)
+        job_index.upsert(jobs)
+        total = sum(len(category_jobs) for category_jobs in results.values())
+        return jsonify({
+            "success": total > 0 or not errors,
+            "results": results,
+            "jobs": jobs,
+            "total": total,
+            "unique_total": len(jobs),
+            "errors": errors,
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "message": f"채용 공고 {len(jobs)}개 수집 완료 (카테고리 간 중복 {total - len(jobs)}개 제외)"
+        })
+
+    except (DriverPoolTimeout, DriverPoolFull) as e:
+        return _handle_pool_error(e)
+    except ValueError as e:
+        response = jsonify({"success": False, "message": str(e)})
+        response.status_code = 400
+        return response
     except Exception as e:
         return _handle_api_error(e)
 
+@app.route('/api/homepage-jobs/diff', methods=['GET'])
+def get_homepage_jobs_diff():
+    """since 버전 이후 추가/삭제/변경된 공고"""
+    try:
+        if not job_snapshot.is_ready():
+            return jsonify({"success": False, "message": "공고 스냅샷이 아직 준비되지 않았습니다.", "last_error": job_snapshot.last_error})
+
+        since = request.args.get('since', 0, type=int)
+        diff = job_snapshot.diff_since(since)
+        return jsonify(dict(diff, success=True))
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/api/jobs', methods=['GET'])
+def search_jobs():
+    """색인된 공고 검색 (q 전문 검색, categories/region/career/job_type/company 필터, sort, limit, cursor, facets=1)
+
+    필터 값은 쉼표로 여러 개 지정, 마감된 공고는 include_expired=1일 때만 포함
+    요청 안에서 수집하지 않으므로 첫 스냅샷 갱신 전에는 빈 결과(index.jobs=0)를 반환
+    """
+    try:
+        def arg_list(name):
+            return [value.strip() for value in request.args.get(name, '').split(',') if value.strip()]
+
+        categories = arg_list('categories')
+        filters = {
+            "categories": [result_key for _, result_key in _select_job_categories(categories)] if categories else [],
+            "region": arg_list('region'),
+            "career": arg_list('career'),
+            "job_type": arg_list('job_type'),
+            "company": arg_list('company'),
+            "deadline_before": request.args.get('deadline_before', '').strip(),
+            "include_expired": request.args.get('include_expired') == '1'
+        }
+        limit = max(1, min(request.args.get('limit', JOB_SEARCH_DEFAULT_LIMIT, type=int), JOB_SEARCH_MAX_LIMIT))
+
+        result = job_index.search(
+            request.args.get('q', ''), filters, request.args.get('sort') or None, limit,
+            request.args.get('cursor') or None, request.args.get('facets') == '1'
+        )
+        index = job_index.stats()
+        return jsonify(dict(
+            result,
+            success=True,
+            index=index,
+            message=f"채용 공고 {result['total']}개 중 {len(result['jobs'])}개" if index["jobs"]
+            else "공고 색인을 준비 중입니다. 잠시 후 다시 시도해주세요."
+        ))
+
+    except ValueError as e:
+        response = jsonify({"success": False, "message": str(e)})
+        response.status_code = 400
+        return response
+    except Exception as e:
+        return _handle_api_error(e)
+
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Prometheus 형식 메트릭"""
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/health', methods=['GET'])
 def health_check():
-    """헬스 체크"""
+    """헬스 체크 (드라이버 프로세스 생존 여부와 로그인 상태 포함, 사용 중인 드라이버를 기다리지 않음)"""
+    sessions = [session.health() for session in driver_pool.sessions]
+    initialized = [session for session in sessions if session["initialized"]]
+
+    # 드라이버는 첫 사용 시 띄우므로 아직 하나도 없으면 정상(idle), 띄운 드라이버가 모두 죽었으면 degraded
+    if not initialized:
+        status = "idle"
+    elif any(session["alive"] for session in initialized):
+        status = "ok"
+    else:
+        status = "degraded"
+
     return jsonify({
-        "status": "ok",
+        "status": status,
         "service": "Catch Scraper Service",
-        "message": "캐치 채용 정보 수집 서비스가 정상 작동 중입니다."
+        "message": "캐치 채용 정보 수집 서비스가 정상 작동 중입니다." if status != "degraded" else "모든 드라이버가 응답하지 않습니다.",
+        "sessions": sessions,
+        "is_logged_in": any(session["is_logged_in"] for session in sessions),
+        "saved_logins": login_cookies.stats(),
+        "pool": driver_pool.stats(),
+        "watchdog": driver_watchdog.stats(),
+        "rate_governor": rate_governor.stats(),
+        "page_archive": page_archive.stats(),
+        "heavy_requests": request_bulkhead.stats()
     })
 
 if __name__ == '__main__':
@@ -589,10 +4605,26 @@ if __name__ == '__main__':
         print("   - POST /api/init (Initialize)")
         print("   - POST /api/login (Login)")
         print("   - POST /api/search-company-info (Company Info)")
-        print("   - POST /api/job-essays (Job Essays)")
-        print("   - POST /api/job-tips (Job Tips)")
+        print("   - POST /api/search-company-info/batch (Company Info Batch, ?stream=ndjson|sse)")
+        print("   - GET /api/homepage-jobs (Job Listings, ?categories=&stream=ndjson|sse)")
+        print("   - GET /api/homepage-jobs/diff (Job Listing Diff, ?since=<version>)")
+        print("   - GET /api/jobs (Indexed Job Search, ?q=&categories=&region=&career=&sort=&cursor=&facets=1)")
+        print("   - GET /api/company-reviews (Company Reviews, ?cursor=&limit=&refresh=1)")
+        print("   - POST /api/scrape-jobs (Async Scrape Job)")
+        print("   - GET /api/scrape-jobs/<job_id> (Async Scrape Job Status)")
+        print("   - GET|POST /api/job-essays (Job Essays, ETag)")
+        print("   - GET|POST /api/job-tips (Job Tips, ETag)")
         print("   - POST /api/job-detail (Job Detail)")
+        print("   - POST /api/job-detail/batch (Job Detail Batch, ?stream=ndjson|sse)")
+        print("   - GET /metrics (Prometheus Metrics)")
         print("   - GET /health (Health Check)")
-        app.run(host='0.0.0.0', port=3000, debug=True)
+        print(f"🧭 Driver pool size: {driver_pool.size} (+{driver_pool.spare_count} warm spare)")
+
+        print("ℹ️ 개발용 서버입니다. 운영 환경에서는 python3 serve.py로 실행하세요.")
+
+        # 디버그 리로더의 감시 프로세스에서는 스케줄러를 띄우지 않음
+        if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+            start_background_services()
+        app.run(host='0.0.0.0', port=3000, debug=True, threaded=True)
     except KeyboardInterrupt:
-        scraper.close_driver()
\ No newline at end of file
+        stop_background_services()
\ No newline at end of file
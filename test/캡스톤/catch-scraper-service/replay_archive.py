@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""페이지 아카이브 다시 추출
+
+CATCH_PAGE_ARCHIVE=record로 기록해 둔 페이지를 브라우저 없이 현재 추출 명세
+(EXTRACTION_SPECS)로 다시 추출하고, 페이지 종류별로 빈 추출/기록 시점과 달라진
+결과/오류 수를 보여 준다. 선택자를 고친 뒤 실제 사이트를 다시 수집하지 않고
+확인하거나, 회귀 테스트에서 --strict로 빈 추출이 생기면 실패시키는 용도.
+
+사용 예:
+    python3 replay_archive.py
+    python3 replay_archive.py --page-types job_list,company_detail --show 5 --output replay.jsonl
+    python3 replay_archive.py --archive ./fixtures/archive --strict --fail-on-change
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description='페이지 아카이브 다시 추출')
+    parser.add_argument('--archive', help='아카이브 디렉터리 (기본: CATCH_PAGE_ARCHIVE_DIR 또는 data/page_archive)')
+    parser.add_argument('--page-types', type=lambda value: value.split(','), help='다시 추출할 페이지 종류 (쉼표 구분)')
+    parser.add_argument('--workers', type=int, help='추출 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--output', help='페이지별 결과를 JSON Lines로 저장할 경로')
+    parser.add_argument('--show', type=int, default=3, help='종류별로 출력할 문제 페이지 수')
+    parser.add_argument('--strict', action='store_true', help='빈 추출이나 오류가 있으면 종료 코드 1')
+    parser.add_argument('--fail-on-change', action='store_true', help='기록 시점과 추출 결과가 달라도 종료 코드 1')
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import catch_scraper
+
+    archive = catch_scraper.PageArchive(directory=args.archive) if args.archive else catch_scraper.page_archive
+    print(f"📦 {archive.directory}: 세그먼트 {len(archive.segments())}개")
+
+    started = time.time()
+    results = []
+    shown = {}
+    output = open(args.output, 'w', encoding='utf-8') if args.output else None
+    try:
+        for result in catch_scraper.replay_page_archive(archive, args.page_types, args.workers):
+            results.append({key: result[key] for key in ('page_type', 'empty', 'changed', 'error')})
+            if output:
+                output.write(json.dumps(result, ensure_ascii=False) + "\n")
+            if (result["empty"] or result["error"]) and shown.get(result["page_type"], 0) < args.show:
+                shown[result["page_type"]] = shown.get(result["page_type"], 0) + 1
+                print(f"   ⚠️ [{result['page_type']}] {result['url']} ({result['recorded_at']}): {result['error'] or '빈 추출'}")
+    finally:
+        if output:
+            output.close()
+
+    elapsed = time.time() - started
+    summary = catch_scraper.summarize_replay(results)
+    print(f"\n🔁 {len(results)}개 페이지 다시 추출 ({elapsed:.2f}초, {len(results) / elapsed if elapsed else 0:.0f} pages/s)")
+    for page_type, counts in sorted(summary.items()):
+        print(f"   {page_type}: {counts['pages']}개, 빈 추출 {counts['empty']}, 변경 {counts['changed']}, 오류 {counts['errors']}")
+
+    failed = args.strict and any(counts["empty"] or counts["errors"] for counts in summary.values())
+    failed = failed or (args.fail_on_change and any(counts["changed"] for counts in summary.values()))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Catch 스크래퍼 운영 서버
+
+개발용 app.run(debug=True) 대신 waitress로 서비스를 띄운다. 드라이버 풀, 캐시, 작업 대기열이
+프로세스 안에 있으므로 프로세스는 하나만 띄우고 작업 스레드 수를 드라이버 풀 크기에 맞춘다.
+(스크래핑 요청 동시 처리 수 CATCH_SERVE_HEAVY_SLOTS + 가벼운 엔드포인트용 CATCH_SERVE_LIGHT_THREADS)
+
+SIGTERM/SIGINT를 받으면 새 스크래핑 요청을 거절하고 처리 중인 요청을 최대
+CATCH_SERVE_SHUTDOWN_GRACE초 기다린 뒤 서버를 닫고 모든 드라이버를 종료한다.
+
+사용 예:
+    python3 serve.py
+    CATCH_SERVE_PORT=3000 CATCH_DRIVER_POOL_SIZE=4 python3 serve.py
+"""
+import os
+import signal
+import sys
+import threading
+import time
+
+from waitress import create_server, wasyncore
+
+
+def main():
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import catch_scraper
+
+    host = os.environ.get('CATCH_SERVE_HOST', '0.0.0.0')
+    port = int(os.environ.get('CATCH_SERVE_PORT', '3000'))
+    threads = catch_scraper.request_bulkhead.slots + catch_scraper.SERVE_LIGHT_THREADS
+    # 루프를 직접 돌리기 위해 소켓 맵을 넘겨서 만듦
+    server_map = {}
+    server = create_server(
+        catch_scraper.app,
+        map=server_map,
+        host=host,
+        port=port,
+        threads=threads,
+        ident='catch-scraper'
+    )
+
+    stopping = threading.Event()
+    drained = threading.Event()
+
+    def drain():
+        remaining = catch_scraper.request_bulkhead.drain(catch_scraper.SERVE_SHUTDOWN_GRACE)
+        if remaining:
+            print(f"⚠️ 처리 중인 스크래핑 요청 {remaining}건을 기다리지 못하고 종료합니다.")
+        # 마지막 응답을 다 보낼 때까지 작업 스레드가 비기를 잠시 기다림
+        deadline = time.monotonic() + 5
+        while server.task_dispatcher.active_count and time.monotonic() < deadline:
+            time.sleep(0.1)
+        # 서버는 루프 스레드에서 닫아야 하므로 플래그만 세우고 select()를 깨움
+        drained.set()
+        server.pull_trigger()
+
+    def handle_signal(signum, frame):
+        if stopping.is_set():
+            return
+        stopping.set()
+        print(f"🛑 종료 신호 수신 ({signal.Signals(signum).name}), 처리 중인 요청 정리 중...")
+        # 서버 루프가 응답을 계속 내보낼 수 있도록 정리는 별도 스레드에서
+        threading.Thread(target=drain, name='graceful-shutdown', daemon=True).start()
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    print(f"🚀 Catch Scraper Service (waitress) http://{host}:{port}")
+    print(f"🧭 Driver pool size: {catch_scraper.driver_pool.size} (+{catch_scraper.driver_pool.spare_count} warm spare), "
+          f"threads: {threads} (scraping {catch_scraper.request_bulkhead.slots} + light {catch_scraper.SERVE_LIGHT_THREADS})")
+    catch_scraper.start_background_services()
+    try:
+        # server.run() 대신 한 번씩 돌면서 정리가 끝났는지 확인 (close()는 항상 이 스레드에서 호출)
+        while not drained.is_set():
+            wasyncore.loop(timeout=server.adj.asyncore_loop_timeout, map=server_map,
+                           use_poll=server.adj.asyncore_use_poll, count=1)
+        server.close()
+    finally:
+        catch_scraper.stop_background_services()
+        print("👋 Catch Scraper Service stopped")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
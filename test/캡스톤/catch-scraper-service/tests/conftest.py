@@ -0,0 +1,62 @@
+"""테스트 공통 설정
+
+benchmark.py의 대체 Catch 사이트를 띄우고, catch_scraper가 import 시점에 읽는 설정
+(사이트 주소, 저장 경로, 백그라운드 작업)을 그 전에 지정한다. 브라우저 없이 HTTP 빠른 경로만 사용.
+
+사용 예:
+    python3 -m pytest tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVICE_DIR)
+
+import benchmark
+
+site_server = benchmark.start_server(benchmark.make_handler(0))
+work_dir = tempfile.mkdtemp(prefix='catch-test-')
+
+os.environ['CATCH_BASE_URL'] = f"http://127.0.0.1:{site_server.server_address[1]}/"
+os.environ['CATCH_COMPANY_INDEX_PATH'] = os.path.join(work_dir, 'company_index.json')
+os.environ['CATCH_REVIEW_STORE_PATH'] = os.path.join(work_dir, 'reviews.sqlite3')
+os.environ['CATCH_LOGIN_COOKIE_PATH'] = os.path.join(work_dir, 'login_cookies.json')
+os.environ['CATCH_JOB_INDEX_PATH'] = os.path.join(work_dir, 'jobs.sqlite3')
+os.environ['CATCH_PAGE_ARCHIVE_DIR'] = os.path.join(work_dir, 'page_archive')
+os.environ['CATCH_NAVIGATION_STATS'] = '0'
+os.environ['CATCH_JOB_SNAPSHOT_INTERVAL'] = '0'
+os.environ['CATCH_DRIVER_WATCHDOG_INTERVAL'] = '0'
+# 대체 사이트는 요청 제한이 없으므로 속도 조절기가 테스트를 늦추지 않게 한도를 크게
+os.environ['CATCH_GOVERNOR_RATE'] = '1000'
+os.environ['CATCH_GOVERNOR_MAX_RATE'] = '1000'
+os.environ['CATCH_GOVERNOR_BURST'] = '1000'
+os.environ['CATCH_GOVERNOR_MAX_CONCURRENCY'] = '64'
+
+import catch_scraper
+
+
+def pytest_sessionfinish(session, exitstatus):
+    site_server.shutdown()
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def scraper():
+    """catch_scraper 모듈 (테스트 사이에 캐시/색인/저장소를 비움)"""
+    yield catch_scraper
+    catch_scraper.company_cache.clear()
+    catch_scraper.payload_cache.clear()
+    catch_scraper.job_detail_cache.clear()
+    catch_scraper.company_index.clear()
+    catch_scraper.review_store.clear()
+    catch_scraper.job_index.clear()
+
+
+@pytest.fixture
+def site():
+    """대체 사이트 기준 URL"""
+    return catch_scraper.BASE_URL
@@ -0,0 +1,82 @@
+"""CompanyIndex 기업명 매칭과 저장"""
+import os
+
+import pytest
+
+
+@pytest.fixture
+def make_index(scraper, tmp_path):
+    """임시 경로의 색인 (테스트 중에는 자동 저장하지 않음)"""
+    created = []
+
+    def make():
+        index = scraper.CompanyIndex(path=os.path.join(tmp_path, 'company_index.json'), save_delay=60)
+        created.append(index)
+        return index
+
+    yield make
+    for index in created:
+        if index._save_timer:
+            index._save_timer.cancel()
+
+
+def test_different_company_names_do_not_match(make_index):
+    index = make_index()
+    index.record('카카오페이지', 'https://example.com/Comp/CompSummary/1')
+    assert index.lookup('카카오페이') is None
+    assert index.lookup('카카오') is None
+    assert index.fuzzy_hits == 0
+
+
+def test_legal_form_and_punctuation_differences_match(make_index):
+    index = make_index()
+    index.record('카카오', 'https://example.com/Comp/CompSummary/1')
+    index.record('LG전자', 'https://example.com/Comp/CompSummary/2')
+    assert index.lookup('㈜카카오 ') == 'https://example.com/Comp/CompSummary/1'
+    assert index.lookup('주식회사 카카오') == 'https://example.com/Comp/CompSummary/1'
+    assert index.lookup('LG-전자') == 'https://example.com/Comp/CompSummary/2'
+    assert index.lookup('lg전자 co., ltd.') == 'https://example.com/Comp/CompSummary/2'
+
+
+def test_ambiguous_loose_match_is_rejected(make_index):
+    index = make_index()
+    index.record('LG.전자', 'https://example.com/Comp/CompSummary/1')
+    index.record('LG-전자', 'https://example.com/Comp/CompSummary/2')
+    # 표기만 다른 기업이 둘이면 어느 쪽인지 알 수 없으므로 사이트 검색으로 넘김
+    assert index.lookup('LG 전자') is None
+
+
+def test_alias_and_forget(make_index):
+    index = make_index()
+    index.record('엔씨소프트', 'https://example.com/Comp/CompSummary/1', alias='NC')
+    assert index.lookup('nc') == 'https://example.com/Comp/CompSummary/1'
+    index.forget('NC')
+    assert index.lookup('엔씨소프트') is None
+    assert index.lookup('NC') is None
+
+
+def test_saves_are_batched_and_reloaded(make_index):
+    index = make_index()
+    index.record('카카오', 'https://example.com/Comp/CompSummary/1', alias='kakao')
+    index.record('네이버', 'https://example.com/Comp/CompSummary/2')
+    # 저장은 save_delay 뒤나 flush 때 한 번에
+    assert not os.path.exists(index.path)
+    index.flush()
+
+    reloaded = make_index()
+    assert reloaded.lookup('KAKAO') == 'https://example.com/Comp/CompSummary/1'
+    assert reloaded.lookup('네이버') == 'https://example.com/Comp/CompSummary/2'
+
+
+def test_search_results_fill_index(scraper, site):
+    result = scraper._scrape_company_info('카카오')
+    assert result["success"] and not result.get("is_sample")
+    assert scraper.company_index.lookup('카카오') == f"{site}Comp/CompSummary/1001"
+    # 같은 검색 결과에 나온 다른 기업도 색인에 들어가서 다음 조회는 검색 페이지를 건너뜀
+    assert scraper.company_index.lookup('카카오뱅크') == f"{site}Comp/CompSummary/1006"
+
+
+def test_site_search_miss_returns_sample_without_indexing(scraper):
+    result = scraper._scrape_company_info('카카오페이')
+    assert result.get("is_sample")
+    assert scraper.company_index.lookup('카카오페이') is None
@@ -0,0 +1,117 @@
+"""JobIndex 전문 검색/필터/패싯/커서 페이지와 /api/jobs"""
+import time
+from collections import OrderedDict
+
+import pytest
+
+import benchmark
+
+# 대체 사이트 카테고리 -> 응답 키
+SITE_CATEGORIES = {'it': 'it_jobs', 'bigdata': 'bigdata_ai_jobs'}
+
+
+@pytest.fixture
+def postings(scraper):
+    """대체 사이트 공고 목록을 HTTP로 받아 카테고리 간 중복을 합친 공고"""
+    postings = OrderedDict()
+    for site_category, category in SITE_CATEGORIES.items():
+        for page in range(1, benchmark.JOB_PAGES + 1):
+            tree = scraper.http_scraper.fetch_tree(scraper.RECRUIT_SEARCH_URL, {'category': site_category, 'page': page})
+            jobs = scraper.extract_from_tree(tree, 'job_list', scraper.RECRUIT_SEARCH_URL)["jobs"]
+            scraper._merge_job_postings(postings, category, jobs)
+    return list(postings.values())
+
+
+@pytest.fixture
+def index(scraper, postings):
+    # 처음 본 시각이 다르도록 두 번에 나눠서 색인 (recent 정렬 확인용)
+    half = len(postings) // 2
+    scraper.job_index.replace(postings[:half])
+    time.sleep(0.01)
+    scraper.job_index.upsert(postings[half:])
+    return scraper.job_index
+
+
+def _all_pages(index, limit, **kwargs):
+    jobs, cursor, pages = [], None, 0
+    while True:
+        result = index.search(limit=limit, cursor=cursor, **kwargs)
+        jobs.extend(result["jobs"])
+        pages += 1
+        cursor = result["next_cursor"]
+        if not cursor:
+            return jobs, result["total"], pages
+
+
+@pytest.mark.parametrize('sort', ['deadline', 'recent', 'company', 'title'])
+def test_cursor_pages_match_single_query(index, postings, sort):
+    expected = index.search(sort=sort, limit=len(postings))["jobs"]
+    jobs, total, pages = _all_pages(index, 7, sort=sort)
+    assert total == len(postings)
+    assert [job["job_id"] for job in jobs] == [job["job_id"] for job in expected]
+    assert pages == -(-len(postings) // 7)
+
+
+def test_cursor_pages_with_relevance_and_filters(index):
+    kwargs = {"keyword": '개발자', "filters": {"categories": ['bigdata_ai_jobs'], "career": ['경력']}, "sort": 'relevance' if index.fts else None}
+    expected = index.search(limit=1000, **kwargs)["jobs"]
+    jobs, total, _ = _all_pages(index, 5, **kwargs)
+    assert total == len(expected) > 5
+    assert [job["job_id"] for job in jobs] == [job["job_id"] for job in expected]
+    assert all('bigdata_ai_jobs' in job["categories"] for job in jobs)
+
+
+def test_sort_orders(index, postings):
+    deadlines = [job["deadline"] for job in index.search(sort='deadline', limit=len(postings))["jobs"]]
+    assert deadlines == sorted(deadlines)
+    companies = [job["company"] for job in index.search(sort='company', limit=len(postings))["jobs"]]
+    assert companies == sorted(companies)
+    # 나중에 색인한 공고가 먼저
+    recent = [job["job_id"] for job in index.search(sort='recent', limit=len(postings))["jobs"]]
+    later = {job["job_id"] for job in postings[len(postings) // 2:]}
+    assert set(recent[:len(later)]) == later
+
+
+def test_full_text_search_and_facets(index, postings):
+    result = index.search('카카오뱅크', facets=True, limit=1000)
+    assert result["total"] == sum(1 for job in postings if job["company"] == '카카오뱅크')
+    assert sum(result["facets"]["job_type"].values()) == result["total"]
+    assert set(result["facets"]["category"]) <= set(SITE_CATEGORIES.values())
+
+
+def test_cross_category_postings_counted_in_both(index, postings):
+    shared = [job for job in postings if len(job["categories"]) == 2]
+    assert shared
+    for category in SITE_CATEGORIES.values():
+        result = index.search(filters={"categories": [category]}, limit=1000)
+        assert {job["job_id"] for job in shared} <= {job["job_id"] for job in result["jobs"]}
+
+
+def test_replace_removes_missing_postings(index, postings):
+    assert index.replace(postings[:10]) == {"indexed": 10, "removed": len(postings) - 10}
+    assert index.search(limit=100)["total"] == 10
+
+
+def test_invalid_sort_and_cursor(index):
+    with pytest.raises(ValueError):
+        index.search(sort='popular')
+    with pytest.raises(ValueError):
+        index.search(cursor='broken')
+
+
+def test_jobs_endpoint(scraper, index, postings):
+    client = scraper.app.test_client()
+    first = client.get('/api/jobs', query_string={"limit": 50, "sort": 'title'}).get_json()
+    assert first["success"] and first["index"]["jobs"] == len(postings)
+    second = client.get('/api/jobs', query_string={"limit": 50, "sort": 'title', "cursor": first["next_cursor"]}).get_json()
+    assert not {job["job_id"] for job in first["jobs"]} & {job["job_id"] for job in second["jobs"]}
+    assert client.get('/api/jobs', query_string={"sort": 'popular'}).status_code == 400
+
+
+def test_jobs_endpoint_does_not_crawl_when_index_is_empty(scraper, monkeypatch):
+    def crawl():
+        raise AssertionError('요청 안에서 수집하면 안 됨')
+
+    monkeypatch.setattr(scraper.job_snapshot_scheduler, 'refresh', crawl)
+    body = scraper.app.test_client().get('/api/jobs').get_json()
+    assert body["success"] and body["jobs"] == [] and body["index"]["jobs"] == 0
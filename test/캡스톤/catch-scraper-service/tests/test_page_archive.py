@@ -0,0 +1,72 @@
+"""PageArchive 기록과 브라우저 없는 다시 추출"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import SERVICE_DIR
+
+
+@pytest.fixture
+def archive(scraper, tmp_path, monkeypatch):
+    """HTTP 경로로 기업 검색/상세/리뷰/공고 상세 페이지를 기록한 아카이브"""
+    archive = scraper.PageArchive(directory=str(tmp_path / 'archive'), recording=True)
+    monkeypatch.setattr(scraper, 'page_archive', archive)
+
+    company_url = scraper.http_scraper.find_company_url('카카오')
+    scraper.http_scraper.extract_company_detail(company_url, '카카오')
+    review_url = scraper._company_review_url(company_url)
+    for page, _, _ in scraper.http_scraper.iter_review_pages(review_url):
+        if page == 2:
+            break
+    scraper.fetch_job_detail(f"{scraper.BASE_URL}NCS/RecruitInfoDetails/500001")
+    return archive
+
+
+def test_records_the_url_that_was_fetched(archive, site):
+    entries = list(archive.iter_records())
+    assert [entry["page_type"] for entry in entries] == ['company_search', 'company_detail', 'company_reviews', 'company_reviews', 'job_detail']
+    assert '?keyword=' in entries[0]["url"]
+    assert entries[1]["url"] == f"{site}Comp/CompSummary/1001"
+    assert entries[3]["url"].endswith('?page=2')
+    assert all(entry["source"] == 'http' and entry["html"] for entry in entries)
+    assert archive.stats()["written"] == len(entries)
+
+
+def test_replay_matches_recorded_extraction(scraper, archive):
+    results = list(scraper.replay_page_archive(archive, workers=2, chunk_size=2))
+    assert len(results) == 5
+    assert not any(result["changed"] or result["empty"] or result["error"] for result in results)
+    # 링크는 기록할 때와 같은 기준 URL로 해석
+    search = next(result for result in results if result["page_type"] == 'company_search')
+    assert search["extracted"]["links"][0]["href"].startswith(scraper.BASE_URL)
+
+    summary = scraper.summarize_replay(results)
+    assert summary["company_reviews"] == {"pages": 2, "empty": 0, "changed": 0, "errors": 0}
+
+
+def test_replay_detects_broken_selector(scraper, archive, monkeypatch):
+    monkeypatch.setitem(scraper.EXTRACTION_SPECS['company_detail']['fields'], 'header_name', ("//div[@class='title']//h2", 'text', None))
+    monkeypatch.setitem(scraper.EXTRACTION_SPECS['company_detail']['fields'], 'industry', ("//span[@class='industry']", 'text', None))
+    summary = scraper.summarize_replay(scraper.replay_page_archive(archive, page_types=['company_detail'], workers=1))
+    assert summary == {"company_detail": {"pages": 1, "empty": 1, "changed": 1, "errors": 0}}
+
+
+def test_truncated_segment_is_read_up_to_the_cut(archive):
+    segment = archive.segments()[-1]
+    with open(segment, 'rb') as f:
+        data = f.read()
+    # 마지막 기록을 쓰다가 종료된 상황
+    with open(segment, 'wb') as f:
+        f.write(data[:-20])
+    assert len(list(archive.iter_records())) == 4
+
+
+def test_replay_cli_strict(archive):
+    completed = subprocess.run(
+        [sys.executable, os.path.join(SERVICE_DIR, 'replay_archive.py'), '--archive', archive.directory, '--strict', '--fail-on-change'],
+        capture_output=True, text=True, timeout=120
+    )
+    assert completed.returncode == 0, completed.stdout + completed.stderr
+    assert '5개 페이지 다시 추출' in completed.stdout
@@ -0,0 +1,118 @@
+"""직렬화 응답 캐시의 ETag/304 재검증과 압축"""
+import gzip
+from collections import OrderedDict
+
+import pytest
+
+import benchmark
+
+TIPS = ('/api/job-tips', {"company_name": '카카오'})
+
+
+@pytest.fixture
+def client(scraper):
+    return scraper.app.test_client()
+
+
+@pytest.fixture
+def snapshot(scraper, monkeypatch):
+    """대체 사이트 공고 목록으로 채운 새 스냅샷"""
+    snapshot = scraper.JobSnapshot()
+    monkeypatch.setattr(scraper, 'job_snapshot', snapshot)
+    postings = OrderedDict()
+    for site_category, category in {'it': 'it_jobs', 'bigdata': 'bigdata_ai_jobs'}.items():
+        tree = scraper.http_scraper.fetch_tree(scraper.RECRUIT_SEARCH_URL, {'category': site_category, 'page': 1})
+        scraper._merge_job_postings(postings, category, scraper.extract_from_tree(tree, 'job_list', scraper.RECRUIT_SEARCH_URL)["jobs"])
+    snapshot.replace(postings)
+    return snapshot
+
+
+def test_matching_etag_returns_304_without_body(scraper, client):
+    first = client.get(TIPS[0], query_string=TIPS[1])
+    assert first.status_code == 200 and first.get_json()["success"]
+    assert first.headers['Cache-Control'] == f"public, max-age={scraper.SERVE_PAYLOAD_MAX_AGE}"
+
+    second = client.get(TIPS[0], query_string=TIPS[1], headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 304
+    assert second.data == b''
+    assert second.headers['ETag'] == first.headers['ETag']
+
+
+def test_stale_etag_returns_full_body(client):
+    first = client.get(TIPS[0], query_string=TIPS[1])
+    second = client.get(TIPS[0], query_string=TIPS[1], headers={'If-None-Match': '"outdated"'})
+    assert second.status_code == 200
+    assert second.data == first.data
+
+
+def test_payload_is_serialized_once_per_key(scraper, client, monkeypatch):
+    built = []
+    get_job_tips = scraper.content_scraper.get_job_tips
+
+    def counting(company_name, job_position=None):
+        built.append(company_name)
+        return get_job_tips(company_name, job_position)
+
+    monkeypatch.setattr(scraper.content_scraper, 'get_job_tips', counting)
+    hits = scraper.payload_cache.hits
+    for _ in range(3):
+        client.get(TIPS[0], query_string=TIPS[1])
+    client.post(TIPS[0], json=TIPS[1])
+    client.get(TIPS[0], query_string={"company_name": '네이버'})
+    assert built == ['카카오', '네이버']
+    assert scraper.payload_cache.hits - hits == 3
+
+
+def test_gzip_body_matches_plain_body(client):
+    plain = client.get(TIPS[0], query_string=TIPS[1])
+    compressed = client.get(TIPS[0], query_string=TIPS[1], headers={'Accept-Encoding': 'gzip'})
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in compressed.headers['Vary']
+    assert gzip.decompress(compressed.data) == plain.data
+    # 압축 여부와 상관없이 같은 본문이므로 ETag도 같음
+    assert compressed.headers['ETag'] == plain.headers['ETag']
+
+
+def test_brotli_preferred_when_available(scraper, client):
+    if scraper.brotli is None:
+        pytest.skip('brotli 미설치')
+    plain = client.get(TIPS[0], query_string=TIPS[1])
+    compressed = client.get(TIPS[0], query_string=TIPS[1], headers={'Accept-Encoding': 'gzip, br'})
+    assert compressed.headers['Content-Encoding'] == 'br'
+    assert scraper.brotli.decompress(compressed.data) == plain.data
+
+
+def test_small_body_is_not_compressed(scraper, client, monkeypatch):
+    monkeypatch.setattr(scraper, 'SERVE_COMPRESS_MIN_BYTES', 1 << 20)
+    response = client.get(TIPS[0], query_string=TIPS[1], headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in response.headers
+    assert response.get_json()["success"]
+
+
+def test_homepage_jobs_snapshot_revalidates_by_version(scraper, client, snapshot):
+    first = client.get('/api/homepage-jobs')
+    body = first.get_json()
+    assert first.status_code == 200 and body["success"]
+    assert first.headers['Cache-Control'] == 'no-cache'
+    assert body["version"] == snapshot.version
+    assert len(body["jobs"]) == len(snapshot.postings)
+
+    etag = first.headers['ETag']
+    assert client.get('/api/homepage-jobs', headers={'If-None-Match': etag}).status_code == 304
+
+    # 카테고리 선택이 다르면 다른 본문
+    it_only = client.get('/api/homepage-jobs', query_string={"categories": 'it_jobs'}, headers={'If-None-Match': etag})
+    assert it_only.status_code == 200
+
+    # 새 수집 결과가 들어오면 같은 ETag로도 새 본문을 받음
+    snapshot.replace(dict(list(snapshot.postings.items())[:benchmark.JOBS_PER_PAGE // 2]))
+    refreshed = client.get('/api/homepage-jobs', headers={'If-None-Match': etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers['ETag'] != etag
+    assert refreshed.get_json()["version"] == snapshot.version
+
+
+def test_not_modified_responses_are_counted(scraper, client):
+    etag = client.get(TIPS[0], query_string=TIPS[1]).headers['ETag']
+    client.get(TIPS[0], query_string=TIPS[1], headers={'If-None-Match': etag})
+    assert 'catch_response_not_modified_total{endpoint="get_job_tips"}' in scraper.metrics.render()
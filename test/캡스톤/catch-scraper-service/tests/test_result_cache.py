@@ -0,0 +1,82 @@
+"""ResultCache TTL/LRU/stale-while-revalidate"""
+import threading
+import time
+
+
+def _wait_for(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_fresh_then_stale_then_expired(scraper):
+    cache = scraper.ResultCache(ttl=0.1, stale_ttl=0.3, max_entries=10)
+    cache.set('a', 1)
+    assert cache.get('a') == (1, 'fresh')
+    time.sleep(0.15)
+    assert cache.get('a') == (1, 'stale')
+    time.sleep(0.2)
+    assert cache.get('a') == (None, None)
+
+
+def test_lru_evicts_least_recently_used(scraper):
+    cache = scraper.ResultCache(ttl=60, stale_ttl=60, max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+    assert cache.get('b') == (None, None)
+    assert cache.get('a') == (1, 'fresh')
+    assert cache.get('c') == (3, 'fresh')
+
+
+def test_short_ttl_values_are_not_served_stale(scraper):
+    cache = scraper.ResultCache(ttl=60, stale_ttl=600, max_entries=10, ttl_for=lambda value: 0.05 if value.get("is_sample") else 60)
+    cache.set('sample', {"is_sample": True})
+    time.sleep(0.1)
+    assert cache.get('sample') == (None, None)
+
+
+def test_stale_value_returned_while_single_refresh_runs(scraper):
+    cache = scraper.ResultCache(ttl=0.05, stale_ttl=60, max_entries=10)
+    cache.set('a', 'old')
+    time.sleep(0.1)
+
+    calls = []
+    release = threading.Event()
+
+    def loader():
+        calls.append(1)
+        release.wait(2)
+        return 'new'
+
+    # 갱신이 끝나기 전에는 몇 번을 조회해도 이전 값을 바로 받고 갱신은 한 번만 실행
+    assert [cache.get_or_load('a', loader) for _ in range(5)] == ['old'] * 5
+    release.set()
+    assert _wait_for(lambda: cache.get('a') == ('new', 'fresh'))
+    assert len(calls) == 1
+    assert cache.stale_hits == 5
+
+
+def test_failed_refresh_keeps_stale_value(scraper):
+    cache = scraper.ResultCache(ttl=0.05, stale_ttl=60, max_entries=10)
+    cache.set('a', 'old')
+    time.sleep(0.1)
+
+    def loader():
+        raise RuntimeError('site down')
+
+    assert cache.get_or_load('a', loader) == 'old'
+    assert _wait_for(lambda: 'a' not in cache._refreshing)
+    assert cache.get('a') == ('old', 'stale')
+
+
+def test_company_lookup_is_cached(scraper):
+    first = scraper.get_company_info('카카오')
+    assert first["success"] and not first.get("is_sample")
+    misses = scraper.company_cache.misses
+
+    # 표기만 다른 같은 기업명도 같은 캐시 항목을 사용
+    assert scraper.get_company_info('(주)카카오') == first
+    assert scraper.company_cache.misses == misses
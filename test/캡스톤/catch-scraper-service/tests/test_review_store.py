@@ -0,0 +1,66 @@
+"""기업 리뷰 증분 수집 (워터마크 중단/이어 읽기)과 ReviewStore 커서"""
+import benchmark
+
+TOTAL_REVIEWS = benchmark.REVIEW_PAGES * benchmark.REVIEWS_PER_PAGE
+
+
+def test_first_crawl_reads_every_page(scraper):
+    result = scraper.refresh_company_reviews('카카오')
+    assert result["success"]
+    assert (result["added"], result["pages"], result["complete"]) == (TOTAL_REVIEWS, benchmark.REVIEW_PAGES, True)
+    assert result["watermark"]["review_count"] == TOTAL_REVIEWS
+
+
+def test_recrawl_stops_at_watermark(scraper):
+    scraper.refresh_company_reviews('카카오')
+    result = scraper.refresh_company_reviews('카카오')
+    # 첫 페이지에서 이미 저장된 리뷰를 만나면 더 넘기지 않음
+    assert (result["added"], result["pages"], result["complete"]) == (0, 1, True)
+
+
+def test_recrawl_reads_only_new_reviews(scraper, monkeypatch):
+    scraper.refresh_company_reviews('카카오')
+    newest = scraper.review_store.watermark('카카오')["newest_review_id"]
+
+    # 사이트에 새 리뷰 한 페이지 분량이 올라온 상태
+    monkeypatch.setattr(benchmark, 'REVIEW_PAGES', benchmark.REVIEW_PAGES + 1)
+    result = scraper.refresh_company_reviews('카카오')
+    assert (result["added"], result["pages"]) == (benchmark.REVIEWS_PER_PAGE, 2)
+    assert result["watermark"]["newest_review_id"] > newest
+    assert result["watermark"]["review_count"] == TOTAL_REVIEWS + benchmark.REVIEWS_PER_PAGE
+
+
+def test_page_limit_leaves_backfill_then_resumes(scraper):
+    first = scraper.refresh_company_reviews('네이버', max_pages=3)
+    assert (first["added"], first["pages"], first["complete"]) == (3 * benchmark.REVIEWS_PER_PAGE, 3, False)
+    assert first["watermark"]["backfill_page"] == 4
+
+    # 첫 페이지는 워터마크에서 멈추고, 남은 한도로 멈췄던 페이지부터 끝까지 이어서 읽음
+    second = scraper.refresh_company_reviews('네이버', max_pages=20)
+    assert second["added"] == TOTAL_REVIEWS - 3 * benchmark.REVIEWS_PER_PAGE
+    assert second["pages"] == 1 + benchmark.REVIEW_PAGES - 3
+    assert second["complete"] and second["watermark"]["backfill_page"] is None
+
+
+def test_cursor_pages_cover_store_in_order(scraper):
+    scraper.refresh_company_reviews('카카오')
+    seen = []
+    cursor = None
+    while True:
+        reviews, cursor = scraper.review_store.page('카카오', 30, cursor)
+        seen.extend(reviews)
+        if not cursor:
+            break
+    assert len(seen) == TOTAL_REVIEWS
+    assert len({review["review_id"] for review in seen}) == TOTAL_REVIEWS
+    keys = [(review["review_date"], review["review_id"]) for review in seen]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_reviews_endpoint_pages_with_cursor(scraper):
+    client = scraper.app.test_client()
+    first = client.get('/api/company-reviews', query_string={"company_name": '카카오', "refresh": '1', "limit": 40}).get_json()
+    assert first["success"] and len(first["reviews"]) == 40 and first["next_cursor"]
+    second = client.get('/api/company-reviews', query_string={"company_name": '카카오', "limit": 40, "cursor": first["next_cursor"]}).get_json()
+    assert not {review["review_id"] for review in first["reviews"]} & {review["review_id"] for review in second["reviews"]}
+    assert client.get('/api/company-reviews', query_string={"company_name": '카카오', "cursor": 'broken'}).status_code == 400
@@ -0,0 +1,81 @@
+"""SingleFlight 요청 합치기와 일괄 기업 조회"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+
+def _run_concurrently(flight, key, func, callers):
+    """callers개 스레드가 거의 동시에 같은 키로 호출 (첫 호출이 진행 중일 때 나머지가 들어오도록)"""
+    started = threading.Event()
+
+    def leader_func():
+        started.set()
+        return func()
+
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        leader = executor.submit(flight.do, key, leader_func)
+        started.wait(2)
+        followers = [executor.submit(flight.do, key, func) for _ in range(callers - 1)]
+        return [leader] + followers
+
+
+def test_concurrent_calls_share_one_execution(scraper):
+    flight = scraper.SingleFlight()
+    calls = []
+
+    def work():
+        calls.append(1)
+        time.sleep(0.2)
+        return 'result'
+
+    futures = _run_concurrently(flight, 'key', work, 5)
+    assert [future.result() for future in futures] == ['result'] * 5
+    assert len(calls) == 1
+    assert flight.shared == 4
+    assert flight.in_flight() == 0
+
+
+def test_error_is_shared_and_next_call_runs_again(scraper):
+    flight = scraper.SingleFlight()
+
+    def fail():
+        time.sleep(0.2)
+        raise RuntimeError('boom')
+
+    for future in _run_concurrently(flight, 'key', fail, 3):
+        with pytest.raises(RuntimeError, match='boom'):
+            future.result()
+    # 실패한 호출은 남지 않으므로 다음 호출은 새로 실행
+    assert flight.do('key', lambda: 'ok') == 'ok'
+
+
+def test_different_keys_run_independently(scraper):
+    flight = scraper.SingleFlight()
+    assert flight.do('a', lambda: 1) == 1
+    assert flight.do('b', lambda: 2) == 2
+    assert flight.shared == 0
+
+
+def test_batch_lookup_keeps_order_and_coalesces_same_company(scraper, monkeypatch):
+    scraped = []
+    scrape = scraper._scrape_company_info
+
+    def counting_scrape(company_name):
+        scraped.append(scraper._normalize_company_name(company_name))
+        time.sleep(0.1)
+        return scrape(company_name)
+
+    monkeypatch.setattr(scraper, '_scrape_company_info', counting_scrape)
+    response = scraper.app.test_client().post('/api/search-company-info/batch', json={
+        "company_names": ['카카오', '네이버', '(주)카카오', '없는기업']
+    })
+    body = response.get_json()
+    assert body["success"]
+    assert [result["company_name"] for result in body["results"]] == ['카카오', '네이버', '(주)카카오', '없는기업']
+    assert body["results"][0]["company_detail"] == body["results"][2]["company_detail"]
+    assert not body["results"][1].get("is_sample")
+    assert body["results"][3].get("is_sample")
+    # 같은 기업(카카오/(주)카카오)은 동시에 요청되어도 한 번만 스크래핑
+    assert sorted(scraped) == sorted(['카카오', '네이버', '없는기업'])